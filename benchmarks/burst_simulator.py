@@ -0,0 +1,434 @@
+"""Replay bursty push-to-talk traffic without a microphone or keyboard.
+
+Drives :class:`HotKeyActions` ``on_press``/``on_release`` at a configurable
+arrival rate, records with a fake :class:`AudioRecorder` that emits fixture
+files, and transcribes with either a stub :class:`AITranscriber` (configurable
+latency distribution) or a real cached Whisper model. Reports queueing delay,
+end-to-end latency percentiles and dropped or out-of-order results so the
+executor and queue behaviour can be sized.
+
+Usage:
+    python -m benchmarks.burst_simulator --rate 2 --count 50 --latency lognormal:-0.7,0.5
+    python -m benchmarks.burst_simulator --rate 0.5 --hold uniform:1,4 --workers 1 --model base.en
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.fixtures import DEFAULT_FIXTURES, ensure_fixtures
+from benchmarks.stats import summarize
+from src.audio.audio_recorder import AudioRecorder
+from src.audio.audio_validator import AudioValidatorImpl
+from src.core.hot_key.hotkey_actions import HotKeyActions
+from src.core.transcription.ai_transcriber import AITranscriber, AITranscriberImpl
+from src.core.transcription.background_transcription_orchestrator import (
+    BackgroundTranscriptionOrchestratorImpl,
+)
+
+SIMULATION_FIXTURES = ("1s", "5s", "30s")
+# Median ~0.5 s with a long right tail, roughly base.en on a laptop CPU.
+DEFAULT_STUB_LATENCY = "lognormal:-0.7,0.5"
+
+
+def parse_distribution(spec: str, rng: random.Random) -> Callable[[], float]:
+    """Build a sampler from ``kind:params``.
+
+    Supported kinds (all values in seconds):
+        * ``constant:x``
+        * ``uniform:low,high``
+        * ``exp:mean``
+        * ``lognormal:mu,sigma`` (parameters of the underlying normal)
+
+    Raises:
+        ValueError: If the spec is malformed or the kind is unknown.
+    """
+    kind, _, raw_params = spec.partition(":")
+    try:
+        params = [float(value) for value in raw_params.split(",") if value]
+    except ValueError as exc:
+        raise ValueError(f"Invalid distribution parameters in '{spec}'") from exc
+
+    kind = kind.strip().lower()
+    if kind == "constant" and len(params) == 1:
+        return lambda: params[0]
+    if kind == "uniform" and len(params) == 2:
+        return lambda: rng.uniform(params[0], params[1])
+    if kind == "exp" and len(params) == 1 and params[0] > 0:
+        return lambda: rng.expovariate(1.0 / params[0])
+    if kind == "lognormal" and len(params) == 2:
+        return lambda: rng.lognormvariate(params[0], params[1])
+    raise ValueError(f"Unsupported distribution '{spec}'")
+
+
+@dataclass
+class ClipTrace:
+    """Timestamps (``time.perf_counter``) for one simulated dictation."""
+
+    sequence: int
+    hold_seconds: float
+    pressed_at: float
+    released_at: Optional[float] = None
+    submitted_at: Optional[float] = None
+    started_at: Optional[float] = None
+    delivered_at: Optional[float] = None
+    delivery_index: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class SimulationLedger:
+    """Thread-safe record of every clip's lifecycle."""
+
+    traces: Dict[int, ClipTrace] = field(default_factory=dict)
+    delivery_order: List[int] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def update(self, sequence: int, **values: Any) -> None:
+        with self.lock:
+            trace = self.traces.get(sequence)
+            if trace is None:
+                return
+            for key, value in values.items():
+                setattr(trace, key, value)
+
+    def record_delivery(self, sequence: int, error: Optional[str] = None) -> None:
+        with self.lock:
+            trace = self.traces.get(sequence)
+            if trace is None:
+                return
+            trace.delivered_at = time.perf_counter()
+            trace.delivery_index = len(self.delivery_order)
+            trace.error = error
+            self.delivery_order.append(sequence)
+
+
+class FakeAudioRecorder(AudioRecorder):
+    """AudioRecorder that "records" by copying the fixture closest to the hold time.
+
+    Each clip is copied to a uniquely named temporary file whose name encodes
+    the clip sequence number, so downstream stubs can correlate results.
+    """
+
+    def __init__(
+        self,
+        fixtures: Dict[str, Path],
+        output_dir: Path,
+        ledger: SimulationLedger,
+    ) -> None:
+        self._fixtures = sorted(
+            ((DEFAULT_FIXTURES[name], path) for name, path in fixtures.items()),
+            key=lambda item: item[0],
+        )
+        self._output_dir = output_dir
+        self._ledger = ledger
+        self._current_sequence: Optional[int] = None
+        self._hold_seconds = 0.0
+
+    def arm(self, sequence: int, hold_seconds: float) -> None:
+        """Tell the recorder which clip the next start/stop pair belongs to."""
+        self._current_sequence = sequence
+        self._hold_seconds = hold_seconds
+
+    def start(self) -> None:
+        return None
+
+    def stop(self) -> Optional[Path]:
+        sequence = self._current_sequence
+        if sequence is None:
+            return None
+        fixture = self._fixture_for(self._hold_seconds)
+        clip_path = self._output_dir / f"{sequence:06d}-{fixture.name}"
+        shutil.copyfile(fixture, clip_path)
+        self._ledger.update(sequence, submitted_at=time.perf_counter())
+        self._current_sequence = None
+        return clip_path
+
+    def discard(self) -> None:
+        self._current_sequence = None
+
+    def _fixture_for(self, hold_seconds: float) -> Path:
+        for duration, path in self._fixtures:
+            if duration >= hold_seconds:
+                return path
+        return self._fixtures[-1][1]
+
+
+class StubAITranscriber(AITranscriber):
+    """AITranscriber that sleeps for a sampled latency instead of running Whisper."""
+
+    def __init__(self, latency_sampler: Callable[[], float]) -> None:
+        self._latency_sampler = latency_sampler
+        self._sampler_lock = threading.Lock()
+
+    def load(self) -> None:
+        return None
+
+    def transcribe(self, audio: Path) -> Dict[str, Any]:
+        with self._sampler_lock:
+            latency = max(0.0, self._latency_sampler())
+        time.sleep(latency)
+        return {"text": f"clip {_sequence_from_path(audio)}"}
+
+    def teardown(self) -> None:
+        return None
+
+
+class _TracingValidator(AudioValidatorImpl):
+    """Marks when a worker picks the clip up, i.e. the end of queueing."""
+
+    def __init__(self, ledger: SimulationLedger, current: threading.local) -> None:
+        self._ledger = ledger
+        self._current = current
+
+    def validate(self, path: Path) -> bool:
+        sequence = _sequence_from_path(path)
+        self._current.sequence = sequence
+        self._ledger.update(sequence, started_at=time.perf_counter())
+        return super().validate(path)
+
+
+class _TracingResultHandler:
+    """Result sink that records delivery order instead of pasting."""
+
+    def __init__(self, ledger: SimulationLedger, current: threading.local) -> None:
+        self._ledger = ledger
+        self._current = current
+
+    def handle_success(self, text: str) -> None:
+        self._ledger.record_delivery(self._current.sequence)
+
+    def handle_error(self, exc: Exception) -> None:
+        sequence = getattr(self._current, "sequence", None)
+        if sequence is not None:
+            self._ledger.record_delivery(sequence, error=f"{type(exc).__name__}: {exc}")
+
+
+class _QuietCleanupService:
+    """Delete simulated clips without per-file logging."""
+
+    def delete_file(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+
+def _sequence_from_path(path: Path) -> int:
+    return int(path.name.split("-", 1)[0])
+
+
+def run_simulation(
+    count: int,
+    rate: float,
+    hold_spec: str,
+    latency_spec: Optional[str],
+    model_name: Optional[str],
+    workers: int,
+    drain_timeout: float,
+    seed: int,
+) -> Dict[str, Any]:
+    """Replay ``count`` press/release cycles and return the simulation report."""
+    rng = random.Random(seed)
+    sample_hold = parse_distribution(hold_spec, rng)
+    ledger = SimulationLedger()
+    current = threading.local()
+
+    if model_name is not None:
+        transcriber: AITranscriber = AITranscriberImpl(model_name=model_name)
+        transcriber.load()
+    else:
+        transcriber = StubAITranscriber(
+            parse_distribution(
+                latency_spec or DEFAULT_STUB_LATENCY, random.Random(seed + 1)
+            )
+        )
+
+    fixtures = ensure_fixtures(SIMULATION_FIXTURES)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sim-worker")
+    with tempfile.TemporaryDirectory(prefix="sona-sim-") as temp_dir:
+        recorder = FakeAudioRecorder(fixtures, Path(temp_dir), ledger)
+        orchestrator = BackgroundTranscriptionOrchestratorImpl(
+            _TracingValidator(ledger, current),
+            transcriber,
+            _QuietCleanupService(),
+            _TracingResultHandler(ledger, current),
+            executor=executor,
+        )
+        actions = HotKeyActions(recorder=recorder, orchestrator=orchestrator)
+
+        started_at = time.perf_counter()
+        next_arrival = started_at
+        press_lateness: List[float] = []
+        for sequence in range(count):
+            next_arrival += rng.expovariate(rate)
+            hold_seconds = max(0.05, sample_hold())
+            # A single keyboard cannot press again while the key is still held,
+            # so arrivals during a hold are served late; that lateness is reported.
+            _sleep_until(next_arrival)
+            pressed_at = time.perf_counter()
+            press_lateness.append(max(0.0, pressed_at - next_arrival))
+            with ledger.lock:
+                ledger.traces[sequence] = ClipTrace(sequence, hold_seconds, pressed_at)
+            recorder.arm(sequence, hold_seconds)
+            actions.on_press()
+            time.sleep(hold_seconds)
+            ledger.update(sequence, released_at=time.perf_counter())
+            actions.on_release()
+
+        traffic_seconds = time.perf_counter() - started_at
+        _drain(ledger, count, drain_timeout)
+        # Anything still queued after the drain window counts as dropped.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return _build_report(
+        ledger,
+        press_lateness,
+        traffic_seconds,
+        {
+            "count": count,
+            "rate_per_second": rate,
+            "hold": hold_spec,
+            "latency": None if model_name else (latency_spec or DEFAULT_STUB_LATENCY),
+            "model": model_name,
+            "workers": workers,
+            "seed": seed,
+        },
+    )
+
+
+def _drain(ledger: SimulationLedger, count: int, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        with ledger.lock:
+            if len(ledger.delivery_order) >= count:
+                return
+        time.sleep(0.05)
+
+
+def _sleep_until(deadline: float) -> None:
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _build_report(
+    ledger: SimulationLedger,
+    press_lateness: List[float],
+    traffic_seconds: float,
+    settings: Dict[str, Any],
+) -> Dict[str, Any]:
+    with ledger.lock:
+        traces = sorted(ledger.traces.values(), key=lambda trace: trace.sequence)
+        delivery_order = list(ledger.delivery_order)
+
+    queueing_delay = [
+        trace.started_at - trace.submitted_at
+        for trace in traces
+        if trace.started_at is not None and trace.submitted_at is not None
+    ]
+    end_to_end = [
+        trace.delivered_at - trace.released_at
+        for trace in traces
+        if trace.delivered_at is not None
+        and trace.released_at is not None
+        and trace.error is None
+    ]
+    dropped = [trace.sequence for trace in traces if trace.delivered_at is None]
+    failed = [trace.sequence for trace in traces if trace.error is not None]
+
+    # A delivery is out of order when a later clip was delivered before it.
+    out_of_order = 0
+    highest_delivered = -1
+    for sequence in delivery_order:
+        if sequence < highest_delivered:
+            out_of_order += 1
+        highest_delivered = max(highest_delivered, sequence)
+
+    return {
+        "settings": settings,
+        "traffic_seconds": traffic_seconds,
+        "submitted": sum(1 for trace in traces if trace.submitted_at is not None),
+        "delivered": len(delivery_order) - len(failed),
+        "failed": len(failed),
+        "dropped": len(dropped),
+        "dropped_sequences": dropped,
+        "out_of_order": out_of_order,
+        "press_lateness_seconds": summarize(press_lateness),
+        "queueing_delay_seconds": summarize(queueing_delay),
+        "end_to_end_seconds": summarize(end_to_end),
+        "throughput_per_second": (
+            len(delivery_order) / traffic_seconds if traffic_seconds > 0 else math.nan
+        ),
+    }
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=30, help="Number of dictations.")
+    parser.add_argument(
+        "--rate", type=float, default=1.0, help="Mean hotkey presses per second (Poisson)."
+    )
+    parser.add_argument(
+        "--hold",
+        default="uniform:0.5,3",
+        help="Hold-duration distribution, e.g. uniform:0.5,3 or exp:2.",
+    )
+    parser.add_argument(
+        "--latency",
+        help=f"Stub transcriber latency distribution (default {DEFAULT_STUB_LATENCY}).",
+    )
+    parser.add_argument(
+        "--model", help="Use a real cached Whisper model instead of the stub transcriber."
+    )
+    parser.add_argument("--workers", type=int, default=3, help="Executor pool size.")
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=120.0,
+        help="Seconds to wait for outstanding results after the last release.",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="Write the report JSON to this file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.rate <= 0 or args.count <= 0 or args.workers <= 0:
+        print("[SIM] --rate, --count and --workers must be positive.", file=sys.stderr)
+        return 2
+    try:
+        report = run_simulation(
+            count=args.count,
+            rate=args.rate,
+            hold_spec=args.hold,
+            latency_spec=args.latency,
+            model_name=args.model,
+            workers=args.workers,
+            drain_timeout=args.drain_timeout,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        print(f"[SIM] {exc}", file=sys.stderr)
+        return 2
+
+    payload = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""Exercise the resumable model downloader against a local stand-in server.
+
+Serves a random payload from a ``ThreadingHTTPServer`` that speaks ``HEAD``
+and single ``Range`` requests, optionally caps its bandwidth and drops the
+connection after a number of bytes. The scenario interrupts a first fetch,
+resumes it, verifies the SHA-256 and reports throughput, so resume,
+segmenting and throttling can be checked without touching the real CDN.
+
+Usage:
+    python -m benchmarks.download_standin --size-mb 64 --segments 4
+    python -m benchmarks.download_standin --size-mb 32 --drop-after-mb 10 --limit-kbps 8192
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from src.core.transcription.model_downloader import (
+    DownloadError,
+    ResumableDownloader,
+)
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d+)-(\d*)$")
+
+
+class StandInServer:
+    """Serve one payload at ``/<sha256>/<filename>`` with Range support."""
+
+    WRITE_CHUNK_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        payload: bytes,
+        filename: str = "standin.pt",
+        bytes_per_second: Optional[float] = None,
+        drop_after_bytes: Optional[int] = None,
+    ) -> None:
+        self.payload = payload
+        self.sha256 = hashlib.sha256(payload).hexdigest()
+        self.path = f"/{self.sha256}/{filename}"
+        self.bytes_per_second = bytes_per_second
+        # Drop the first response that crosses this many bytes served, once.
+        self.drop_after_bytes = drop_after_bytes
+        self.bytes_served = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        return self.base_url + self.path
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _should_drop(self, amount: int) -> bool:
+        with self._lock:
+            self.bytes_served += amount
+            if self.drop_after_bytes is not None and self.bytes_served >= self.drop_after_bytes:
+                self.drop_after_bytes = None
+                return True
+            return False
+
+    def _handler_class(self) -> type:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_HEAD(self) -> None:
+                self._respond(send_body=False)
+
+            def do_GET(self) -> None:
+                self._respond(send_body=True)
+
+            def _respond(self, send_body: bool) -> None:
+                with stand_in._lock:
+                    stand_in.requests += 1
+                if self.path != stand_in.path:
+                    self.send_error(404)
+                    return
+                size = len(stand_in.payload)
+                start, end = 0, size - 1
+                match = _RANGE_PATTERN.match(self.headers.get("Range", ""))
+                if match:
+                    start = int(match.group(1))
+                    end = min(int(match.group(2) or size - 1), size - 1)
+                    if start >= size:
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{size}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                else:
+                    self.send_response(200)
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(end - start + 1))
+                self.end_headers()
+                if send_body:
+                    self._send_body(start, end + 1)
+
+            def _send_body(self, start: int, stop: int) -> None:
+                position = start
+                started_at = time.perf_counter()
+                while position < stop:
+                    chunk = stand_in.payload[
+                        position : min(stop, position + stand_in.WRITE_CHUNK_BYTES)
+                    ]
+                    try:
+                        self.wfile.write(chunk)
+                    except OSError:
+                        return
+                    position += len(chunk)
+                    if stand_in._should_drop(len(chunk)):
+                        self.close_connection = True
+                        self.connection.close()
+                        return
+                    if stand_in.bytes_per_second:
+                        expected = (position - start) / stand_in.bytes_per_second
+                        delay = expected - (time.perf_counter() - started_at)
+                        if delay > 0:
+                            time.sleep(delay)
+
+        return Handler
+
+
+def run_scenario(
+    size_bytes: int,
+    segments: int,
+    limit_bytes_per_second: Optional[float],
+    drop_after_bytes: Optional[int],
+    server_bytes_per_second: Optional[float],
+) -> Dict[str, Any]:
+    payload = os.urandom(size_bytes)
+    with StandInServer(
+        payload,
+        bytes_per_second=server_bytes_per_second,
+        drop_after_bytes=drop_after_bytes,
+    ) as server, tempfile.TemporaryDirectory(prefix="sona-download-") as temp_dir:
+        destination = Path(temp_dir) / "standin.pt"
+        downloader = ResumableDownloader(
+            base_url=server.base_url,
+            cache_dir=Path(temp_dir),
+            segments=segments,
+            max_bytes_per_second=limit_bytes_per_second,
+        )
+        # The downloader retries internally; with RETRIES=0 the first attempt
+        # surfaces the dropped connection and the second call must resume.
+        downloader.RETRIES = 0
+        progress_calls = 0
+        last_downloaded = 0
+
+        def on_progress(downloaded: int, total: Optional[int]) -> None:
+            nonlocal progress_calls, last_downloaded
+            progress_calls += 1
+            last_downloaded = downloaded
+
+        attempts = 0
+        interrupted_at: Optional[int] = None
+        started_at = time.perf_counter()
+        while True:
+            attempts += 1
+            try:
+                downloader.fetch(server.url, destination, server.sha256, on_progress)
+                break
+            except DownloadError:
+                if attempts >= 5:
+                    raise
+                if interrupted_at is None:
+                    interrupted_at = last_downloaded
+        elapsed = time.perf_counter() - started_at
+
+        intact = hashlib.sha256(destination.read_bytes()).hexdigest() == server.sha256
+        return {
+            "size_bytes": size_bytes,
+            "segments": segments,
+            "attempts": attempts,
+            "interrupted_at_bytes": interrupted_at,
+            "bytes_served": server.bytes_served,
+            "redundant_bytes": server.bytes_served - size_bytes,
+            "requests": server.requests,
+            "progress_callbacks": progress_calls,
+            "elapsed_seconds": elapsed,
+            "throughput_mb_per_second": size_bytes / elapsed / (1024 * 1024),
+            "checksum_ok": intact,
+        }
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=32)
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument(
+        "--limit-kbps", type=int, default=0, help="Client-side throttle (0 = off)."
+    )
+    parser.add_argument(
+        "--server-kbps", type=int, default=0, help="Server-side bandwidth (0 = unlimited)."
+    )
+    parser.add_argument(
+        "--drop-after-mb",
+        type=float,
+        default=None,
+        help="Drop the connection once after this much data (default: half the payload).",
+    )
+    parser.add_argument("--output", type=Path, help="Write the report JSON to this file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    size_bytes = int(args.size_mb * 1024 * 1024)
+    drop_after = (
+        int(args.drop_after_mb * 1024 * 1024)
+        if args.drop_after_mb is not None
+        else size_bytes // 2
+    )
+    report = run_scenario(
+        size_bytes,
+        args.segments,
+        args.limit_kbps * 1024 or None,
+        drop_after or None,
+        args.server_kbps * 1024 or None,
+    )
+
+    payload = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0 if report["checksum_ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
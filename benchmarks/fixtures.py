@@ -0,0 +1,86 @@
+"""Deterministic WAV fixtures for benchmarks.
+
+Fixtures are synthesized on first use instead of being checked in, so the
+repository stays small while every machine benchmarks byte-identical audio.
+The signal is a seeded mix of voiced-like harmonics, syllable-rate amplitude
+modulation and low-level noise in the recorder's format (16 kHz, mono,
+16-bit PCM).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import wave
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable
+
+SAMPLE_RATE = 16_000
+FIXTURE_SEED = 20240601
+FIXTURE_DIR: Path = Path(__file__).resolve().parent / ".fixtures"
+
+# Fixture name -> duration in seconds.
+DEFAULT_FIXTURES: Dict[str, float] = {
+    "1s": 1.0,
+    "5s": 5.0,
+    "30s": 30.0,
+    "5min": 300.0,
+}
+
+
+def synthesize_pcm(duration_seconds: float, seed: int = FIXTURE_SEED) -> array:
+    """Return 16-bit mono PCM samples for a speech-like synthetic signal."""
+    rng = random.Random(seed)
+    total_samples = int(duration_seconds * SAMPLE_RATE)
+    samples = array("h")
+
+    # Change pitch every ~250 ms to mimic syllables.
+    segment_length = SAMPLE_RATE // 4
+    two_pi = 2.0 * math.pi
+    for segment_start in range(0, total_samples, segment_length):
+        fundamental = rng.uniform(90.0, 220.0)
+        voiced = rng.random() > 0.2
+        segment_end = min(segment_start + segment_length, total_samples)
+        for index in range(segment_start, segment_end):
+            t = index / SAMPLE_RATE
+            envelope = 0.5 - 0.5 * math.cos(two_pi * (index - segment_start) / segment_length)
+            value = rng.gauss(0.0, 0.02)
+            if voiced:
+                value += envelope * (
+                    0.45 * math.sin(two_pi * fundamental * t)
+                    + 0.25 * math.sin(two_pi * 2 * fundamental * t)
+                    + 0.12 * math.sin(two_pi * 3 * fundamental * t)
+                )
+            samples.append(max(-32767, min(32767, int(value * 32767 * 0.6))))
+    return samples
+
+
+def write_wav(path: Path, samples: array) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with wave.open(str(temp_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(samples.tobytes())
+    temp_path.replace(path)
+    return path
+
+
+def ensure_fixtures(
+    names: Iterable[str] | None = None, fixture_dir: Path = FIXTURE_DIR
+) -> Dict[str, Path]:
+    """Synthesize (once) and return the requested fixtures by name."""
+    selected = list(names) if names is not None else list(DEFAULT_FIXTURES)
+    fixtures: Dict[str, Path] = {}
+    for name in selected:
+        if name not in DEFAULT_FIXTURES:
+            raise ValueError(
+                f"Unknown fixture '{name}'; expected one of {', '.join(DEFAULT_FIXTURES)}"
+            )
+        path = fixture_dir / f"speechlike-{name}.wav"
+        if not path.exists():
+            write_wav(path, synthesize_pcm(DEFAULT_FIXTURES[name]))
+        fixtures[name] = path
+    return fixtures
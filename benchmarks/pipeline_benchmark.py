@@ -0,0 +1,482 @@
+"""Benchmark the record -> transcribe -> deliver pipeline.
+
+Drives :class:`BackgroundTranscriptionOrchestratorImpl` with synthesized WAV
+fixtures and instrumented pipeline components, for every Whisper model in
+``MODELS_INFO`` that is already present in the local cache. Delivery goes
+through the real result handler; by default its clipboard/paste backend is the
+in-memory fake, ``--output-backend native`` measures the platform backend
+(which pastes into the focused window). Reports per-stage latency, real-time
+factor, model load time and memory as JSON, and can flag regressions against a
+stored baseline.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark --output bench.json
+    python -m benchmarks.pipeline_benchmark --models base.en --fixtures 1s 5s
+    python -m benchmarks.pipeline_benchmark --compare baseline.json --tolerance 0.15
+    python -m benchmarks.pipeline_benchmark --models base.en --output-backend native
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from threading import Event
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.fixtures import DEFAULT_FIXTURES, ensure_fixtures
+from benchmarks.stats import summarize
+from src.audio.audio_duration import read_audio_duration_seconds
+from src.audio.audio_validator import AudioValidatorImpl
+from src.core.transcription.ai_transcriber import AITranscriber, AITranscriberImpl
+from src.core.transcription.background_transcription_orchestrator import (
+    BackgroundTranscriptionOrchestratorImpl,
+)
+from src.core.transcription.device.device_manager import DeviceManager
+from src.core.transcription.output.fake_output_backend import FakeOutputBackend
+from src.core.transcription.output.output_backend import OutputBackend
+from src.core.transcription.output.output_backend_factory import create_output_backend
+from src.core.transcription.transcription_result_handler import (
+    TranscriptionResultHandlerImpl,
+)
+from src.server.models.repository.model_constants import MODELS_INFO
+from src.server.models.repository.model_repository import ModelRepositoryImpl
+from src.utils.process_memory import current_rss_bytes
+
+PIPELINE_STAGES = (
+    "queue",
+    "validate",
+    "transcribe",
+    "deliver",
+    "copy",
+    "paste",
+    "end_to_end",
+)
+OUTPUT_BACKENDS = ("fake", "native")
+
+# Metrics checked in comparison mode; for all of them higher is worse.
+MODEL_LEVEL_METRICS = ("load_seconds", "rss_growth_bytes")
+FIXTURE_LEVEL_METRICS = (
+    ("stages", "end_to_end", "p50"),
+    ("stages", "transcribe", "p50"),
+    ("stages", "deliver", "p50"),
+    ("stages", "paste", "p50"),
+    ("rtf", "p50"),
+)
+
+
+class _StageClock:
+    """Collect monotonic timestamps for one in-flight pipeline run."""
+
+    def __init__(self) -> None:
+        self.marks: Dict[str, float] = {}
+        self.error: Optional[str] = None
+        self.text: Optional[str] = None
+        self._done = Event()
+
+    def reset(self) -> None:
+        self.marks = {}
+        self.error = None
+        self.text = None
+        self._done.clear()
+
+    def mark(self, name: str) -> None:
+        self.marks[name] = time.perf_counter()
+
+    def finish(self) -> None:
+        self.mark("delivered")
+        self._done.set()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        return self._done.wait(timeout)
+
+    def stage_durations(self) -> Dict[str, float]:
+        marks = self.marks
+        return {
+            "queue": marks["validate_started"] - marks["submitted"],
+            "validate": marks["validate_finished"] - marks["validate_started"],
+            "transcribe": marks["transcribe_finished"] - marks["transcribe_started"],
+            "deliver": marks["delivered"] - marks["deliver_started"],
+            "copy": marks["copy_finished"] - marks["copy_started"],
+            "paste": marks["paste_finished"] - marks["paste_started"],
+            "end_to_end": marks["delivered"] - marks["submitted"],
+        }
+
+
+class _TimedValidator(AudioValidatorImpl):
+    def __init__(self, clock: _StageClock) -> None:
+        self._clock = clock
+
+    def validate(self, path: Path) -> bool:
+        self._clock.mark("validate_started")
+        try:
+            return super().validate(path)
+        finally:
+            self._clock.mark("validate_finished")
+
+
+class _TimedTranscriber(AITranscriber):
+    def __init__(self, delegate: AITranscriber, clock: _StageClock) -> None:
+        self._delegate = delegate
+        self._clock = clock
+
+    def load(self) -> None:
+        self._delegate.load()
+
+    def warm_up(self) -> None:
+        self._delegate.warm_up()
+
+    def transcribe(self, audio: Path) -> Dict[str, Any]:
+        self._clock.mark("transcribe_started")
+        try:
+            return self._delegate.transcribe(audio)
+        finally:
+            self._clock.mark("transcribe_finished")
+
+    def teardown(self) -> None:
+        self._delegate.teardown()
+
+
+class _TimedOutputBackend(OutputBackend):
+    def __init__(self, delegate: OutputBackend, clock: _StageClock) -> None:
+        self._delegate = delegate
+        self._clock = clock
+
+    def copy_to_clipboard(self, text: str) -> None:
+        self._clock.mark("copy_started")
+        try:
+            self._delegate.copy_to_clipboard(text)
+        finally:
+            self._clock.mark("copy_finished")
+
+    def read_clipboard(self) -> Optional[str]:
+        return self._delegate.read_clipboard()
+
+    def paste(self) -> None:
+        self._clock.mark("paste_started")
+        try:
+            self._delegate.paste()
+        finally:
+            self._clock.mark("paste_finished")
+
+    def close(self) -> None:
+        self._delegate.close()
+
+
+class _RecordingResultHandler(TranscriptionResultHandlerImpl):
+    """The real result handler, timed, on top of a benchmark output backend."""
+
+    def __init__(self, clock: _StageClock, output_backend: OutputBackend) -> None:
+        super().__init__(_TimedOutputBackend(output_backend, clock))
+        self._clock = clock
+
+    def handle_success(self, text: str) -> None:
+        self._clock.mark("deliver_started")
+        self._clock.text = text
+        super().handle_success(text)
+        if self._clock.error is None:
+            self._clock.finish()
+
+    def handle_error(self, exc: Exception) -> None:
+        self._clock.error = f"{type(exc).__name__}: {exc}"
+        self._clock.finish()
+
+
+class _RetainingCleanupService:
+    """Keep fixtures on disk so they can be replayed."""
+
+    def delete_file(self, path: Path) -> None:
+        return None
+
+
+def benchmark_model(
+    model_name: str,
+    fixtures: Dict[str, Path],
+    repeats: int,
+    warmup: int,
+    timeout: float,
+    output_backend: Optional[OutputBackend] = None,
+) -> Dict[str, Any]:
+    """Benchmark a single cached model against every fixture."""
+    transcriber = AITranscriberImpl(model_name=model_name)
+    # The loaded model is a process-wide singleton; start every model cold.
+    transcriber.teardown()
+
+    rss_before_load = current_rss_bytes()
+    load_started_at = time.perf_counter()
+    transcriber.load()
+    load_seconds = time.perf_counter() - load_started_at
+    rss_after_load = current_rss_bytes()
+    # Process peak RSS never goes down, so it would credit every later model
+    # with the largest one's peak; sample current RSS after each run instead.
+    max_rss = rss_after_load
+
+    clock = _StageClock()
+    orchestrator = BackgroundTranscriptionOrchestratorImpl(
+        _TimedValidator(clock),
+        _TimedTranscriber(transcriber, clock),
+        _RetainingCleanupService(),
+        _RecordingResultHandler(clock, output_backend or FakeOutputBackend()),
+    )
+
+    fixture_results: Dict[str, Any] = {}
+    for fixture_name, fixture_path in fixtures.items():
+        audio_seconds = read_audio_duration_seconds(fixture_path) or 0.0
+        samples: Dict[str, List[float]] = {stage: [] for stage in PIPELINE_STAGES}
+        errors: List[str] = []
+
+        for run_index in range(warmup + repeats):
+            clock.reset()
+            clock.mark("submitted")
+            orchestrator.attempt_transcription(fixture_path)
+            if not clock.wait(timeout):
+                errors.append(f"timed out after {timeout:.0f}s")
+                # A running inference cannot be cancelled; let it finish so
+                # it does not overlap the next fixture or model.
+                print(
+                    f"[BENCH] {model_name} {fixture_name}: waiting for the timed-out run",
+                    file=sys.stderr,
+                )
+                clock.wait(None)
+                break
+            rss = current_rss_bytes()
+            if rss is not None and (max_rss is None or rss > max_rss):
+                max_rss = rss
+            if clock.error is not None:
+                errors.append(clock.error)
+                continue
+            if run_index < warmup:
+                continue
+            for stage, duration in clock.stage_durations().items():
+                samples[stage].append(duration)
+
+        rtf = (
+            [duration / audio_seconds for duration in samples["transcribe"]]
+            if audio_seconds
+            else []
+        )
+        fixture_results[fixture_name] = {
+            "audio_seconds": audio_seconds,
+            "stages": {stage: summarize(values) for stage, values in samples.items()},
+            "rtf": summarize(rtf),
+            "errors": errors,
+        }
+        end_to_end_p50 = fixture_results[fixture_name]["stages"]["end_to_end"].get("p50")
+        rtf_p50 = fixture_results[fixture_name]["rtf"].get("p50")
+        print(
+            f"[BENCH] {model_name} {fixture_name}: e2e p50={end_to_end_p50} rtf p50={rtf_p50}",
+            file=sys.stderr,
+        )
+
+    transcriber.teardown()
+
+    return {
+        "load_seconds": load_seconds,
+        "rss_before_load_bytes": rss_before_load,
+        "rss_after_load_bytes": rss_after_load,
+        "rss_after_teardown_bytes": current_rss_bytes(),
+        "max_rss_bytes": max_rss,
+        "rss_growth_bytes": (
+            max_rss - rss_before_load
+            if max_rss is not None and rss_before_load is not None
+            else None
+        ),
+        "fixtures": fixture_results,
+    }
+
+
+def run_benchmarks(
+    model_names: Sequence[str],
+    fixture_names: Sequence[str],
+    repeats: int,
+    warmup: int,
+    timeout: float,
+    output_backend_name: str = "fake",
+) -> Dict[str, Any]:
+    fixtures = ensure_fixtures(fixture_names)
+    output_backend = (
+        create_output_backend() if output_backend_name == "native" else FakeOutputBackend()
+    )
+    try:
+        models = {
+            name: benchmark_model(
+                name, fixtures, repeats, warmup, timeout, output_backend
+            )
+            for name in model_names
+        }
+    finally:
+        output_backend.close()
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": _describe_environment(),
+        "settings": {
+            "repeats": repeats,
+            "warmup": warmup,
+            "fixtures": list(fixtures),
+            "output_backend": output_backend_name,
+        },
+        "models": models,
+    }
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[Dict[str, Any]]:
+    """Return every metric that got worse than ``baseline`` by more than ``tolerance``."""
+    regressions: List[Dict[str, Any]] = []
+
+    def check(model: str, fixture: Optional[str], metric: str, now: Any, before: Any):
+        if not isinstance(now, (int, float)) or not isinstance(before, (int, float)):
+            return
+        if before <= 0:
+            return
+        change = (now - before) / before
+        if change > tolerance:
+            regressions.append(
+                {
+                    "model": model,
+                    "fixture": fixture,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": now,
+                    "change": change,
+                }
+            )
+
+    for model, model_result in current.get("models", {}).items():
+        baseline_model = baseline.get("models", {}).get(model)
+        if baseline_model is None:
+            continue
+        for metric in MODEL_LEVEL_METRICS:
+            check(model, None, metric, model_result.get(metric), baseline_model.get(metric))
+        for fixture, fixture_result in model_result.get("fixtures", {}).items():
+            baseline_fixture = baseline_model.get("fixtures", {}).get(fixture)
+            if baseline_fixture is None:
+                continue
+            for path in FIXTURE_LEVEL_METRICS:
+                check(
+                    model,
+                    fixture,
+                    ".".join(path),
+                    _lookup(fixture_result, path),
+                    _lookup(baseline_fixture, path),
+                )
+    return regressions
+
+
+def cached_model_names() -> List[str]:
+    repository = ModelRepositoryImpl()
+    return [name for name in MODELS_INFO if repository.is_model_in_system(name)]
+
+
+def _lookup(data: Dict[str, Any], path: Sequence[str]) -> Any:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _describe_environment() -> Dict[str, Any]:
+    environment: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "device": DeviceManager().get_platform_device(),
+    }
+    for module_name in ("torch", "whisper"):
+        try:
+            module = __import__(module_name)
+            environment[module_name] = getattr(module, "__version__", "unknown")
+        except Exception:
+            environment[module_name] = None
+    return environment
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        help="Models to benchmark (default: every model present in the Whisper cache).",
+    )
+    parser.add_argument(
+        "--fixtures",
+        nargs="+",
+        default=list(DEFAULT_FIXTURES),
+        choices=list(DEFAULT_FIXTURES),
+        help="Fixture lengths to run.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--timeout", type=float, default=900.0, help="Per-run timeout in seconds."
+    )
+    parser.add_argument(
+        "--output-backend",
+        choices=OUTPUT_BACKENDS,
+        default="fake",
+        help="Clipboard/paste backend used for delivery (native pastes into the focused window).",
+    )
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file.")
+    parser.add_argument(
+        "--compare", type=Path, help="Baseline results JSON to check for regressions."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed relative slowdown before a metric is flagged (default 0.15).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    model_names = args.models or cached_model_names()
+    if not model_names:
+        print("[BENCH] No Whisper models found in the local cache.", file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(
+        model_names,
+        args.fixtures,
+        args.repeats,
+        args.warmup,
+        args.timeout,
+        args.output_backend,
+    )
+
+    exit_code = 0
+    if args.compare is not None:
+        with args.compare.open("r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(results, baseline, args.tolerance)
+        results["comparison"] = {
+            "baseline": str(args.compare),
+            "tolerance": args.tolerance,
+            "regressions": regressions,
+        }
+        for regression in regressions:
+            print(
+                f"[REGRESSION] {regression['model']} {regression['fixture'] or '-'} "
+                f"{regression['metric']}: {regression['baseline']:.4g} -> "
+                f"{regression['current']:.4g} (+{regression['change']:.0%})",
+                file=sys.stderr,
+            )
+        exit_code = 1 if regressions else 0
+
+    payload = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
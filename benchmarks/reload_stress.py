@@ -0,0 +1,109 @@
+"""Stress model reloads and check that teardown releases memory.
+
+Cycles ``AITranscriberImpl.load()`` / ``teardown()`` (which also runs
+``DeviceManager.clear_device_cache()``) N times for a cached model, optionally
+transcribing a fixture in every cycle, and reports the resident memory after
+each load and unload as sampled by :class:`ModelMemoryTracker`. Exits with
+status 1 when RSS ratchets upward across reloads.
+
+Usage:
+    python -m benchmarks.reload_stress --model base.en --cycles 20
+    python -m benchmarks.reload_stress --model small --cycles 10 --transcribe
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.fixtures import ensure_fixtures
+from src.core.transcription.ai_transcriber import AITranscriberImpl
+from src.core.transcription.model_memory_tracker import ModelMemoryTracker
+from src.server.models.repository.model_repository import ModelRepositoryImpl
+from src.utils.process_memory import current_rss_bytes
+
+
+def run_reload_cycles(
+    model_name: str, cycles: int, fixture: Optional[Path]
+) -> Dict[str, Any]:
+    tracker = ModelMemoryTracker.get_instance()
+    transcriber = AITranscriberImpl(model_name=model_name)
+    transcriber.teardown()
+
+    baseline_rss = current_rss_bytes()
+    samples: List[Dict[str, Any]] = []
+    for cycle in range(cycles):
+        started_at = time.perf_counter()
+        transcriber.load()
+        load_seconds = time.perf_counter() - started_at
+        if fixture is not None:
+            transcriber.transcribe(fixture)
+        transcriber.teardown()
+        footprint = tracker.footprint(model_name)
+        samples.append(
+            {
+                "cycle": cycle,
+                "load_seconds": load_seconds,
+                "rss_after_load_bytes": footprint.rss_after_load_bytes if footprint else None,
+                "rss_after_unload_bytes": (
+                    footprint.rss_after_unload_bytes if footprint else None
+                ),
+            }
+        )
+
+    unload_history = [
+        sample["rss_after_unload_bytes"]
+        for sample in samples
+        if sample["rss_after_unload_bytes"] is not None
+    ]
+    growth = (
+        unload_history[-1] - unload_history[0] if len(unload_history) > 1 else 0
+    )
+    return {
+        "model": model_name,
+        "cycles": cycles,
+        "transcribed": fixture is not None,
+        "baseline_rss_bytes": baseline_rss,
+        "measured_footprint_bytes": tracker.measured_footprint_bytes(model_name),
+        "post_unload_growth_bytes": growth,
+        "ratcheting": tracker.is_ratcheting(),
+        "samples": samples,
+    }
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", required=True, help="Cached model to cycle.")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument(
+        "--transcribe",
+        action="store_true",
+        help="Transcribe the 5 s fixture in every cycle.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the report JSON to this file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    if not ModelRepositoryImpl().is_model_in_system(args.model):
+        print(f"[STRESS] Model '{args.model}' is not in the local cache.", file=sys.stderr)
+        return 2
+
+    fixture = ensure_fixtures(["5s"])["5s"] if args.transcribe else None
+    report = run_reload_cycles(args.model, args.cycles, fixture)
+
+    payload = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 1 if report["ratcheting"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
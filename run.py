@@ -3,58 +3,156 @@
 Entry point for the Sona Audio Recorder CLI.
 Ensures the project root is in sys.path and launches the main application logic.
 """
+import time
+
+_PROCESS_STARTED_AT = time.perf_counter()
+
+import argparse
 import sys
 from pathlib import Path
 
-from src.AppServices import AppServices
-from src.event_management.event_messenger import EventMessenger
-from src.event_management.events import Event
-from src.server.app import FlaskServices
-from src.server.config.repository.config_repository import ConfigRepositoryImpl
-from src.server.config.serivce.config_load_service_impl import ConfigLoadServiceImpl
-from src.server.config.serivce.config_saver_service_impl import ConfigSaverServiceImpl
-from src.server.hot_key.repository.hot_key_repository import HotKeyRepositoryImpl
-from src.server.hot_key.service.hot_key_service import HotKeyServiceImpl
-from src.server.models.repository.model_repository import ModelRepositoryImpl
-from src.server.models.service.local_model_service import LocalModelServiceImpl
-from src.runtime.transcription_runtime_manager import AudioTranscriptionRuntimeManager
-from src.server.app import create_flask_app_with
-
-
-def bootstrap() -> None:
+# Only light modules are imported here so that --help and --startup-report
+# answer immediately; the application graph is imported in bootstrap().
+from src.server.models.repository.model_constants import WHISPER_DOWNLOAD_BASE_URL
+from src.server.transcription.service.transcription_job_constants import (
+    DEFAULT_MAX_QUEUED_JOBS,
+    DEFAULT_WAIT_SLO_SECONDS,
+)
+from src.server.wsgi_server import (
+    DEFAULT_HOST,
+    DEFAULT_MIRROR_HOST,
+    DEFAULT_MIRROR_PORT,
+    DEFAULT_PORT,
+    DEFAULT_STREAM_PORT,
+    DEFAULT_THREADS,
+    ServerSettings,
+    serve,
+)
+from src.metrics.runtime_metrics import STARTUP_SECONDS
+from src.runtime.background_imports import start_background_imports
+from src.runtime.startup_report import DEFAULT_BUDGET_MS, run_startup_report
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Sona and its local API.")
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Serve the API with the Flask debug server (development only).",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_THREADS,
+        help=f"API worker threads in production mode (default {DEFAULT_THREADS}).",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=ServerSettings.keep_alive_seconds,
+        help="Seconds an idle keep-alive connection stays open.",
+    )
+    parser.add_argument(
+        "--download-segments",
+        type=int,
+        default=4,
+        help="Parallel byte ranges per model download (1 disables splitting).",
+    )
+    parser.add_argument(
+        "--download-limit-kbps",
+        type=int,
+        default=0,
+        help="Cap model download bandwidth in KiB/s (0 = unlimited).",
+    )
+    parser.add_argument(
+        "--model-base-url",
+        default=WHISPER_DOWNLOAD_BASE_URL,
+        help="Base URL that serves <sha256>/<file>.pt model checkpoints.",
+    )
+    parser.add_argument(
+        "--api-max-queued-jobs",
+        type=int,
+        default=DEFAULT_MAX_QUEUED_JOBS,
+        help="POST /api/transcribe jobs that may wait before requests get 429.",
+    )
+    parser.add_argument(
+        "--api-wait-slo-seconds",
+        type=float,
+        default=DEFAULT_WAIT_SLO_SECONDS,
+        help="Reject transcription requests whose estimated queue wait exceeds this.",
+    )
+    parser.add_argument(
+        "--replicas",
+        type=int,
+        default=1,
+        help="Whisper replica processes sharing one CPU copy of the weights; "
+        "1 keeps a single in-process model on the fastest device.",
+    )
+    parser.add_argument(
+        "--stream-port",
+        type=int,
+        default=DEFAULT_STREAM_PORT,
+        help="Port of the /api/stream WebSocket listener (0 disables streaming).",
+    )
+    parser.add_argument(
+        "--stream-max-sessions",
+        type=int,
+        default=0,
+        help="Concurrent /api/stream sessions (default: one per replica).",
+    )
+    parser.add_argument(
+        "--mirror-host",
+        default=DEFAULT_MIRROR_HOST,
+        help="Interface of the read-only model file mirror (with serve_mirror).",
+    )
+    parser.add_argument(
+        "--mirror-port",
+        type=int,
+        default=DEFAULT_MIRROR_PORT,
+        help="Port of the model file mirror (with serve_mirror; 0 disables it).",
+    )
+    parser.add_argument(
+        "--transcript-cache-mb",
+        type=int,
+        default=64,
+        help="Disk budget of the transcript cache under ~/.sona (0 disables the cache).",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print per-module startup import cost and exit (non-zero over budget).",
+    )
+    parser.add_argument(
+        "--startup-budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Import-time budget for --startup-report (default {DEFAULT_BUDGET_MS} ms).",
+    )
+    return parser.parse_args(argv)
+
+
+def bootstrap(argv=None) -> None:
+    args = parse_args(argv)
     project_root = Path(__file__).resolve().parent
     src_path = project_root / "src"
 
     if str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
 
-    hot_key_service = HotKeyServiceImpl(HotKeyRepositoryImpl())
-    model_service = LocalModelServiceImpl(ModelRepositoryImpl())
-    config_defaults = {
-        "hot_key": hot_key_service.get_default_hot_key().name,
-        "model": model_service.get_default_model_name(),
-    }
-    config_repository = ConfigRepositoryImpl()
-    config_loader = ConfigLoadServiceImpl(config_repository, config_defaults)
-    config_saver = ConfigSaverServiceImpl(config_repository)
-
-    app_services = AppServices(project_root, config_loader, hot_key_service)
-
-    audio_transcription_runtime = AudioTranscriptionRuntimeManager(app_services)
-    # enure runtime is reloaded on config change though event subscription
-    messenger = EventMessenger.get_instance()
-    messenger.subscribe(Event.CONFIG_SAVED, audio_transcription_runtime.reload)
-    audio_transcription_runtime.start()
-
-    flask_app = create_flask_app_with(
-        FlaskServices(
-            model_service,
-            hot_key_service,
-            config_loader,
-            config_saver,
-        )
-    )
-    flask_app.run(debug=True, use_reloader=False)
+    if args.startup_report:
+        sys.exit(run_startup_report(project_root, budget_ms=args.startup_budget_ms))
+
+    from src.runtime.application import build_application
+
+    flask_app, server_settings, mirror_app = build_application(args, project_root)
+    startup_seconds = time.perf_counter() - _PROCESS_STARTED_AT
+    STARTUP_SECONDS.set(startup_seconds)
+    print(f"[INFO] Hotkey listener and API ready in {startup_seconds * 1000:.0f} ms")
+    # torch and whisper are only needed for the first transcription
+    start_background_imports()
+    serve(flask_app, server_settings, mirror_app)
 
 
 if __name__ == "__main__":
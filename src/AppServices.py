@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from src.audio.audio_validator import AudioValidatorImpl
 from src.audio.audio_recorder_impl import AudioRecorderImpl
@@ -6,14 +7,19 @@ from src.core.hot_key.hotkey_actions import HotKeyActions
 from src.core.hot_key.hotkey_controller import HotkeyController
 from src.core.hot_key.hotkey_controller_impl import HotKeyControllerImpl
 from src.core.transcription.ai_transcriber import AITranscriberImpl
+from src.core.transcription.caching_ai_transcriber import CachingAITranscriber
 from src.core.transcription.background_transcription_orchestrator import (
     BackgroundTranscriptionOrchestrator,
     BackgroundTranscriptionOrchestratorImpl,
 )
 from src.core.transcription.cleanup_service import CleanupServiceImpl
+from src.core.transcription.model_idle_evictor import ModelIdleEvictor
+from src.core.transcription.replica_pool_transcriber import ReplicaPoolTranscriber
+from src.core.transcription.transcript_cache import TranscriptCache
 from src.core.transcription.transcription_result_handler import (
     TranscriptionResultHandlerImpl,
 )
+from src.server.config.entity.user_config import UserConfig
 from src.server.config.serivce.config_load_service import ConfigLoadService
 from src.server.hot_key.service.hot_key_service import HotKeyService
 from src.utils.bundled_ffmpeg import get_bundled_ffmpeg
@@ -27,6 +33,8 @@ class AppServices:
         repo_root: Path,
         config_loader: ConfigLoadService,
         hot_key_service: HotKeyService,
+        replicas: int = 1,
+        transcript_cache: Optional[TranscriptCache] = None,
     ) -> None:
         """Initialize the application services container.
 
@@ -34,38 +42,71 @@ class AppServices:
             repo_root: Root directory of the project
             config_loader: Service for loading user configuration
             hot_key_service: Service for managing hotkey definitions
+            replicas: Whisper replica processes; 1 keeps the model in process
+            transcript_cache: Results cache shared by every orchestrator;
+                None transcribes everything
         """
         ffmpeg_executable = get_bundled_ffmpeg(repo_root)
         temp_audio_directory = repo_root / self.TEMP_AUDIO_DIRECTORY
 
         self._config_loader = config_loader
         self._hot_key_service = hot_key_service
+        self._replicas = max(1, replicas)
+        self._transcript_cache = transcript_cache
         self._recorder = AudioRecorderImpl(
             output_dir=temp_audio_directory,
             ffmpeg_executable=str(ffmpeg_executable),
         )
 
+    def load_user_config(self) -> UserConfig:
+        """Load the current user configuration."""
+        return self._config_loader.load_config()
+
     def create_transcription_orchestrator(
-        self,
+        self, user_config: UserConfig | None = None
     ) -> BackgroundTranscriptionOrchestratorImpl:
         """Create a new transcription orchestrator with current configuration."""
+        user_config = user_config or self.load_user_config()
+        if self._replicas > 1:
+            model_transcriber = ReplicaPoolTranscriber(
+                model_name=user_config.current_model, replicas=self._replicas
+            )
+        else:
+            model_transcriber = AITranscriberImpl(model_name=user_config.current_model)
+        ai_transcriber = (
+            CachingAITranscriber(model_transcriber, self._transcript_cache)
+            if self._transcript_cache is not None
+            else model_transcriber
+        )
         return BackgroundTranscriptionOrchestratorImpl(
             AudioValidatorImpl(),
-            AITranscriberImpl(
-                model_name=self._config_loader.load_config().current_model,
-            ),
+            ai_transcriber,
             CleanupServiceImpl(),
-            TranscriptionResultHandlerImpl(),
+            self.create_result_handler(user_config),
+            model_evictor=ModelIdleEvictor(
+                model_transcriber, user_config.model_eviction
+            ),
+        )
+
+    def create_result_handler(
+        self, user_config: UserConfig | None = None
+    ) -> TranscriptionResultHandlerImpl:
+        """Create the clipboard/paste sink for the configured clipboard behaviour."""
+        user_config = user_config or self.load_user_config()
+        return TranscriptionResultHandlerImpl(
+            clipboard_behaviour=user_config.clipboard_behaviour
         )
 
     def create_hot_key_controller(
-        self, orchestrator: BackgroundTranscriptionOrchestrator
+        self,
+        orchestrator: BackgroundTranscriptionOrchestrator,
+        user_config: UserConfig | None = None,
     ) -> HotkeyController:
         """Create a new hotkey controller with the given orchestrator."""
         hot_key_actions = HotKeyActions(
             recorder=self._recorder, orchestrator=orchestrator
         )
-        user_config = self._config_loader.load_config()
+        user_config = user_config or self.load_user_config()
         resolved_hot_key = self._resolve_hot_key_string(user_config.hot_key)
         return HotKeyControllerImpl(
             hot_key_actions=hot_key_actions,
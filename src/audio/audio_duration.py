@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+from typing import Optional
+
+
+def read_audio_duration_seconds(path: Path) -> Optional[float]:
+    """Return the duration of a WAV file by reading its header only.
+
+    The recorder writes 16 kHz mono PCM WAV files, so the duration is
+    available without decoding any samples. Returns ``None`` for files that
+    are not readable WAV containers (e.g., compressed uploads).
+    """
+    try:
+        with wave.open(str(path), "rb") as wav_file:
+            frame_rate = wav_file.getframerate()
+            if frame_rate <= 0:
+                return None
+            return wav_file.getnframes() / float(frame_rate)
+    except (wave.Error, EOFError, OSError):
+        return None
@@ -12,13 +12,17 @@ class HotKeyActions:
     Responsibility:
         Provide concrete callback methods that can be wired directly into a
         :class:`HotkeyController` implementation (e.g., ``PynputHotkeyController``).
-        The press handler starts recording; the release handler stops recording
-        and forwards the resulting audio file to a downstream consumer.
+        The press handler starts recording and asks the orchestrator to warm
+        up the model so loading overlaps with speech; the release handler
+        stops recording and forwards the resulting audio file to a downstream
+        consumer.
 
     Interface:
         Initialize with an ``AudioRecorder`` instance. The public methods
-        ``on_press`` and ``on_release`` are lightweight and safe to call from
-        a hotkey listener thread. The optional ``cancel`` method allows
+        ``on_press`` and ``on_release`` start and stop the recorder process
+        and may block briefly, so they are run on the
+        :class:`RecorderCommandThread` rather than the keyboard listener
+        thread. The optional ``cancel`` method allows
         higher-level coordination code to discard an in-flight recording when
         needed (e.g., on errors or aborted interactions). Downstream handling
         of the recorded audio is encapsulated in ``_on_audio_ready`` to avoid
@@ -41,6 +45,11 @@ class HotKeyActions:
         print("Recording started.")
         self._recorder.start()
         self._is_recording = True
+        try:
+            self._transcription_orchestrator.prefetch()
+        except Exception as exc:
+            # Prefetch is an optimisation; never let it break recording.
+            print(f"[WARNING] Could not prefetch model: {exc}")
 
     def on_release(self) -> None:
         """Stop recording on hotkey release and forward the audio path."""
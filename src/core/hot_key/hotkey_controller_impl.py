@@ -4,9 +4,12 @@ from typing import Optional, Any, Set
 
 from pynput.keyboard import Listener as KeyboardListener, Key, KeyCode
 
+from src.metrics.runtime_metrics import HOTKEY_COMMANDS_DEBOUNCED_TOTAL
+
 from .hotkey_actions import HotKeyActions
 from .hotkey_controller import HotkeyController
 from .hotkey_mapping import HotkeyDefinition, map_hotkey_string
+from .recorder_command_thread import RecorderCommandThread
 
 
 class HotKeyControllerImpl(HotkeyController):
@@ -23,10 +26,11 @@ class HotKeyControllerImpl(HotkeyController):
         hotkey is pressed and released, respectively.
 
         The actual registration of the global hotkey and the background
-        listener loop is managed internally. The public methods
-        :meth:`on_press` and :meth:`on_release` simply delegate to the
-        configured callbacks and satisfy the :class:`HotkeyController`
-        protocol.
+        listener loop is managed internally. The listener callbacks only
+        enqueue timestamped commands on a :class:`RecorderCommandThread`,
+        which runs the actions, so the OS keyboard hook never waits for the
+        recorder. Auto-repeat presses of a key that is already held are
+        dropped before they reach the queue.
     """
 
     def __init__(
@@ -42,6 +46,7 @@ class HotKeyControllerImpl(HotkeyController):
 
         self._keyboard = _keyboard
         self._hot_key: HotKeyActions = hot_key_actions
+        self._commands = RecorderCommandThread(hot_key_actions)
         self._listener: Optional[KeyboardListener] = None
 
         # Map configured hotkey string to an internal definition. This keeps
@@ -55,6 +60,7 @@ class HotKeyControllerImpl(HotkeyController):
     def start_listening(self) -> None:
         if self._listener is not None:
             return
+        self._commands.start()
         self._listener = self._keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release,
@@ -66,19 +72,24 @@ class HotKeyControllerImpl(HotkeyController):
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
+        self._commands.stop()
 
     def _on_press(self, key: Key | KeyCode) -> None:
-        # Record key as pressed
+        # A key that is already held is the OS auto-repeating it.
+        if key in self._pressed_keys:
+            if key in self._hotkey_def.keys:
+                HOTKEY_COMMANDS_DEBOUNCED_TOTAL.labels(reason="auto_repeat").inc()
+            return
         self._pressed_keys.add(key)
 
         if self._hotkey_def.type == "single":
             # Single-key hotkey: trigger when this key is pressed.
             if key in self._hotkey_def.keys:
-                self._hot_key.on_press()
+                self._commands.submit_press()
         else:
             # Chord hotkey: trigger when all required keys are currently held.
             if self._hotkey_def.keys.issubset(self._pressed_keys):
-                self._hot_key.on_press()
+                self._commands.submit_press()
 
     def _on_release(self, key: Key | KeyCode) -> None:
         # Mark key as released
@@ -86,4 +97,4 @@ class HotKeyControllerImpl(HotkeyController):
             self._pressed_keys.remove(key)
 
         if key in self._hotkey_def.keys:
-            self._hot_key.on_release()
+            self._commands.submit_release()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.metrics.runtime_metrics import (
+    HOTKEY_COMMAND_LAG_SECONDS,
+    HOTKEY_COMMANDS_DEBOUNCED_TOTAL,
+    PIPELINE_ERRORS_TOTAL,
+)
+
+from .hotkey_actions import HotKeyActions
+
+PRESS = "press"
+RELEASE = "release"
+
+# A release followed by a press within this window is treated as key bounce
+# (or a re-trigger too fast to be intentional) and the recording continues.
+RETRIGGER_DEBOUNCE_SECONDS = 0.08
+
+
+@dataclass(frozen=True)
+class RecorderCommand:
+    kind: str
+    issued_at: float = field(default_factory=time.monotonic)
+
+
+_STOP = RecorderCommand(kind="stop")
+
+
+class RecorderCommandThread:
+    """RecorderCommandThread
+
+    Responsibility:
+        Run hotkey actions (starting and stopping the FFmpeg recorder, which
+        spawns and waits for a process) off the keyboard listener thread, so
+        the OS keyboard hook is never blocked and typing does not lag.
+        Commands are handled in order on one dedicated thread; repeated
+        presses while the hotkey is held are ignored and a release that is
+        immediately followed by a new press is debounced away.
+
+    Interface:
+        * start() -> None: start the command thread (idempotent)
+        * submit_press() / submit_release() -> None: enqueue a timestamped
+          command; never blocks, safe to call from the listener callbacks
+        * stop(timeout=2.0) -> None: handle what is already queued, discard
+          a recording that is still running and stop the thread
+    """
+
+    def __init__(
+        self,
+        hot_key_actions: HotKeyActions,
+        retrigger_debounce_seconds: float = RETRIGGER_DEBOUNCE_SECONDS,
+    ) -> None:
+        self._actions = hot_key_actions
+        self._retrigger_debounce_seconds = retrigger_debounce_seconds
+        self._queue: "queue.SimpleQueue[RecorderCommand]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._held = False
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="RecorderCommandThread", daemon=True
+        )
+        self._thread.start()
+
+    def submit_press(self) -> None:
+        self._queue.put(RecorderCommand(kind=PRESS))
+
+    def submit_release(self) -> None:
+        self._queue.put(RecorderCommand(kind=RELEASE))
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        pending: Optional[RecorderCommand] = None
+        while True:
+            command = pending if pending is not None else self._queue.get()
+            pending = None
+            if command is _STOP:
+                break
+            if command.kind == PRESS:
+                self._handle_press(command)
+            elif command.kind == RELEASE and self._held:
+                pending = self._handle_release(command)
+        # Nothing will release a recording that is still running.
+        self._held = False
+        self._invoke(self._actions.cancel, "cancel", None)
+
+    def _handle_press(self, command: RecorderCommand) -> None:
+        if self._held:
+            HOTKEY_COMMANDS_DEBOUNCED_TOTAL.labels(reason="repeat").inc()
+            return
+        self._held = True
+        self._invoke(self._actions.on_press, PRESS, command)
+
+    def _handle_release(self, command: RecorderCommand) -> Optional[RecorderCommand]:
+        """Stop recording unless a press follows within the debounce window.
+
+        Returns a command taken from the queue while waiting that still has
+        to be handled.
+        """
+        wait = command.issued_at + self._retrigger_debounce_seconds - time.monotonic()
+        try:
+            following = self._queue.get(timeout=max(0.0, wait))
+        except queue.Empty:
+            following = None
+
+        if (
+            following is not None
+            and following.kind == PRESS
+            and following.issued_at - command.issued_at <= self._retrigger_debounce_seconds
+        ):
+            HOTKEY_COMMANDS_DEBOUNCED_TOTAL.labels(reason="retrigger").inc()
+            return None
+
+        self._held = False
+        self._invoke(self._actions.on_release, RELEASE, command)
+        return following
+
+    def _invoke(self, action, name: str, command: Optional[RecorderCommand]) -> None:
+        if command is not None:
+            HOTKEY_COMMAND_LAG_SECONDS.labels(command=name).observe(
+                time.monotonic() - command.issued_at
+            )
+        try:
+            action()
+        except Exception as exc:
+            PIPELINE_ERRORS_TOTAL.labels(stage="hotkey").inc()
+            print(f"[WARNING] Hotkey {name} failed: {exc}")
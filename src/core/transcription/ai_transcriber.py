@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
+import gc
 import threading
+import time
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
     Optional,
     Protocol,
     runtime_checkable,
     TYPE_CHECKING,
 )
+from src.audio.audio_duration import read_audio_duration_seconds
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import (
+    ModelEvicted,
+    ModelLoaded,
+    ModelLoading,
+    ModelUnloaded,
+)
+from src.event_management.events import Event
+from src.metrics.runtime_metrics import (
+    MODEL_EVICTIONS_TOTAL,
+    MODEL_LOAD_SECONDS,
+    MODEL_LOADED,
+    TRANSCRIPTION_LATENCY_SECONDS,
+    TRANSCRIPTION_REAL_TIME_FACTOR,
+)
 from .device.device_manager import DeviceManager
+from .model_memory_tracker import ModelMemoryTracker
 
 if TYPE_CHECKING:  # pragma: no cover
     import whisper  # type: ignore
 
+# Whisper resamples file input to 16 kHz; in-memory samples must already be.
+SAMPLE_RATE = 16000
+# Decoding settings passed to every transcription. They change the text, so
+# they are part of the transcript cache key.
+DECODE_OPTIONS: Dict[str, Any] = {
+    "task": "transcribe",
+    "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+    "condition_on_previous_text": True,
+}
+
 
 @runtime_checkable
 class AITranscriber(Protocol):
@@ -24,16 +54,37 @@ class AITranscriber(Protocol):
 
     def load(self) -> None: ...
 
+    def warm_up(self) -> None:
+        """Prepare everything the next ``transcribe`` needs; defaults to a no-op."""
+
     def transcribe(self, audio: Path) -> Dict[str, Any]: ...
 
+    def transcribe_samples(self, samples: Any) -> Dict[str, Any]:
+        """Transcribe mono 16 kHz float32 samples already in memory."""
+
     def teardown(self) -> None: ...
 
 
 class AITranscriberImpl(AITranscriber):
-    """Thread-safe Whisper adapter with lazy imports and device auto-detection."""
+    """Thread-safe Whisper adapter with lazy imports and device auto-detection.
+
+    The loaded model is a process-wide singleton. Besides the gateway API it
+    exposes ``is_loaded``, ``idle_seconds`` and ``evict`` so an eviction policy
+    can unload an idle model; the next ``transcribe`` reloads it transparently.
+
+    Whisper installs its kv-cache hooks on the shared model for the length of
+    a decode, so inference is serialised: hotkey, API and streaming callers
+    take turns on the model, and only a replica pool transcribes side by side.
+    """
 
     _model: Optional[Any] = None
+    _loaded_model_name: Optional[str] = None
+    _evicted_model_name: Optional[str] = None
     _model_lock = threading.Lock()
+    _usage_lock = threading.Lock()
+    _inference_lock = threading.Lock()
+    _in_flight = 0
+    _last_used_at = time.monotonic()
 
     def __init__(
         self,
@@ -42,35 +93,201 @@ class AITranscriberImpl(AITranscriber):
     ) -> None:
         self._model_name = model_name
         self._device_manager = device_manager or DeviceManager()
-        self._device = self._device_manager.get_platform_device()
+        # Resolved on first use: probing the device imports torch (and may
+        # benchmark it once), which must not happen on the startup path.
+        self._device: Optional[str] = None
+        self._memory_tracker = ModelMemoryTracker.get_instance()
+        self._messenger = EventMessenger.get_instance()
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def device(self) -> str:
+        if self._device is None:
+            self._device = self._device_manager.get_platform_device(self._model_name)
+        return self._device
+
+    @property
+    def precision(self) -> str:
+        # whisper decodes in fp16 unless it runs on the CPU
+        return "fp32" if self.device == "cpu" else "fp16"
 
     def load(self) -> None:
         with self._model_lock:
             if AITranscriberImpl._model is not None:
                 return
             whisper_module = self._lazy_import_whisper()
+            self._messenger.emit(
+                Event.MODEL_LOADING,
+                ModelLoading(model_name=self._model_name, device=self.device),
+            )
+            self._memory_tracker.on_load_started(self._model_name)
+            started_at = time.perf_counter()
             AITranscriberImpl._model = whisper_module.load_model(
-                self._model_name, device=self._device
+                self._model_name, device=self.device
+            )
+            load_seconds = time.perf_counter() - started_at
+            AITranscriberImpl._loaded_model_name = self._model_name
+            is_reload = AITranscriberImpl._evicted_model_name == self._model_name
+            AITranscriberImpl._evicted_model_name = None
+            AITranscriberImpl._last_used_at = time.monotonic()
+            footprint = self._memory_tracker.on_load_finished(
+                self._model_name, self.device
             )
+            MODEL_LOAD_SECONDS.labels(
+                model=self._model_name, device=self.device
+            ).observe(load_seconds)
+            MODEL_LOADED.labels(model=self._model_name, device=self.device).set(1)
 
-    def transcribe(self, audio: Path) -> Dict[str, Any]:
-        if AITranscriberImpl._model is None:
+        self._messenger.emit(
+            Event.MODEL_LOADED,
+            ModelLoaded(
+                model_name=self._model_name,
+                device=self.device,
+                load_seconds=load_seconds,
+                reload_after_eviction=is_reload,
+                resident_bytes=footprint.resident_bytes,
+            ),
+        )
+
+    def warm_up(self) -> None:
+        """Load the model and build its mel filters and tokenizer ahead of use.
+
+        Called speculatively while the user is still speaking so the first
+        transcription after a cold start or an eviction does not pay for it.
+        Both helpers are memoised by whisper, so repeated calls are cheap.
+        """
+        with self._usage_lock:
+            AITranscriberImpl._in_flight += 1
+        try:
             self.load()
-        model = AITranscriberImpl._model
-        if model is None:
-            raise RuntimeError("Whisper model failed to load")
+            model = AITranscriberImpl._model
+            if model is None:
+                return
+            whisper_module = self._lazy_import_whisper()
+            whisper_module.audio.mel_filters(model.device, model.dims.n_mels)
+            whisper_module.tokenizer.get_tokenizer(
+                model.is_multilingual,
+                num_languages=model.num_languages,
+                language=None if model.is_multilingual else "en",
+                task="transcribe",
+            )
+        finally:
+            with self._usage_lock:
+                AITranscriberImpl._in_flight -= 1
+                AITranscriberImpl._last_used_at = time.monotonic()
 
+    def transcribe(self, audio: Path) -> Dict[str, Any]:
+        return self._transcribe(
+            str(audio), lambda: read_audio_duration_seconds(audio)
+        )
+
+    def transcribe_samples(self, samples: Any) -> Dict[str, Any]:
+        return self._transcribe(samples, lambda: len(samples) / SAMPLE_RATE)
+
+    def _transcribe(
+        self, audio: Any, audio_duration: Callable[[], Optional[float]]
+    ) -> Dict[str, Any]:
+        # Count the call as in-flight before touching the model so an
+        # eviction cannot unload it underneath us.
+        with self._usage_lock:
+            AITranscriberImpl._in_flight += 1
         try:
-            return model.transcribe(audio=str(audio))
-        except Exception as exc:  # pragma: no cover
-            raise RuntimeError("Transcription failed") from exc
+            if AITranscriberImpl._model is None:
+                self.load()
+            model = AITranscriberImpl._model
+            if model is None:
+                raise RuntimeError("Whisper model failed to load")
+
+            with self._inference_lock:
+                started_at = time.perf_counter()
+                try:
+                    result = model.transcribe(audio=audio, **DECODE_OPTIONS)
+                except Exception as exc:  # pragma: no cover
+                    raise RuntimeError("Transcription failed") from exc
+            self._record_inference_metrics(
+                audio_duration(), time.perf_counter() - started_at
+            )
+            return result
+        finally:
+            with self._usage_lock:
+                AITranscriberImpl._in_flight -= 1
+                AITranscriberImpl._last_used_at = time.monotonic()
 
     def teardown(self) -> None:
         with self._model_lock:
-            if AITranscriberImpl._model is None:
-                return
-            self._device_manager.clear_device_cache()
-            AITranscriberImpl._model = None
+            unloaded_model_name = self._unload_locked()
+        if unloaded_model_name is not None:
+            self._messenger.emit(
+                Event.MODEL_UNLOADED,
+                ModelUnloaded(model_name=unloaded_model_name, device=self.device),
+            )
+
+    def is_loaded(self) -> bool:
+        return AITranscriberImpl._model is not None
+
+    def idle_seconds(self) -> float:
+        """Seconds since the model was last loaded or used for inference."""
+        with self._usage_lock:
+            if AITranscriberImpl._in_flight:
+                return 0.0
+            return time.monotonic() - AITranscriberImpl._last_used_at
+
+    def evict(self, reason: str) -> bool:
+        """Unload the model unless a transcription is running.
+
+        Returns:
+            True if a model was unloaded.
+        """
+        with self._model_lock:
+            # _usage_lock stays held until the model is gone, so a
+            # transcription cannot start between the check and the unload
+            # and then find the model missing.
+            with self._usage_lock:
+                if AITranscriberImpl._in_flight:
+                    return False
+                unloaded_model_name = self._unload_locked()
+            if unloaded_model_name is None:
+                return False
+            AITranscriberImpl._evicted_model_name = unloaded_model_name
+
+        MODEL_EVICTIONS_TOTAL.labels(reason=reason).inc()
+        print(f"[INFO] Evicted model '{unloaded_model_name}' ({reason})")
+        self._messenger.emit(
+            Event.MODEL_EVICTED,
+            ModelEvicted(
+                model_name=unloaded_model_name, device=self.device, reason=reason
+            ),
+        )
+        return True
+
+    def _unload_locked(self) -> Optional[str]:
+        """Release the model; the caller must hold ``_model_lock``."""
+        if AITranscriberImpl._model is None:
+            return None
+        loaded_model_name = AITranscriberImpl._loaded_model_name or self._model_name
+        AITranscriberImpl._model = None
+        AITranscriberImpl._loaded_model_name = None
+        # Drop the last reference before emptying device caches, otherwise
+        # the allocator still owns the weights and nothing is released.
+        gc.collect()
+        self._device_manager.clear_device_cache(self.device)
+        MODEL_LOADED.labels(model=loaded_model_name, device=self.device).set(0)
+        self._memory_tracker.on_unload_finished(loaded_model_name)
+        return loaded_model_name
+
+    def _record_inference_metrics(
+        self, audio_duration: Optional[float], elapsed: float
+    ) -> None:
+        TRANSCRIPTION_LATENCY_SECONDS.labels(
+            model=self._model_name, device=self.device
+        ).observe(elapsed)
+        if audio_duration:
+            TRANSCRIPTION_REAL_TIME_FACTOR.labels(
+                model=self._model_name, device=self.device
+            ).observe(elapsed / audio_duration)
 
     @staticmethod
     def _lazy_import_whisper() -> Any:
@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+import time
+import uuid
 from pathlib import Path
-from typing import Protocol, runtime_checkable
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from threading import Lock
 import atexit
 
+from src.audio.audio_duration import read_audio_duration_seconds
 from src.audio.audio_validator import AudioValidator, AudioValidatorImpl
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import (
+    TranscriptionCompleted,
+    TranscriptionFailed,
+    TranscriptionStarted,
+)
+from src.event_management.events import Event
+from src.metrics.runtime_metrics import PIPELINE_ERRORS_TOTAL, PIPELINE_STAGE_SECONDS
+from src.runtime.transcription_profiler import TranscriptionProfiler
+from src.server.config.entity.user_config import ModelEviction
 from .ai_transcriber import AITranscriber
 from .cleanup_service import CleanupService, CleanupServiceImpl
+from .model_idle_evictor import ModelIdleEvictor
 from .transcription_result_handler import (
     TranscriptionResultHandler,
     TranscriptionResultHandlerImpl,
 )
 from ...runtime.shared_executor import get_shared_executor
 
+HOTKEY_SOURCE = "hotkey"
+API_SOURCE = "api"
+
 
 @runtime_checkable
 class BackgroundTranscriptionOrchestrator(Protocol):
@@ -25,10 +43,14 @@ class BackgroundTranscriptionOrchestrator(Protocol):
         TranscriptionResultHandler. Ensure cleanup on success and error.
 
     Interface:
+        * prefetch() -> None
         * attempt_transcription(path: Path) -> None
         * shutdown() -> None
     """
 
+    def prefetch(self) -> None:
+        """Start preparing the model in the background (non-blocking)."""
+
     def attempt_transcription(self, path: Path) -> None:
         """Enqueue transcription for the given audio file path."""
 
@@ -45,7 +67,15 @@ class BackgroundTranscriptionOrchestratorImpl(BackgroundTranscriptionOrchestrato
         proper cleanup on success and error. Prevents blocking the hotkey thread.
 
     Interface:
+        * prefetch() -> None: Warm up the model while the user is recording
         * attempt_transcription(path: Path) -> None: Enqueue transcription task
+        * submit_transcription(path: Path) -> Future[TranscriptionCompleted]:
+          Run the same pipeline for an API client and return the result
+        * transcribe_samples(samples) -> dict: Transcribe in-memory 16 kHz
+          audio (streaming clients) on the same transcriber, on the
+          caller's thread
+        * set_result_handler(handler) -> None: Swap the result sink in place
+        * update_eviction_policy(policy) -> None: Retune the idle evictor
         * shutdown() -> None: Clean shutdown of worker threads
     """
 
@@ -55,6 +85,8 @@ class BackgroundTranscriptionOrchestratorImpl(BackgroundTranscriptionOrchestrato
         ai_transcriber: AITranscriber,
         cleanup_service: CleanupService,
         result_handler: TranscriptionResultHandler,
+        executor: Optional[Executor] = None,
+        model_evictor: Optional[ModelIdleEvictor] = None,
     ):
         """Initialize the orchestrator with all required components.
 
@@ -64,6 +96,11 @@ class BackgroundTranscriptionOrchestratorImpl(BackgroundTranscriptionOrchestrato
             cleanup_service: Component to clean up resources. Defaults to CleanupServiceImpl.
             result_handler: Component to handle results. Defaults to TranscriptionResultHandlerImpl.
             max_workers: Maximum number of worker threads. Default is 1 to avoid GIL contention.
+            executor: Executor that runs transcription tasks. Defaults to the
+                process-wide shared executor; simulations inject their own to
+                size the pool.
+            model_evictor: Optional evictor that unloads the model while it
+                sits idle. Started here and stopped on shutdown.
         """
         self._audio_loader = audio_loader or AudioValidatorImpl()
         self._ai_transcriber = ai_transcriber
@@ -71,55 +108,238 @@ class BackgroundTranscriptionOrchestratorImpl(BackgroundTranscriptionOrchestrato
         self._result_handler = result_handler or TranscriptionResultHandlerImpl()
 
         # Use single worker to avoid GIL contention and model thread-safety issues
-        self._executor = get_shared_executor()
+        self._executor = executor or get_shared_executor()
+        self._profiler = TranscriptionProfiler.get_instance()
+        self._messenger = EventMessenger.get_instance()
+        self._model_evictor = model_evictor
+        self._prefetch_lock = Lock()
+        self._prefetch_future: Optional[Future] = None
+        if self._model_evictor is not None:
+            self._model_evictor.start()
 
         # Register shutdown hook to ensure cleanup on app exit
         atexit.register(self.shutdown)
 
+    def prefetch(self) -> None:
+        """Warm up the transcriber on the transcription lane without blocking.
+
+        At most one warm-up is pending at a time; a transcription submitted
+        while it runs waits on the transcriber's load lock instead of loading
+        the model a second time.
+        """
+        with self._prefetch_lock:
+            if self._prefetch_future is not None and not self._prefetch_future.done():
+                return
+            self._prefetch_future = self._executor.submit(self._prefetch_task)
+
+    def _prefetch_task(self) -> None:
+        started_at = time.perf_counter()
+        try:
+            self._ai_transcriber.warm_up()
+            self._finish_stage("prefetch", started_at)
+        except Exception as exc:
+            # A failed warm-up is retried by the transcription itself.
+            PIPELINE_ERRORS_TOTAL.labels(stage="prefetch").inc()
+            print(f"[WARNING] Model prefetch failed: {exc}")
+
+    def set_result_handler(self, result_handler: TranscriptionResultHandler) -> None:
+        """Replace the result sink without touching the model.
+
+        Pipelines already past transcription finish with the handler they
+        read; every later result goes to the new one.
+        """
+        self._result_handler = result_handler
+
+    def update_eviction_policy(self, policy: ModelEviction) -> None:
+        if self._model_evictor is not None:
+            self._model_evictor.update_policy(policy)
+
     def attempt_transcription(self, path: Path) -> None:
         """Enqueue transcription for the given audio file path.
 
         Args:
             path: Path to the audio file to transcribe
         """
-        self._executor.submit(self._transcribe_task, path)
+        self._executor.submit(self._transcribe_task, path, time.perf_counter())
+
+    def submit_transcription(self, path: Path) -> Future:
+        """Transcribe ``path`` for an API client.
+
+        Runs the same validation, transcription and cleanup stages as a
+        hotkey recording, but the text is returned through the future instead
+        of being pasted; a failure is raised by ``future.result()``.
+        """
+        return self._executor.submit(
+            self._transcribe_task, path, time.perf_counter(), API_SOURCE
+        )
+
+    def transcribe_samples(self, samples: Any) -> Dict[str, Any]:
+        """Transcribe mono 16 kHz float32 samples.
+
+        Used by streaming clients for partial and final hypotheses: there is
+        no file to validate or clean up and nothing is delivered, so only the
+        inference stage runs and the raw Whisper result is returned. It runs
+        on the caller's thread rather than the shared executor, so streams
+        never hold hotkey or API lanes; the transcriber serialises it with
+        every other inference on an in-process model.
+        """
+        started_at = time.perf_counter()
+        try:
+            result = self._ai_transcriber.transcribe_samples(samples)
+        except Exception:
+            PIPELINE_ERRORS_TOTAL.labels(stage="stream").inc()
+            raise
+        self._finish_stage("stream", started_at)
+        return result
+
+    def _transcribe_task(
+        self,
+        path: Path,
+        submitted_at: Optional[float] = None,
+        source: str = HOTKEY_SOURCE,
+    ) -> Optional[TranscriptionCompleted]:
+        """Execute the transcription task, under the profiler when it is armed.
+
+        Args:
+            path: Path to the audio file to transcribe
+            submitted_at: perf_counter() value when the task was enqueued
+            source: HOTKEY_SOURCE or API_SOURCE
+        """
+        if self._profiler.armed:
+            return self._profiler.run(self._run_pipeline, path, submitted_at, source)
+        return self._run_pipeline(path, submitted_at, source)
 
-    def _transcribe_task(self, path: Path) -> None:
-        """Execute the transcription task with full error handling and cleanup.
+    def _run_pipeline(
+        self,
+        path: Path,
+        submitted_at: Optional[float] = None,
+        source: str = HOTKEY_SOURCE,
+    ) -> Optional[TranscriptionCompleted]:
+        """Run validation, transcription and delivery with full error handling and cleanup.
+
+        Emits TRANSCRIPTION_STARTED, then TRANSCRIPTION_COMPLETED or
+        TRANSCRIPTION_FAILED with per-stage timings in seconds. Hotkey
+        results go to the result handler; API results are returned and API
+        failures re-raised.
 
         Args:
             path: Path to the audio file to transcribe
+            submitted_at: perf_counter() value when the task was enqueued
+            source: HOTKEY_SOURCE or API_SOURCE
         """
+        deliver = source == HOTKEY_SOURCE
+        transcription_id = uuid.uuid4().hex
+        pipeline_started_at = time.perf_counter()
+        timings: Dict[str, float] = {}
+        if submitted_at is not None:
+            timings["queue"] = pipeline_started_at - submitted_at
+        audio_seconds = read_audio_duration_seconds(path)
+        model_name = getattr(self._ai_transcriber, "model_name", None)
+        self._messenger.emit(
+            Event.TRANSCRIPTION_STARTED,
+            TranscriptionStarted(
+                transcription_id=transcription_id,
+                model_name=model_name,
+                audio_seconds=audio_seconds,
+                source=source,
+            ),
+        )
+
+        stage = "validate"
+        stage_started_at = pipeline_started_at
         try:
             # Step 1: Validate audio file (existence, readability, non-empty)
             self._audio_loader.validate(path)
+            stage_started_at = self._finish_stage(stage, stage_started_at, timings)
 
             # Step 2: Transcribe using the file Path (Whisper reads from disk)
+            stage = "transcribe"
             result = self._ai_transcriber.transcribe(path)
 
             # Step 3: Extract text from result
             text = result.get("text", "").strip()
+            stage_started_at = self._finish_stage(stage, stage_started_at, timings)
 
             # Step 4: Handle success
-            self._result_handler.handle_success(text)
+            if deliver:
+                stage = "deliver"
+                self._result_handler.handle_success(text)
+                self._finish_stage(stage, stage_started_at, timings)
+
+            timings["total"] = time.perf_counter() - pipeline_started_at
+            completed = TranscriptionCompleted(
+                transcription_id=transcription_id,
+                text=text,
+                language=result.get("language"),
+                model_name=model_name,
+                audio_seconds=audio_seconds,
+                timings=timings,
+                source=source,
+            )
+            self._messenger.emit(Event.TRANSCRIPTION_COMPLETED, completed)
+            return completed
 
         except Exception as exc:
             # Handle any errors that occur during transcription
-            self._result_handler.handle_error(exc)
+            PIPELINE_ERRORS_TOTAL.labels(stage=stage).inc()
+            if deliver:
+                self._result_handler.handle_error(exc)
+            self._emit_failure(transcription_id, stage, exc, timings, source)
+            if not deliver:
+                raise
+            return None
 
         finally:
             # Step 5: Cleanup temp file (always runs, even on error)
+            cleanup_started_at = time.perf_counter()
             try:
                 self._cleanup_service.delete_file(path)
+                self._finish_stage("cleanup", cleanup_started_at)
             except Exception as cleanup_exc:
                 # Log cleanup errors but don't propagate
+                PIPELINE_ERRORS_TOTAL.labels(stage="cleanup").inc()
                 print(f"[WARNING] Cleanup error: {cleanup_exc}")
 
+    @staticmethod
+    def _finish_stage(
+        stage: str, started_at: float, timings: Optional[Dict[str, float]] = None
+    ) -> float:
+        """Record how long a pipeline stage took and return the current time."""
+        now = time.perf_counter()
+        PIPELINE_STAGE_SECONDS.labels(stage=stage).observe(now - started_at)
+        if timings is not None:
+            timings[stage] = now - started_at
+        return now
+
+    def _emit_failure(
+        self,
+        transcription_id: str,
+        stage: str,
+        exc: Exception,
+        timings: Dict[str, Any],
+        source: str = HOTKEY_SOURCE,
+    ) -> None:
+        try:
+            self._messenger.emit(
+                Event.TRANSCRIPTION_FAILED,
+                TranscriptionFailed(
+                    transcription_id=transcription_id,
+                    stage=stage,
+                    error=f"{type(exc).__name__}: {exc}",
+                    timings=timings,
+                    source=source,
+                ),
+            )
+        except Exception as emit_exc:
+            print(f"[WARNING] Failed to publish transcription failure: {emit_exc}")
+
     def shutdown(self) -> None:
         """Tear down worker resources (threads/processes) at application exit.
         Waits for pending tasks to complete before shutting down.
         """
         try:
+            if self._model_evictor is not None:
+                self._model_evictor.stop()
             self._ai_transcriber.teardown()
 
             print("[DEBUG] BackgroundTranscriptionOrchestrator shutdown complete")
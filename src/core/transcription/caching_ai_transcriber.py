@@ -0,0 +1,66 @@
+"""AITranscriber decorator that answers repeated audio from the transcript cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+
+from .ai_transcriber import DECODE_OPTIONS, AITranscriber
+from .transcript_cache import TranscriptCache
+
+
+class CachingAITranscriber(AITranscriber):
+    """CachingAITranscriber
+
+    Responsibility:
+        Consult the transcript cache before inference. Audio files are
+        decoded to 16 kHz PCM once, here. The PCM is hashed with the model
+        name, precision and decode options, and on a miss the decoded
+        samples go to the wrapped transcriber, so a miss costs one hash and
+        no second decode. Samples sent by streaming clients are passed
+        through uncached: their windows never repeat and would only push
+        useful entries out.
+
+    Interface:
+        * load() / warm_up() / teardown(): delegated
+        * transcribe(audio: Path) -> dict: cached
+        * transcribe_samples(samples) -> dict: not cached
+    """
+
+    def __init__(self, transcriber: AITranscriber, cache: TranscriptCache) -> None:
+        self._transcriber = transcriber
+        self._cache = cache
+
+    @property
+    def model_name(self) -> str:
+        return self._transcriber.model_name
+
+    def load(self) -> None:
+        self._transcriber.load()
+
+    def warm_up(self) -> None:
+        self._transcriber.warm_up()
+
+    def transcribe(self, audio: Path) -> Dict[str, Any]:
+        import numpy as np  # type: ignore
+        from whisper.audio import load_audio  # type: ignore
+
+        samples = np.ascontiguousarray(load_audio(str(audio)), dtype=np.float32)
+        key = TranscriptCache.key_for(
+            samples,
+            self._transcriber.model_name,
+            self._transcriber.precision,
+            DECODE_OPTIONS,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._transcriber.transcribe_samples(samples)
+        self._cache.put(key, result)
+        return result
+
+    def transcribe_samples(self, samples: Any) -> Dict[str, Any]:
+        return self._transcriber.transcribe_samples(samples)
+
+    def teardown(self) -> None:
+        self._transcriber.teardown()
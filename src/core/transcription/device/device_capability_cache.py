@@ -0,0 +1,297 @@
+"""Probe inference devices once per torch build and hardware, and time them."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from src.core.transcription.device.device_cleanup_service import (
+    DeviceCleanupServiceImpl,
+)
+from src.metrics.runtime_metrics import DEVICE_BENCHMARK_SECONDS
+
+# Used when nothing has been measured for a model size.
+DEVICE_PREFERENCE = ("mps", "cuda", "cpu")
+
+# Encoder (n_state, n_head, n_layer) per Whisper size; ``.en`` variants share
+# the dimensions and large-v3-turbo keeps the large encoder.
+WHISPER_ENCODER_DIMS = {
+    "tiny": (384, 6, 4),
+    "base": (512, 8, 6),
+    "small": (768, 12, 12),
+    "medium": (1024, 16, 24),
+    "large": (1280, 20, 32),
+}
+# 30 s of audio is 1500 encoder frames, the window Whisper always processes.
+BENCHMARK_FRAMES = 1500
+BENCHMARK_REPEATS = 3
+
+_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class DeviceProbe:
+    device: str
+    available: bool
+    supports_fp16: bool = False
+    name: Optional[str] = None
+
+
+@dataclass
+class DeviceCapabilities:
+    fingerprint: str
+    hardware: Dict[str, Any]
+    probes: Dict[str, DeviceProbe]
+    # model size -> device -> estimated encoder seconds per 30 s window;
+    # None records a device that failed the benchmark.
+    benchmarks: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+
+    def available_devices(self) -> list[str]:
+        return [
+            device
+            for device in DEVICE_PREFERENCE
+            if device in self.probes and self.probes[device].available
+        ]
+
+
+def model_size(model_name: str) -> Optional[str]:
+    """Map a Whisper model name (``base.en``, ``large-v3-turbo``) to its size."""
+    name = model_name.removesuffix(".en")
+    if name.startswith("large"):
+        return "large"
+    return name if name in WHISPER_ENCODER_DIMS else None
+
+
+class DeviceCapabilityCache:
+    """DeviceCapabilityCache
+
+    Responsibility:
+        Know which inference devices this machine offers and which one runs
+        a given Whisper size fastest. Availability and fp16 support are
+        probed once per process; they and the micro-benchmark results are
+        persisted under ``~/.sona`` keyed by a fingerprint of the torch build
+        and hardware, so they are measured again only after an upgrade.
+
+        The micro-benchmark runs one randomly initialised Whisper encoder
+        block on a 30 s window on each available device, in the precision
+        Whisper would use there, and scales it by the encoder depth. It
+        exercises the same kernels as the real model, so devices that are
+        slow for a size or fall back to CPU for some ops lose.
+
+    Interface:
+        * get_instance() -> DeviceCapabilityCache
+        * capabilities() -> Optional[DeviceCapabilities]: None without torch
+        * benchmarks_for(model_name) -> dict[str, Optional[float]]
+        * fastest_device(model_name) -> Optional[str]
+    """
+
+    CAPABILITIES_PATH: Path = Path.home() / ".sona" / "device_capabilities.json"
+
+    _instance: Optional[DeviceCapabilityCache] = None
+    _instance_lock = Lock()
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._capabilities: Optional[DeviceCapabilities] = None
+        self._probed = False
+
+    @classmethod
+    def get_instance(cls) -> DeviceCapabilityCache:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = DeviceCapabilityCache()
+            return cls._instance
+
+    def capabilities(self) -> Optional[DeviceCapabilities]:
+        with self._lock:
+            return self._capabilities_locked()
+
+    def benchmarks_for(self, model_name: str) -> Dict[str, Optional[float]]:
+        """Return seconds per device for the model's size, measuring once."""
+        size = model_size(model_name)
+        if size is None:
+            return {}
+        with self._lock:
+            capabilities = self._capabilities_locked()
+            if capabilities is None:
+                return {}
+            measured = capabilities.benchmarks.setdefault(size, {})
+            missing = [d for d in capabilities.available_devices() if d not in measured]
+            if missing:
+                try:
+                    from whisper.model import ResidualAttentionBlock  # type: ignore
+                except Exception:
+                    # Nothing is recorded, so the benchmark runs once whisper
+                    # is installed.
+                    return dict(measured)
+                for device in missing:
+                    measured[device] = _benchmark_encoder(
+                        ResidualAttentionBlock,
+                        device,
+                        size,
+                        capabilities.probes[device].supports_fp16,
+                    )
+                self._write_persisted(capabilities)
+            for device, seconds in measured.items():
+                if seconds is not None:
+                    DEVICE_BENCHMARK_SECONDS.labels(device=device, model_size=size).set(
+                        seconds
+                    )
+            return dict(measured)
+
+    def fastest_device(self, model_name: str) -> Optional[str]:
+        measured = {
+            device: seconds
+            for device, seconds in self.benchmarks_for(model_name).items()
+            if seconds is not None
+        }
+        if not measured:
+            return None
+        return min(measured, key=measured.__getitem__)
+
+    def _capabilities_locked(self) -> Optional[DeviceCapabilities]:
+        if self._probed:
+            return self._capabilities
+        self._probed = True
+        try:
+            import torch  # type: ignore
+        except Exception:
+            return None
+
+        hardware = _hardware_description(torch)
+        fingerprint = hashlib.sha256(
+            json.dumps(hardware, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        capabilities = self._read_persisted(fingerprint)
+        if capabilities is None:
+            capabilities = DeviceCapabilities(
+                fingerprint=fingerprint,
+                hardware=hardware,
+                probes=_probe_devices(torch),
+            )
+            self._write_persisted(capabilities)
+        self._capabilities = capabilities
+        return capabilities
+
+    def _read_persisted(self, fingerprint: str) -> Optional[DeviceCapabilities]:
+        try:
+            if not self.CAPABILITIES_PATH.exists():
+                return None
+            with self.CAPABILITIES_PATH.open("r", encoding="utf-8") as capabilities_file:
+                data = json.load(capabilities_file)
+            if data.get("version") != _CACHE_FORMAT_VERSION:
+                return None
+            entry = data.get("entries", {}).get(fingerprint)
+            if entry is None:
+                return None
+            return DeviceCapabilities(
+                fingerprint=fingerprint,
+                hardware=entry["hardware"],
+                probes={
+                    device: DeviceProbe(**probe) for device, probe in entry["probes"].items()
+                },
+                benchmarks=entry.get("benchmarks", {}),
+            )
+        except Exception as exc:
+            print(f"[WARNING] Ignoring unreadable device capability cache: {exc}")
+            return None
+
+    def _write_persisted(self, capabilities: DeviceCapabilities) -> None:
+        # Entries for other torch builds are kept so switching virtualenvs
+        # does not re-run the benchmarks.
+        try:
+            data: Dict[str, Any] = {"version": _CACHE_FORMAT_VERSION, "entries": {}}
+            if self.CAPABILITIES_PATH.exists():
+                with self.CAPABILITIES_PATH.open("r", encoding="utf-8") as capabilities_file:
+                    existing = json.load(capabilities_file)
+                if existing.get("version") == _CACHE_FORMAT_VERSION:
+                    data = existing
+            entry = asdict(capabilities)
+            del entry["fingerprint"]
+            data["entries"][capabilities.fingerprint] = entry
+            self.CAPABILITIES_PATH.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.CAPABILITIES_PATH.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as capabilities_file:
+                json.dump(data, capabilities_file, indent=2)
+            temp_path.replace(self.CAPABILITIES_PATH)
+        except Exception as exc:
+            print(f"[WARNING] Failed to persist device capabilities: {exc}")
+
+
+def _hardware_description(torch: Any) -> Dict[str, Any]:
+    return {
+        "torch_version": str(torch.__version__),
+        "torch_cuda_version": getattr(torch.version, "cuda", None),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _probe_devices(torch: Any) -> Dict[str, DeviceProbe]:
+    probes = {"cpu": DeviceProbe(device="cpu", available=True)}
+
+    try:
+        mps_backend = getattr(torch.backends, "mps", None)
+        mps_available = bool(mps_backend and mps_backend.is_available())
+    except Exception:
+        mps_available = False
+    probes["mps"] = DeviceProbe(device="mps", available=mps_available, supports_fp16=mps_available)
+
+    cuda_probe = DeviceProbe(device="cuda", available=False)
+    try:
+        if torch.cuda.is_available():
+            cuda_probe.available = True
+            cuda_probe.name = torch.cuda.get_device_name(0)
+            # fp16 pays off from compute capability 5.3 (Maxwell) onwards.
+            cuda_probe.supports_fp16 = tuple(torch.cuda.get_device_capability(0)) >= (5, 3)
+    except Exception:
+        # If capability probing fails, default to fp16 when CUDA is available.
+        cuda_probe.supports_fp16 = cuda_probe.available
+    probes["cuda"] = cuda_probe
+    return probes
+
+
+def _benchmark_encoder(
+    block_class: Any, device: str, size: str, fp16: bool
+) -> Optional[float]:
+    """Estimate encoder seconds per 30 s window for ``size`` on ``device``."""
+    n_state, n_head, n_layer = WHISPER_ENCODER_DIMS[size]
+    try:
+        import torch  # type: ignore
+
+        dtype = torch.float16 if fp16 else torch.float32
+        with torch.inference_mode():
+            block = block_class(n_state, n_head).to(device)
+            frames = torch.randn(1, BENCHMARK_FRAMES, n_state, device=device, dtype=dtype)
+            # The first call pays for kernel compilation and allocation.
+            block(frames)
+            _synchronize(torch, device)
+            started_at = time.perf_counter()
+            for _ in range(BENCHMARK_REPEATS):
+                block(frames)
+            _synchronize(torch, device)
+            per_block = (time.perf_counter() - started_at) / BENCHMARK_REPEATS
+        seconds = per_block * n_layer
+        print(f"[INFO] Device benchmark: Whisper {size} encoder on {device} ~{seconds * 1000:.0f} ms")
+        return seconds
+    except Exception as exc:
+        print(f"[WARNING] Device benchmark for {size} on {device} failed: {exc}")
+        return None
+    finally:
+        DeviceCleanupServiceImpl().clear_cache(device)
+
+
+def _synchronize(torch: Any, device: str) -> None:
+    if device == "cuda":
+        torch.cuda.synchronize()
+    elif device == "mps":
+        torch.mps.synchronize()
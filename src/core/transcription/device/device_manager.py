@@ -1,3 +1,5 @@
+from typing import Dict, Optional
+
 from src.core.transcription.device.device_cleanup_service import (
     DeviceCleanupServiceImpl,
 )
@@ -8,9 +10,15 @@ class DeviceManager:
     def __init__(self):
         self._device_selector = DeviceSelectorImpl()
         self.device_cleanup_service = DeviceCleanupServiceImpl()
+        self._platform_devices: Dict[Optional[str], str] = {}
 
-    def get_platform_device(self):
-        return self._device_selector.select_device()
+    def get_platform_device(self, model_name: Optional[str] = None):
+        # Selection may benchmark the devices the first time; do it once.
+        if model_name not in self._platform_devices:
+            self._platform_devices[model_name] = self._device_selector.select_device(
+                model_name
+            )
+        return self._platform_devices[model_name]
 
-    def clear_device_cache(self):
-        self.device_cleanup_service.clear_cache(self.get_platform_device())
+    def clear_device_cache(self, device: Optional[str] = None):
+        self.device_cleanup_service.clear_cache(device or self.get_platform_device())
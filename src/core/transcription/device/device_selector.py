@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import Optional, Protocol, runtime_checkable
+
+from src.core.transcription.device.device_capability_cache import (
+    DeviceCapabilityCache,
+)
 
 
 @runtime_checkable
@@ -13,12 +17,12 @@ class DeviceSelector(Protocol):
         isolated from transcription logic.
 
     Interface:
-        * select_device() -> str
+        * select_device(model_name=None) -> str
         * supports_fp16(device: str) -> bool
     """
 
-    def select_device(self) -> str:
-        """Return the selected device string."""
+    def select_device(self, model_name: Optional[str] = None) -> str:
+        """Return the selected device string, optionally for a specific model."""
 
     def supports_fp16(self, device: str) -> bool:
         """Return True if fp16 is usable on the given device."""
@@ -29,75 +33,46 @@ class DeviceSelectorImpl(DeviceSelector):
 
     Responsibility:
         Provide a concrete, platform-aware device selection strategy for
-        Whisper inference. Probes Torch backends lazily to decide between
-        "mps", "cuda", and "cpu", and reports fp16 support for the chosen
-        device.
+        Whisper inference. Availability and fp16 support come from the
+        :class:`DeviceCapabilityCache`, so torch is probed once per process
+        rather than on every call. When a model is given, the device that
+        measured fastest for its size wins; otherwise (or before anything
+        could be measured) the order is MPS, then CUDA, then CPU.
 
     Interface:
-        * select_device() -> str: Prefer MPS on Apple Silicon, then CUDA, else CPU.
+        * select_device(model_name=None) -> str
         * supports_fp16(device: str) -> bool: Indicates whether half-precision is
           advisable for the given device.
     """
 
-    def _is_mps_available(self) -> bool:
-        """Check if MPS backend is available in torch."""
-        try:
-            import torch
-            return getattr(torch.backends, "mps", None) and torch.backends.mps.is_available()
-        except Exception:
-            return False
+    def __init__(self, capability_cache: Optional[DeviceCapabilityCache] = None) -> None:
+        self._capability_cache = capability_cache or DeviceCapabilityCache.get_instance()
 
-    def select_device(self) -> str:
-        """Select the best available device.
-        Decision order (lazy):
-        1. MPS if torch with MPS backend is available.
-        2. CUDA if torch with CUDA is available.
-        3. CPU as fallback.
+    def select_device(self, model_name: Optional[str] = None) -> str:
+        """Select the fastest measured device for ``model_name``.
+
+        Decision order:
+        1. The device with the lowest micro-benchmark time for the model size.
+        2. MPS, then CUDA, when available.
+        3. CPU as fallback (also without torch).
         """
-        try:
-            import torch  # Lazy import to avoid startup latency
-        except Exception:
+        capabilities = self._capability_cache.capabilities()
+        if capabilities is None:
             return "cpu"
 
-        # Prefer Apple Silicon MPS when available.
-        if self._is_mps_available():
-            return "mps"
-
-        # Next prefer CUDA on NVIDIA GPUs.
-        try:
-            if torch.cuda.is_available():
-                return "cuda"
-        except Exception:
-            pass
+        if model_name:
+            fastest = self._capability_cache.fastest_device(model_name)
+            if fastest is not None:
+                return fastest
 
-        # Fallback to CPU.
-        return "cpu"
+        available = capabilities.available_devices()
+        return available[0] if available else "cpu"
 
     def supports_fp16(self, device: str) -> bool:
-        """Return True if using fp16 is likely beneficial and supported.
-        """
-        if device == "cpu":
+        """Return True if using fp16 is likely beneficial and supported."""
+        capabilities = self._capability_cache.capabilities()
+        if capabilities is None:
             return False
-
-        if device == "mps":
-            return self._is_mps_available()
-
-        if device == "cuda":
-            try:
-                import torch
-                if not torch.cuda.is_available():
-                    return False
-                # Optional: check device capability; most modern GPUs support fp16.
-                try:
-                    major, minor = torch.cuda.get_device_capability(0)
-                    # Enable fp16 for compute capability >= 5.3 (Maxwell and newer).
-                    return (major, minor) >= (5, 3)
-                except Exception:
-                    # If capability probing fails, default to True when CUDA is available.
-                    return True
-            except Exception:
-                return False
-
         # Unknown device strings: be conservative.
-        return False
-
+        probe = capabilities.probes.get(device)
+        return bool(probe and probe.available and probe.supports_fp16)
@@ -1,22 +1,137 @@
 """
-Download a Whisper model by name using Whisper's load_model.
-This function only ensures the model is present in the local cache.
+Download a Whisper model by name into the local Whisper cache.
+Uses the resumable downloader and reports byte progress through the event bus.
 """
 
+import time
+from threading import Event as CancelEvent
+from threading import Lock
+from typing import Optional
+
+from src.core.transcription.model_downloader import (
+    DownloadCancelledError,
+    ResumableDownloader,
+)
 from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import (
+    ModelDownloadComplete,
+    ModelDownloadProgress,
+)
 from src.event_management.events import Event
+from src.metrics.runtime_metrics import (
+    MODEL_DOWNLOAD_BYTES_TOTAL,
+    MODEL_DOWNLOADS_TOTAL,
+    PIPELINE_ERRORS_TOTAL,
+)
 from src.runtime.shared_executor import get_shared_executor
 
+# Progress events are rate limited; the final state is always emitted.
+PROGRESS_EVENT_INTERVAL_SECONDS = 0.25
+
+_lock = Lock()
+_downloader: Optional[ResumableDownloader] = None
+
+
+def configure_model_downloader(downloader: ResumableDownloader) -> None:
+    """Replace the process-wide downloader (segments, throttle, base URL)."""
+    global _downloader
+    with _lock:
+        _downloader = downloader
+
+
+def get_model_downloader() -> ResumableDownloader:
+    global _downloader
+    with _lock:
+        if _downloader is None:
+            _downloader = ResumableDownloader()
+        return _downloader
 
-def download_whisper_model(model_name: str) -> None:
-    try:
-        import whisper
 
-        whisper.load_model(model_name, device="cpu")
-        EventMessenger.get_instance().emit(Event.MODEL_DOWNLOAD_COMPLETE, model_name)
+def download_whisper_model(
+    model_name: str, cancel_event: Optional[CancelEvent] = None
+) -> None:
+    """Fetch the checkpoint file only; the model is never instantiated."""
+    messenger = EventMessenger.get_instance()
+    messenger.emit(
+        Event.MODEL_DOWNLOAD_PROGRESS,
+        ModelDownloadProgress(model_name=model_name, state="started"),
+    )
+    reporter = _ProgressReporter(model_name, messenger)
+    try:
+        get_model_downloader().download_model(
+            model_name, progress=reporter, cancel_event=cancel_event
+        )
+        MODEL_DOWNLOADS_TOTAL.labels(state="completed").inc()
+        messenger.emit(
+            Event.MODEL_DOWNLOAD_PROGRESS,
+            ModelDownloadProgress(
+                model_name=model_name,
+                state="completed",
+                downloaded_bytes=reporter.downloaded_bytes,
+                total_bytes=reporter.total_bytes,
+            ),
+        )
+        messenger.emit(
+            Event.MODEL_DOWNLOAD_COMPLETE, ModelDownloadComplete(model_name=model_name)
+        )
+    except DownloadCancelledError:
+        # The .part file is kept so a later download resumes from it.
+        MODEL_DOWNLOADS_TOTAL.labels(state="cancelled").inc()
+        messenger.emit(
+            Event.MODEL_DOWNLOAD_PROGRESS,
+            ModelDownloadProgress(
+                model_name=model_name,
+                state="cancelled",
+                downloaded_bytes=reporter.downloaded_bytes,
+                total_bytes=reporter.total_bytes,
+            ),
+        )
     except Exception as exc:
+        MODEL_DOWNLOADS_TOTAL.labels(state="failed").inc()
+        PIPELINE_ERRORS_TOTAL.labels(stage="download").inc()
+        messenger.emit(
+            Event.MODEL_DOWNLOAD_PROGRESS,
+            ModelDownloadProgress(model_name=model_name, state="failed", error=str(exc)),
+        )
         raise RuntimeError(f"Failed to download Whisper model '{model_name}'") from exc
 
 
-def download_model_async(model_name: str) -> None:
-    get_shared_executor().submit(download_whisper_model, model_name)
+def download_model_async(
+    model_name: str, cancel_event: Optional[CancelEvent] = None
+) -> None:
+    get_shared_executor().submit(download_whisper_model, model_name, cancel_event)
+
+
+class _ProgressReporter:
+    """Turn downloader callbacks into metrics and rate-limited progress events."""
+
+    def __init__(self, model_name: str, messenger: EventMessenger) -> None:
+        self._model_name = model_name
+        self._messenger = messenger
+        self._last_emitted_at = 0.0
+        self._last_counted: Optional[int] = None
+        self.downloaded_bytes = 0
+        self.total_bytes: Optional[int] = None
+
+    def __call__(self, downloaded_bytes: int, total_bytes: Optional[int]) -> None:
+        # The first report is where a resumed download starts; only bytes
+        # transferred from then on count towards the metric.
+        if self._last_counted is not None and downloaded_bytes > self._last_counted:
+            MODEL_DOWNLOAD_BYTES_TOTAL.inc(downloaded_bytes - self._last_counted)
+        self._last_counted = downloaded_bytes
+        self.downloaded_bytes = downloaded_bytes
+        self.total_bytes = total_bytes
+
+        now = time.monotonic()
+        if now - self._last_emitted_at < PROGRESS_EVENT_INTERVAL_SECONDS:
+            return
+        self._last_emitted_at = now
+        self._messenger.emit(
+            Event.MODEL_DOWNLOAD_PROGRESS,
+            ModelDownloadProgress(
+                model_name=self._model_name,
+                state="downloading",
+                downloaded_bytes=downloaded_bytes,
+                total_bytes=total_bytes,
+            ),
+        )
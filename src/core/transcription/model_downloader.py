@@ -0,0 +1,517 @@
+"""Resumable, segmented HTTP downloader for Whisper checkpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, List, Optional, Sequence, Tuple
+
+from src.metrics.runtime_metrics import MODEL_SOURCE_RESOLUTIONS_TOTAL
+from src.server.models.repository.model_constants import (
+    MODEL_DOWNLOAD_URLS,
+    MODELS_INFO,
+    WHISPER_CACHE_DIR,
+    WHISPER_DOWNLOAD_BASE_URL,
+    expected_sha256,
+)
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+
+class DownloadError(RuntimeError):
+    """The download could not be completed."""
+
+
+class DownloadCancelledError(DownloadError):
+    """The download was cancelled; partial data is kept for a later resume."""
+
+
+class ChecksumMismatchError(DownloadError):
+    """The downloaded bytes do not match the expected SHA-256."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting throughput to ``rate`` bytes per second.
+
+    Shared by all segments of a download so the limit applies to the total.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self._rate = float(rate)
+        self._capacity = float(burst if burst is not None else rate)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int, cancel_event: Optional[threading.Event] = None) -> None:
+        # Requests larger than the bucket are paid for in capacity-sized slices.
+        remaining = float(amount)
+        while remaining > 0:
+            portion = min(remaining, self._capacity)
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= portion:
+                    self._tokens -= portion
+                    remaining -= portion
+                    continue
+                wait_seconds = (portion - self._tokens) / self._rate
+            if cancel_event is not None:
+                if cancel_event.wait(wait_seconds):
+                    raise DownloadCancelledError("Download cancelled")
+            else:
+                time.sleep(wait_seconds)
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int  # inclusive
+    done: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.start + self.done > self.end
+
+
+class ResumableDownloader:
+    """ResumableDownloader
+
+    Responsibility:
+        Download model checkpoints over HTTP(S) with ``urllib`` only. Partial
+        data lives in ``<file>.part`` and is resumed with ``Range`` requests
+        after an interruption. Large files can be fetched as parallel byte
+        ranges, whose progress is recorded in ``<file>.part.json``. The
+        SHA-256 is computed while streaming (for segmented downloads, over the
+        contiguous prefix as it completes) and checked before the file is
+        moved into the cache. An optional token bucket caps bandwidth.
+        Models are tried from LAN mirrors first, then from the base URL;
+        every source serves the same ``<sha256>/<file>.pt`` layout, so a
+        ``.part`` left by one source is resumed from the next.
+
+    Interface:
+        * download_model(model_name, progress=None, cancel_event=None) -> Path
+        * fetch(url, destination, expected_sha256=None, progress=None,
+          cancel_event=None) -> Path
+        * model_url(model_name, base_url=None) -> str: honours the injected
+          base URL
+    """
+
+    CHUNK_BYTES = 256 * 1024
+    # Files smaller than this are never split into segments.
+    MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+    STATE_SAVE_INTERVAL_BYTES = 4 * 1024 * 1024
+    RETRIES = 3
+
+    def __init__(
+        self,
+        base_url: str = WHISPER_DOWNLOAD_BASE_URL,
+        cache_dir: Path = WHISPER_CACHE_DIR,
+        segments: int = 1,
+        max_bytes_per_second: Optional[float] = None,
+        timeout: float = 30.0,
+        mirror_urls: Sequence[str] = (),
+        use_upstream: bool = True,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._mirror_urls = [url.rstrip("/") for url in mirror_urls]
+        self._use_upstream = use_upstream
+        self._cache_dir = cache_dir
+        self._segments = max(1, segments)
+        self._max_bytes_per_second = max_bytes_per_second
+        self._timeout = timeout
+
+    def model_url(self, model_name: str, base_url: Optional[str] = None) -> str:
+        upstream_url = MODEL_DOWNLOAD_URLS.get(model_name)
+        if upstream_url is None:
+            raise ValueError(f"No download URL known for model '{model_name}'")
+        return (base_url or self._base_url) + upstream_url[len(WHISPER_DOWNLOAD_BASE_URL) :]
+
+    def source_urls(self) -> List[str]:
+        """Base URLs in the order they are tried."""
+        return self._mirror_urls + ([self._base_url] if self._use_upstream else [])
+
+    def download_model(
+        self,
+        model_name: str,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Path:
+        filename = MODELS_INFO[model_name][0]
+        sources = self.source_urls()
+        if not sources:
+            raise DownloadError("No model download sources are enabled")
+        last_error: Optional[DownloadError] = None
+        for base_url in sources:
+            try:
+                path = self.fetch(
+                    self.model_url(model_name, base_url),
+                    self._cache_dir / filename,
+                    expected_sha256=expected_sha256(model_name),
+                    progress=progress,
+                    cancel_event=cancel_event,
+                )
+                MODEL_SOURCE_RESOLUTIONS_TOTAL.labels(
+                    source="mirror" if base_url in self._mirror_urls else "upstream"
+                ).inc()
+                return path
+            except DownloadCancelledError:
+                raise
+            except DownloadError as exc:
+                last_error = exc
+                if base_url != sources[-1]:
+                    print(f"[WARNING] Model source {base_url} failed ({exc}); trying next")
+        assert last_error is not None
+        raise last_error
+
+    def fetch(
+        self,
+        url: str,
+        destination: Path,
+        expected_sha256: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Path:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        part_path = destination.with_name(destination.name + PART_SUFFIX)
+        state_path = destination.with_name(destination.name + STATE_SUFFIX)
+        throttle = (
+            TokenBucket(self._max_bytes_per_second)
+            if self._max_bytes_per_second
+            else None
+        )
+        report = progress or (lambda downloaded, total: None)
+
+        total, accepts_ranges = self._probe(url)
+        if (
+            self._segments > 1
+            and accepts_ranges
+            and total is not None
+            and total >= self.MIN_SEGMENT_BYTES
+        ):
+            digest = self._fetch_segmented(
+                url, part_path, state_path, total, throttle, report, cancel_event
+            )
+        else:
+            if state_path.exists():
+                # A preallocated segmented .part cannot be resumed sequentially.
+                part_path.unlink(missing_ok=True)
+                state_path.unlink()
+            digest = self._fetch_sequential(
+                url, part_path, total, accepts_ranges, throttle, report, cancel_event
+            )
+
+        if expected_sha256 is not None and digest != expected_sha256:
+            part_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            raise ChecksumMismatchError(
+                f"SHA-256 mismatch for {destination.name}: expected "
+                f"{expected_sha256}, got {digest}"
+            )
+        os.replace(part_path, destination)
+        state_path.unlink(missing_ok=True)
+        return destination
+
+    def _probe(self, url: str) -> Tuple[Optional[int], bool]:
+        """Return (total size, whether byte ranges are supported)."""
+        request = urllib.request.Request(url, method="HEAD")
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                length = response.headers.get("Content-Length")
+                accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+                return (int(length) if length else None), accepts_ranges
+        except urllib.error.HTTPError as exc:
+            if exc.code in (403, 405, 501):
+                # Some servers refuse HEAD; the GET path copes without a size.
+                return None, False
+            raise DownloadError(f"HTTP {exc.code} for {url}") from exc
+        except (urllib.error.URLError, OSError) as exc:
+            raise DownloadError(f"Could not reach {url}: {exc}") from exc
+
+    def _fetch_sequential(
+        self,
+        url: str,
+        part_path: Path,
+        total: Optional[int],
+        accepts_ranges: bool,
+        throttle: Optional[TokenBucket],
+        report: ProgressCallback,
+        cancel_event: Optional[threading.Event],
+    ) -> str:
+        hasher = hashlib.sha256()
+        offset = 0
+        if accepts_ranges and part_path.exists():
+            offset = part_path.stat().st_size
+            if total is not None and offset > total:
+                offset = 0
+            else:
+                # Resume: the prefix already on disk still has to be hashed.
+                self._hash_file_range(part_path, 0, offset, hasher)
+        if offset == 0:
+            part_path.write_bytes(b"")
+        report(offset, total)
+
+        written = offset
+        if total is not None and written == total:
+            return hasher.hexdigest()
+
+        def advance(position: int) -> None:
+            nonlocal written
+            written = position
+            report(position, total)
+
+        attempts = 0
+        while True:
+            try:
+                with part_path.open("r+b") as part_file:
+                    part_file.seek(written)
+                    self._stream(
+                        url, written, None, part_file, hasher, throttle, cancel_event, advance
+                    )
+                if total is not None and written < total:
+                    raise DownloadError(f"Connection closed after {written} of {total} bytes")
+                return hasher.hexdigest()
+            except _RangeIgnored:
+                # Server answered 200 to a range request; start over.
+                hasher = hashlib.sha256()
+                written = 0
+                part_path.write_bytes(b"")
+            except DownloadCancelledError:
+                raise
+            except DownloadError:
+                attempts += 1
+                if attempts > self.RETRIES or not accepts_ranges:
+                    raise
+                time.sleep(min(2**attempts, 10))
+
+    def _fetch_segmented(
+        self,
+        url: str,
+        part_path: Path,
+        state_path: Path,
+        total: int,
+        throttle: Optional[TokenBucket],
+        report: ProgressCallback,
+        cancel_event: Optional[threading.Event],
+    ) -> str:
+        segments = self._load_segments(part_path, state_path, total)
+        state_lock = threading.Lock()
+        # Serialises writers of the shared temp file and its replace().
+        save_lock = threading.Lock()
+        errors: List[BaseException] = []
+        stop_event = threading.Event()
+
+        def downloaded_bytes() -> int:
+            return sum(segment.done for segment in segments)
+
+        def save_state() -> None:
+            with state_lock:
+                payload = {
+                    "total": total,
+                    "segments": [[s.start, s.end, s.done] for s in segments],
+                }
+            with save_lock:
+                temp_path = state_path.with_suffix(".tmp")
+                temp_path.write_text(json.dumps(payload), encoding="utf-8")
+                temp_path.replace(state_path)
+
+        def worker(segment: _Segment) -> None:
+            unsaved = 0
+            attempts = 0
+            try:
+                with part_path.open("r+b") as part_file:
+                    while not segment.complete:
+                        if stop_event.is_set():
+                            return
+                        part_file.seek(segment.start + segment.done)
+
+                        def advance(position: int) -> None:
+                            nonlocal unsaved
+                            with state_lock:
+                                written = position - (segment.start + segment.done)
+                                segment.done += written
+                            unsaved += written
+                            if unsaved >= self.STATE_SAVE_INTERVAL_BYTES:
+                                unsaved = 0
+                                save_state()
+
+                        try:
+                            self._stream(
+                                url,
+                                segment.start + segment.done,
+                                segment.end,
+                                part_file,
+                                None,
+                                throttle,
+                                stop_event,
+                                advance,
+                            )
+                        except DownloadCancelledError:
+                            raise
+                        except DownloadError:
+                            attempts += 1
+                            if attempts > self.RETRIES:
+                                raise
+                            time.sleep(min(2**attempts, 10))
+            except BaseException as exc:
+                errors.append(exc)
+                stop_event.set()
+
+        threads = [
+            threading.Thread(
+                target=worker,
+                args=(segment,),
+                name=f"model-download-{index}",
+                daemon=True,
+            )
+            for index, segment in enumerate(segments)
+            if not segment.complete
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Hash the contiguous prefix as it completes; the bytes are read back
+        # while they are still in the page cache.
+        hasher = hashlib.sha256()
+        hashed_upto = 0
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                stop_event.set()
+            alive = any(thread.is_alive() for thread in threads)
+            with state_lock:
+                frontier = self._contiguous_prefix(segments)
+            if frontier > hashed_upto:
+                self._hash_file_range(part_path, hashed_upto, frontier, hasher)
+                hashed_upto = frontier
+            report(downloaded_bytes(), total)
+            if not alive:
+                break
+            time.sleep(0.2)
+
+        save_state()
+        if errors:
+            if cancel_event is not None and cancel_event.is_set():
+                raise DownloadCancelledError("Download cancelled")
+            # Other workers stop with DownloadCancelledError once one fails.
+            failures = [e for e in errors if not isinstance(e, DownloadCancelledError)]
+            cause = failures[0] if failures else errors[0]
+            raise DownloadError(f"Segmented download failed: {cause}") from cause
+        if hashed_upto != total:
+            raise DownloadError(f"Downloaded {hashed_upto} of {total} bytes")
+        return hasher.hexdigest()
+
+    def _load_segments(
+        self, part_path: Path, state_path: Path, total: int
+    ) -> List[_Segment]:
+        if part_path.exists() and state_path.exists():
+            try:
+                state = json.loads(state_path.read_text(encoding="utf-8"))
+                if state.get("total") == total and part_path.stat().st_size == total:
+                    return [_Segment(*values) for values in state["segments"]]
+            except (OSError, ValueError, TypeError):
+                pass
+
+        segment_count = min(self._segments, max(1, total // self.MIN_SEGMENT_BYTES))
+        segment_size = -(-total // segment_count)
+        segments = [
+            _Segment(start, min(start + segment_size, total) - 1)
+            for start in range(0, total, segment_size)
+        ]
+        with part_path.open("wb") as part_file:
+            part_file.truncate(total)
+        return segments
+
+    @staticmethod
+    def _contiguous_prefix(segments: List[_Segment]) -> int:
+        for segment in segments:
+            if not segment.complete:
+                return segment.start + segment.done
+        return segments[-1].end + 1 if segments else 0
+
+    def _stream(
+        self,
+        url: str,
+        start: int,
+        end: Optional[int],
+        output: BinaryIO,
+        hasher: Optional[Any],
+        throttle: Optional[TokenBucket],
+        cancel_event: Optional[threading.Event],
+        on_progress: Callable[[int], None],
+    ) -> int:
+        """Copy ``url`` bytes [start, end] into ``output``.
+
+        ``on_progress`` receives the absolute position after every flushed
+        write. Returns the final position. Only network failures become a
+        (retried) DownloadError; errors writing the part or state files
+        propagate unchanged.
+        """
+        headers = {}
+        if start > 0 or end is not None:
+            headers["Range"] = f"bytes={start}-" + ("" if end is None else str(end))
+        request = urllib.request.Request(url, headers=headers)
+        position = start
+        try:
+            response = urllib.request.urlopen(request, timeout=self._timeout)
+        except urllib.error.HTTPError as exc:
+            raise DownloadError(f"HTTP {exc.code} for {url}") from exc
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as exc:
+            raise DownloadError(f"Could not reach {url}: {exc}") from exc
+        with response:
+            if headers and response.status != 206:
+                raise _RangeIgnored()
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DownloadCancelledError("Download cancelled")
+                try:
+                    chunk = response.read(self.CHUNK_BYTES)
+                except (http.client.HTTPException, OSError) as exc:
+                    raise DownloadError(
+                        f"Connection lost after {position} bytes: {exc}"
+                    ) from exc
+                if not chunk:
+                    # http.client signals a body cut short by the peer
+                    # only through the unread Content-Length.
+                    if response.length:
+                        raise DownloadError(f"Connection closed after {position} bytes")
+                    return position
+                if throttle is not None:
+                    throttle.consume(len(chunk), cancel_event)
+                output.write(chunk)
+                # Segmented downloads hash by reading the file back.
+                output.flush()
+                if hasher is not None:
+                    hasher.update(chunk)
+                position += len(chunk)
+                on_progress(position)
+
+    def _hash_file_range(
+        self, path: Path, start: int, end: int, hasher: Any
+    ) -> None:
+        with path.open("rb") as source:
+            source.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = source.read(min(self.CHUNK_BYTES * 4, remaining))
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                remaining -= len(chunk)
+
+
+class _RangeIgnored(Exception):
+    """The server sent the whole body in reply to a range request."""
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional, Protocol, runtime_checkable
+
+from src.server.config.entity.user_config import ModelEviction
+from src.utils.process_memory import available_system_memory_bytes
+
+
+@runtime_checkable
+class EvictableTranscriber(Protocol):
+    """Transcriber surface needed to unload an idle model."""
+
+    def is_loaded(self) -> bool: ...
+
+    def idle_seconds(self) -> float: ...
+
+    def evict(self, reason: str) -> bool: ...
+
+
+class ModelIdleEvictor:
+    """ModelIdleEvictor
+
+    Responsibility:
+        Release the resident Whisper model when it is not earning its memory:
+        after a configurable idle period, or sooner when the system runs low
+        on available memory. Reloading is left to the transcriber, which loads
+        the model again transparently on its next use.
+
+    Interface:
+        * start() -> None: begin periodic checks on a daemon thread.
+        * stop() -> None: stop checking (idempotent).
+        * update_policy(policy: ModelEviction) -> None: apply new settings
+          without restarting the thread.
+        * check_once() -> Optional[str]: run one check, returning the eviction
+          reason if the model was unloaded.
+    """
+
+    MAX_POLL_INTERVAL_SECONDS = 30.0
+    MIN_POLL_INTERVAL_SECONDS = 1.0
+    # Under memory pressure, still give a just-used model a short grace period
+    # so back-to-back dictations do not thrash between load and unload.
+    PRESSURE_MIN_IDLE_SECONDS = 60.0
+
+    def __init__(
+        self, transcriber: EvictableTranscriber, policy: ModelEviction
+    ) -> None:
+        self._transcriber = transcriber
+        self._policy = policy
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="ModelIdleEvictorThread", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def update_policy(self, policy: ModelEviction) -> None:
+        self._policy = policy
+
+    def check_once(self) -> Optional[str]:
+        policy = self._policy
+        if not policy.enabled or not self._transcriber.is_loaded():
+            return None
+
+        idle_seconds = self._transcriber.idle_seconds()
+        reason = self._eviction_reason(policy, idle_seconds)
+        if reason is None:
+            return None
+        return reason if self._transcriber.evict(reason) else None
+
+    def _eviction_reason(
+        self, policy: ModelEviction, idle_seconds: float
+    ) -> Optional[str]:
+        if 0 < policy.idle_timeout_seconds <= idle_seconds:
+            return "idle"
+        if policy.min_available_memory_mb <= 0:
+            return None
+        if idle_seconds < self.PRESSURE_MIN_IDLE_SECONDS:
+            return None
+        available = available_system_memory_bytes()
+        if available is not None and available < policy.min_available_memory_mb * 1024 * 1024:
+            return "memory_pressure"
+        return None
+
+    def _poll_interval(self) -> float:
+        idle_timeout = self._policy.idle_timeout_seconds
+        if idle_timeout <= 0:
+            return self.MAX_POLL_INTERVAL_SECONDS
+        return max(
+            self.MIN_POLL_INTERVAL_SECONDS,
+            min(self.MAX_POLL_INTERVAL_SECONDS, idle_timeout / 4),
+        )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._poll_interval()):
+            try:
+                self.check_once()
+            except Exception as exc:
+                print(f"[WARNING] Model eviction check failed: {exc}")
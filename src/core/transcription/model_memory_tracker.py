@@ -0,0 +1,220 @@
+"""Measure model memory footprints and detect RSS growth across reloads."""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Deque, Dict, Optional
+
+from src.metrics.runtime_metrics import (
+    MODEL_MEASURED_FOOTPRINT_BYTES,
+    MODEL_RELOAD_RSS_RATCHET_TOTAL,
+    MODEL_RETAINED_AFTER_UNLOAD_BYTES,
+)
+from src.utils.process_memory import current_rss_bytes, format_bytes
+
+
+@dataclass
+class ModelFootprint:
+    """Memory measured around the most recent load of a model."""
+
+    model_name: str
+    device: str
+    rss_before_load_bytes: Optional[int]
+    rss_after_load_bytes: Optional[int]
+    device_allocated_bytes: Optional[int] = None
+    rss_after_unload_bytes: Optional[int] = None
+
+    @property
+    def resident_bytes(self) -> Optional[int]:
+        if self.rss_before_load_bytes is None or self.rss_after_load_bytes is None:
+            return None
+        return max(0, self.rss_after_load_bytes - self.rss_before_load_bytes)
+
+    @property
+    def retained_after_unload_bytes(self) -> Optional[int]:
+        if self.rss_before_load_bytes is None or self.rss_after_unload_bytes is None:
+            return None
+        return self.rss_after_unload_bytes - self.rss_before_load_bytes
+
+
+class ModelMemoryTracker:
+    """ModelMemoryTracker
+
+    Responsibility:
+        Sample resident memory before and after every model load and unload,
+        keep the measured footprint per model (persisted under ``~/.sona`` so
+        it survives restarts) and warn when the post-unload RSS keeps ratcheting
+        upward across reloads, which indicates that teardown does not release
+        the model. Per-load and per-unload measurements are exported as
+        metrics and returned to the caller rather than logged.
+
+    Interface:
+        * get_instance() -> ModelMemoryTracker
+        * on_load_started(model_name) -> None
+        * on_load_finished(model_name, device) -> ModelFootprint
+        * on_unload_finished(model_name) -> None
+        * measured_footprint_bytes(model_name) -> Optional[int]
+        * unload_rss_history() -> list[int]
+        * is_ratcheting() -> bool
+    """
+
+    FOOTPRINTS_PATH: Path = Path.home() / ".sona" / "model_footprints.json"
+    # Warn once RSS after unload grew on this many consecutive reloads...
+    RATCHET_WINDOW = 3
+    # ...by at least this much in total (small allocator noise is expected).
+    RATCHET_MIN_GROWTH_BYTES = 64 * 1024 * 1024
+    HISTORY_SIZE = 50
+
+    _instance: Optional[ModelMemoryTracker] = None
+    _instance_lock = Lock()
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pending_rss_before_load: Dict[str, Optional[int]] = {}
+        self._footprints: Dict[str, ModelFootprint] = {}
+        self._persisted: Dict[str, Dict[str, Any]] = self._read_persisted()
+        self._unload_rss_history: Deque[int] = deque(maxlen=self.HISTORY_SIZE)
+
+    @classmethod
+    def get_instance(cls) -> ModelMemoryTracker:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = ModelMemoryTracker()
+            return cls._instance
+
+    def on_load_started(self, model_name: str) -> None:
+        rss = current_rss_bytes()
+        with self._lock:
+            self._pending_rss_before_load[model_name] = rss
+
+    def on_load_finished(self, model_name: str, device: str) -> ModelFootprint:
+        rss_after_load = current_rss_bytes()
+        with self._lock:
+            footprint = ModelFootprint(
+                model_name=model_name,
+                device=device,
+                rss_before_load_bytes=self._pending_rss_before_load.pop(model_name, None),
+                rss_after_load_bytes=rss_after_load,
+                device_allocated_bytes=_device_allocated_bytes(device),
+            )
+            self._footprints[model_name] = footprint
+            measured = self._measured_bytes_locked(model_name)
+            measured_now = (
+                footprint.resident_bytes is not None
+                or bool(footprint.device_allocated_bytes)
+            )
+            if measured is not None and measured_now:
+                self._persisted[model_name] = {
+                    "device": device,
+                    "measured_bytes": measured,
+                }
+                self._write_persisted()
+        if measured is not None and measured_now:
+            MODEL_MEASURED_FOOTPRINT_BYTES.labels(model=model_name, device=device).set(
+                measured
+            )
+        return footprint
+
+    def on_unload_finished(self, model_name: str) -> None:
+        rss_after_unload = current_rss_bytes()
+        if rss_after_unload is None:
+            return
+        with self._lock:
+            footprint = self._footprints.get(model_name)
+            if footprint is not None:
+                footprint.rss_after_unload_bytes = rss_after_unload
+            self._unload_rss_history.append(rss_after_unload)
+            ratcheting = self._is_ratcheting_locked()
+            recent_samples = list(self._unload_rss_history)[-(self.RATCHET_WINDOW + 1) :]
+            retained = footprint.retained_after_unload_bytes if footprint else None
+
+        if retained is not None:
+            MODEL_RETAINED_AFTER_UNLOAD_BYTES.labels(model=model_name).set(retained)
+        if ratcheting:
+            MODEL_RELOAD_RSS_RATCHET_TOTAL.inc()
+            samples = ", ".join(str(format_bytes(value)) for value in recent_samples)
+            print(
+                "[WARNING] Resident memory keeps growing across model reloads "
+                f"(post-unload RSS: {samples}). The model may not be fully "
+                "released on teardown."
+            )
+
+    def measured_footprint_bytes(self, model_name: str) -> Optional[int]:
+        with self._lock:
+            return self._measured_bytes_locked(model_name)
+
+    def footprint(self, model_name: str) -> Optional[ModelFootprint]:
+        with self._lock:
+            return self._footprints.get(model_name)
+
+    def unload_rss_history(self) -> list[int]:
+        with self._lock:
+            return list(self._unload_rss_history)
+
+    def is_ratcheting(self) -> bool:
+        with self._lock:
+            return self._is_ratcheting_locked()
+
+    def _measured_bytes_locked(self, model_name: str) -> Optional[int]:
+        footprint = self._footprints.get(model_name)
+        if footprint is not None:
+            resident = footprint.resident_bytes
+            # On GPUs the weights live in device memory rather than in RSS.
+            if footprint.device_allocated_bytes:
+                return max(resident or 0, footprint.device_allocated_bytes)
+            if resident is not None:
+                return resident
+        # Without an RSS probe nothing new was measured; keep the last value.
+        persisted = self._persisted.get(model_name)
+        if persisted is not None:
+            return persisted.get("measured_bytes")
+        return None
+
+    def _is_ratcheting_locked(self) -> bool:
+        history = list(self._unload_rss_history)[-(self.RATCHET_WINDOW + 1) :]
+        if len(history) <= self.RATCHET_WINDOW:
+            return False
+        strictly_growing = all(
+            later > earlier for earlier, later in zip(history, history[1:])
+        )
+        return strictly_growing and (
+            history[-1] - history[0] >= self.RATCHET_MIN_GROWTH_BYTES
+        )
+
+    def _read_persisted(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            if not self.FOOTPRINTS_PATH.exists():
+                return {}
+            with self.FOOTPRINTS_PATH.open("r", encoding="utf-8") as footprints_file:
+                data = json.load(footprints_file)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _write_persisted(self) -> None:
+        try:
+            self.FOOTPRINTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.FOOTPRINTS_PATH.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as footprints_file:
+                json.dump(self._persisted, footprints_file, indent=2)
+            temp_path.replace(self.FOOTPRINTS_PATH)
+        except Exception as exc:
+            print(f"[WARNING] Failed to persist model footprints: {exc}")
+
+
+def _device_allocated_bytes(device: str) -> Optional[int]:
+    """Return memory currently allocated by torch on an accelerator, if any."""
+    if device not in ("cuda", "mps"):
+        return None
+    try:
+        import torch  # type: ignore
+
+        if device == "cuda":
+            return int(torch.cuda.memory_allocated())
+        return int(torch.mps.current_allocated_memory())
+    except Exception:
+        return None
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import threading
+from typing import List, Optional
+
+from .output_backend import OutputBackend
+
+
+class FakeOutputBackend(OutputBackend):
+    """In-memory backend for headless runs and benchmarks.
+
+    Records every copied text and paste request instead of touching the
+    desktop, so the real result handler can run on CI machines.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.clipboard: Optional[str] = None
+        self.copied: List[str] = []
+        self.paste_count = 0
+        self.closed = False
+
+    def copy_to_clipboard(self, text: str) -> None:
+        with self._lock:
+            self.clipboard = text
+            self.copied.append(text)
+
+    def read_clipboard(self) -> Optional[str]:
+        with self._lock:
+            return self.clipboard
+
+    def paste(self) -> None:
+        with self._lock:
+            self.paste_count += 1
+
+    def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from typing import List, Optional
+
+from .output_backend import KeyboardPaster, OutputBackend
+
+
+class LinuxOutputBackend(OutputBackend):
+    """LinuxOutputBackend
+
+    Responsibility:
+        Copy through ``wl-copy`` on Wayland or ``xclip``/``xsel`` on X11 and
+        paste with Ctrl+V. The helper is resolved once at construction.
+
+        These helpers read stdin until EOF and then fork a short-lived owner
+        that serves the selection, so there is no long-lived pipe to keep
+        open: each copy runs the helper to completion, and the owner left
+        behind is replaced by the next copy.
+
+    Interface:
+        * copy_to_clipboard(text: str) -> None
+        * read_clipboard() -> Optional[str]
+        * paste() -> None
+        * close() -> None
+    """
+
+    COPY_TIMEOUT_SECONDS = 2
+    READ_COMMANDS = {
+        "wl-copy": ["wl-paste", "--no-newline"],
+        "xclip": ["xclip", "-selection", "clipboard", "-o"],
+        "xsel": ["xsel", "--clipboard", "--output"],
+    }
+
+    def __init__(self, copy_command: Optional[List[str]] = None) -> None:
+        self._copy_command = copy_command or self._detect_copy_command()
+        self._paster = KeyboardPaster("ctrl")
+
+    @property
+    def copy_command(self) -> Optional[List[str]]:
+        return self._copy_command
+
+    def copy_to_clipboard(self, text: str) -> None:
+        if self._copy_command is None:
+            raise RuntimeError("No clipboard helper found; install wl-clipboard or xclip")
+        completed = subprocess.run(
+            self._copy_command,
+            input=text.encode("utf-8"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=self.COPY_TIMEOUT_SECONDS,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"{self._copy_command[0]} exited with status {completed.returncode}"
+            )
+
+    def read_clipboard(self) -> Optional[str]:
+        read_command = (
+            self.READ_COMMANDS.get(self._copy_command[0]) if self._copy_command else None
+        )
+        if read_command is None or shutil.which(read_command[0]) is None:
+            return None
+        completed = subprocess.run(
+            read_command,
+            capture_output=True,
+            timeout=self.COPY_TIMEOUT_SECONDS,
+            check=False,
+        )
+        if completed.returncode != 0:
+            return None
+        return completed.stdout.decode("utf-8", errors="replace")
+
+    def paste(self) -> None:
+        self._paster.paste()
+
+    def close(self) -> None:
+        return None
+
+    @staticmethod
+    def _detect_copy_command() -> Optional[List[str]]:
+        candidates: List[List[str]] = []
+        if os.environ.get("WAYLAND_DISPLAY"):
+            candidates.append(["wl-copy"])
+        candidates.append(["xclip", "-selection", "clipboard"])
+        candidates.append(["xsel", "--clipboard", "--input"])
+        for command in candidates:
+            if shutil.which(command[0]) is not None:
+                return command
+        return None
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import subprocess
+from typing import Any, Optional
+
+from .output_backend import KeyboardPaster, OutputBackend
+
+
+class MacOSOutputBackend(OutputBackend):
+    """MacOSOutputBackend
+
+    Responsibility:
+        Write to the general pasteboard in-process through AppKit when pyobjc
+        is installed, avoiding a ``pbcopy`` process per result. Falls back to
+        ``pbcopy`` otherwise. Pastes with Cmd+V.
+
+    Interface:
+        * copy_to_clipboard(text: str) -> None
+        * read_clipboard() -> Optional[str]
+        * paste() -> None
+        * close() -> None
+    """
+
+    PBCOPY_TIMEOUT_SECONDS = 2
+
+    def __init__(self) -> None:
+        self._pasteboard, self._string_type = self._load_pasteboard()
+        self._paster = KeyboardPaster("cmd")
+
+    @property
+    def uses_native_pasteboard(self) -> bool:
+        return self._pasteboard is not None
+
+    def copy_to_clipboard(self, text: str) -> None:
+        if self._pasteboard is not None:
+            self._pasteboard.clearContents()
+            if not self._pasteboard.setString_forType_(text, self._string_type):
+                raise RuntimeError("NSPasteboard rejected the transcription")
+            return
+        completed = subprocess.run(
+            ["pbcopy"],
+            input=text.encode("utf-8"),
+            timeout=self.PBCOPY_TIMEOUT_SECONDS,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"pbcopy exited with status {completed.returncode}")
+
+    def read_clipboard(self) -> Optional[str]:
+        if self._pasteboard is not None:
+            return self._pasteboard.stringForType_(self._string_type)
+        completed = subprocess.run(
+            ["pbpaste"],
+            capture_output=True,
+            timeout=self.PBCOPY_TIMEOUT_SECONDS,
+            check=False,
+        )
+        if completed.returncode != 0:
+            return None
+        return completed.stdout.decode("utf-8", errors="replace")
+
+    def paste(self) -> None:
+        self._paster.paste()
+
+    def close(self) -> None:
+        self._pasteboard = None
+
+    @staticmethod
+    def _load_pasteboard() -> tuple[Optional[Any], Optional[Any]]:
+        try:
+            from AppKit import NSPasteboard, NSPasteboardTypeString  # type: ignore
+        except Exception:
+            print("[INFO] pyobjc not installed; using pbcopy for the clipboard")
+            return None, None
+        return NSPasteboard.generalPasteboard(), NSPasteboardTypeString
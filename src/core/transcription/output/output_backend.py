@@ -0,0 +1,68 @@
+"""Output backend protocol and the shared keyboard paster."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class OutputBackend(Protocol):
+    """OutputBackend
+
+    Responsibility:
+        Place transcribed text on the system clipboard and trigger a paste
+        into the focused application. One long-lived instance is created per
+        process, so implementations keep their platform handles open instead
+        of re-creating them for every result.
+
+    Interface:
+        * copy_to_clipboard(text: str) -> None
+        * read_clipboard() -> Optional[str]
+        * paste() -> None
+        * close() -> None
+    """
+
+    def copy_to_clipboard(self, text: str) -> None:
+        """Replace the clipboard contents with ``text``."""
+
+    def read_clipboard(self) -> Optional[str]:
+        """Return the clipboard text, or None if it is empty or unreadable."""
+
+    def paste(self) -> None:
+        """Send the platform paste shortcut to the focused application."""
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class KeyboardPaster:
+    """Send a paste shortcut through a single, lazily created pynput controller.
+
+    pynput is imported on first use so headless environments (and the fake
+    backend) never need it.
+    """
+
+    def __init__(self, modifier_name: str) -> None:
+        self._modifier_name = modifier_name
+        self._controller: Optional[Any] = None
+        self._modifier: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def paste(self) -> None:
+        with self._lock:
+            if self._controller is None:
+                self._controller, self._modifier = self._create_controller()
+            controller = self._controller
+            modifier = self._modifier
+            controller.press(modifier)
+            controller.press("v")
+            controller.release("v")
+            controller.release(modifier)
+
+    def _create_controller(self) -> tuple[Any, Any]:
+        try:
+            from pynput.keyboard import Key, Controller as KeyboardController
+        except Exception as exc:
+            raise RuntimeError("Failed to find pynput") from exc
+        return KeyboardController(), getattr(Key, self._modifier_name)
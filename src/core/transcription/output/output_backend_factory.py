@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import Optional
+
+from .fake_output_backend import FakeOutputBackend
+from .output_backend import OutputBackend
+
+_lock = threading.Lock()
+_backend: Optional[OutputBackend] = None
+
+# Set SONA_OUTPUT_BACKEND=fake to run the pipeline without a desktop session.
+OUTPUT_BACKEND_ENV = "SONA_OUTPUT_BACKEND"
+
+
+def create_output_backend(platform: Optional[str] = None) -> OutputBackend:
+    """Create the output backend for ``platform`` (defaults to this machine)."""
+    if os.environ.get(OUTPUT_BACKEND_ENV, "").lower() == "fake":
+        return FakeOutputBackend()
+    platform = platform or sys.platform
+    if platform == "darwin":
+        from .macos_output_backend import MacOSOutputBackend
+
+        return MacOSOutputBackend()
+    if platform.startswith("linux"):
+        from .linux_output_backend import LinuxOutputBackend
+
+        return LinuxOutputBackend()
+    raise RuntimeError(f"No clipboard output backend for platform '{platform}'")
+
+
+def get_output_backend() -> OutputBackend:
+    """Return the process-wide output backend, creating it on first use."""
+    global _backend
+    with _lock:
+        if _backend is None:
+            _backend = create_output_backend()
+        return _backend
@@ -0,0 +1,433 @@
+"""AITranscriber that spreads inference over a pool of replica processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.audio.audio_duration import read_audio_duration_seconds
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import (
+    ModelEvicted,
+    ModelLoaded,
+    ModelLoading,
+    ModelUnloaded,
+)
+from src.event_management.events import Event
+from src.metrics.runtime_metrics import (
+    MODEL_EVICTIONS_TOTAL,
+    MODEL_LOAD_SECONDS,
+    MODEL_LOADED,
+    REPLICA_IN_FLIGHT,
+    REPLICA_TRANSCRIPTIONS_TOTAL,
+    TRANSCRIPTION_LATENCY_SECONDS,
+    TRANSCRIPTION_REAL_TIME_FACTOR,
+)
+from src.server.models.repository.model_constants import MODELS_INFO, WHISPER_CACHE_DIR
+from .ai_transcriber import DECODE_OPTIONS, SAMPLE_RATE, AITranscriber
+from .replica_worker import OK, READY, run_replica
+
+REPLICA_DEVICE = "cpu"
+
+
+@dataclass
+class _Replica:
+    index: int
+    process: Any
+    connection: Connection
+    send_lock: threading.Lock = field(default_factory=threading.Lock)
+    pending: Dict[str, Future] = field(default_factory=dict)
+    alive: bool = True
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.pending)
+
+
+class ReplicaPoolTranscriber(AITranscriber):
+    """ReplicaPoolTranscriber
+
+    Responsibility:
+        Serve transcriptions from ``replicas`` worker processes that each run
+        the same Whisper model on the CPU, so concurrent requests (API jobs
+        next to hotkey dictation) run in parallel instead of queueing behind
+        one model. Each request goes to the replica with the fewest requests
+        in flight.
+
+        Whisper checkpoints store fp16 weights, which the CPU would cast on
+        every forward pass. The checkpoint is therefore converted to fp32
+        once, next to the other Sona state, and every replica memory-maps
+        that file read-only: the weights live once in the page cache however
+        many replicas there are, and only activations are per process.
+        Replicas are spawned rather than forked, because forking a process
+        that already runs the hotkey listener and OpenMP threads is unsafe,
+        and each gets an equal share of the cores for its intra-op threads.
+
+        Besides the gateway API it exposes the same ``is_loaded``,
+        ``idle_seconds`` and ``evict`` surface as ``AITranscriberImpl`` so
+        the idle evictor stops the whole pool; the next ``transcribe`` starts
+        it again. A replica that dies fails its requests and is skipped
+        until the pool is reloaded.
+
+    Interface:
+        * load() -> None: prepare the shared weights and start all replicas
+        * warm_up() -> None
+        * transcribe(audio: Path) -> dict
+        * transcribe_samples(samples) -> dict
+        * teardown() -> None
+        * is_loaded() -> bool
+        * idle_seconds() -> float
+        * evict(reason: str) -> bool
+    """
+
+    WEIGHTS_DIR: Path = Path.home() / ".sona" / "replica_weights"
+    READY_TIMEOUT_SECONDS = 600.0
+    STOP_TIMEOUT_SECONDS = 5.0
+
+    def __init__(
+        self,
+        model_name: str,
+        replicas: int,
+        threads_per_replica: Optional[int] = None,
+    ) -> None:
+        self._model_name = model_name
+        self._replica_count = max(1, replicas)
+        self._threads_per_replica = threads_per_replica or max(
+            1, (os.cpu_count() or 1) // self._replica_count
+        )
+        self._context = multiprocessing.get_context("spawn")
+        self._messenger = EventMessenger.get_instance()
+        # Held while replicas start or stop; _lock guards dispatch state.
+        self._lifecycle_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._replicas: List[_Replica] = []
+        self._in_flight = 0
+        self._last_used_at = time.monotonic()
+        self._evicted = False
+        REPLICA_IN_FLIGHT.set_function(
+            lambda: {
+                (str(replica.index),): replica.in_flight for replica in self._replicas
+            }
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def device(self) -> str:
+        return REPLICA_DEVICE
+
+    @property
+    def precision(self) -> str:
+        return "fp32"
+
+    def load(self) -> None:
+        with self._lifecycle_lock:
+            if self.is_loaded():
+                return
+            self._stop_replicas_locked()
+            self._messenger.emit(
+                Event.MODEL_LOADING,
+                ModelLoading(model_name=self._model_name, device=REPLICA_DEVICE),
+            )
+            started_at = time.perf_counter()
+            weights_path = self._prepare_shared_weights()
+            replicas = self._start_replicas(weights_path)
+            load_seconds = time.perf_counter() - started_at
+            with self._lock:
+                self._replicas = replicas
+                self._last_used_at = time.monotonic()
+            is_reload = self._evicted
+            self._evicted = False
+            MODEL_LOAD_SECONDS.labels(
+                model=self._model_name, device=REPLICA_DEVICE
+            ).observe(load_seconds)
+            MODEL_LOADED.labels(model=self._model_name, device=REPLICA_DEVICE).set(1)
+        print(
+            f"[INFO] Started {len(replicas)} '{self._model_name}' replicas "
+            f"({self._threads_per_replica} threads each) in {load_seconds:.1f}s"
+        )
+        self._messenger.emit(
+            Event.MODEL_LOADED,
+            ModelLoaded(
+                model_name=self._model_name,
+                device=REPLICA_DEVICE,
+                load_seconds=load_seconds,
+                reload_after_eviction=is_reload,
+            ),
+        )
+
+    def warm_up(self) -> None:
+        """Start the replicas ahead of use; each loads its model on start."""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            self.load()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used_at = time.monotonic()
+
+    def transcribe(self, audio: Path) -> Dict[str, Any]:
+        return self._transcribe(
+            str(audio), lambda: read_audio_duration_seconds(audio)
+        )
+
+    def transcribe_samples(self, samples: Any) -> Dict[str, Any]:
+        # Samples are pickled through the pipe: 30 s of audio is ~2 MB.
+        return self._transcribe(samples, lambda: len(samples) / SAMPLE_RATE)
+
+    def _transcribe(
+        self, audio: Any, audio_duration: Callable[[], Optional[float]]
+    ) -> Dict[str, Any]:
+        # Counted before loading so an eviction cannot stop the pool between
+        # the load and the dispatch.
+        with self._lock:
+            self._in_flight += 1
+        try:
+            if not self.is_loaded():
+                self.load()
+            started_at = time.perf_counter()
+            replica, future = self._dispatch(audio)
+            try:
+                result = future.result()
+            except Exception:
+                REPLICA_TRANSCRIPTIONS_TOTAL.labels(
+                    replica=str(replica.index), outcome="failed"
+                ).inc()
+                raise
+            REPLICA_TRANSCRIPTIONS_TOTAL.labels(
+                replica=str(replica.index), outcome="completed"
+            ).inc()
+            self._record_inference_metrics(
+                audio_duration(), time.perf_counter() - started_at
+            )
+            return result
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used_at = time.monotonic()
+
+    def teardown(self) -> None:
+        with self._lifecycle_lock:
+            stopped = self._stop_replicas_locked()
+        if stopped:
+            self._messenger.emit(
+                Event.MODEL_UNLOADED,
+                ModelUnloaded(model_name=self._model_name, device=REPLICA_DEVICE),
+            )
+
+    def is_loaded(self) -> bool:
+        with self._lock:
+            return any(replica.alive for replica in self._replicas)
+
+    def idle_seconds(self) -> float:
+        with self._lock:
+            if self._in_flight:
+                return 0.0
+            return time.monotonic() - self._last_used_at
+
+    def evict(self, reason: str) -> bool:
+        """Stop every replica unless a transcription is running.
+
+        Returns:
+            True if the pool was stopped.
+        """
+        with self._lifecycle_lock:
+            # The in-flight check and detaching the replicas happen under one
+            # hold of _lock, so a transcription that has counted itself in
+            # either blocks the eviction or finds the pool unloaded and
+            # starts it again.
+            with self._lock:
+                if self._in_flight:
+                    return False
+                replicas = self._detach_replicas_locked()
+            if not replicas:
+                return False
+            self._stop_detached(replicas)
+            self._evicted = True
+
+        MODEL_EVICTIONS_TOTAL.labels(reason=reason).inc()
+        print(f"[INFO] Evicted '{self._model_name}' replica pool ({reason})")
+        self._messenger.emit(
+            Event.MODEL_EVICTED,
+            ModelEvicted(
+                model_name=self._model_name, device=REPLICA_DEVICE, reason=reason
+            ),
+        )
+        return True
+
+    def _dispatch(self, audio: Any) -> tuple[_Replica, Future]:
+        request_id = uuid.uuid4().hex
+        future: Future = Future()
+        with self._lock:
+            live = [replica for replica in self._replicas if replica.alive]
+            if not live:
+                raise RuntimeError("No transcription replica is running")
+            # least loaded first; ties go to the lowest index
+            replica = min(live, key=lambda r: (r.in_flight, r.index))
+            replica.pending[request_id] = future
+        try:
+            with replica.send_lock:
+                replica.connection.send((request_id, audio))
+        except (OSError, ValueError) as exc:
+            with self._lock:
+                replica.pending.pop(request_id, None)
+            raise RuntimeError(f"Replica {replica.index} is not reachable") from exc
+        return replica, future
+
+    def _prepare_shared_weights(self) -> Path:
+        """Return the fp32 copy of the checkpoint, converting it if stale."""
+        model_info = MODELS_INFO.get(self._model_name)
+        if model_info is None:
+            raise RuntimeError(f"Unknown Whisper model '{self._model_name}'")
+        source_path = WHISPER_CACHE_DIR / model_info[0]
+        if not source_path.is_file():
+            from .download_model import get_model_downloader
+
+            source_path = get_model_downloader().download_model(self._model_name)
+
+        weights_path = self.WEIGHTS_DIR / f"{source_path.stem}-fp32.pt"
+        if (
+            weights_path.is_file()
+            and weights_path.stat().st_mtime >= source_path.stat().st_mtime
+        ):
+            return weights_path
+
+        import torch  # type: ignore
+
+        print(f"[INFO] Converting '{self._model_name}' to fp32 for the replica pool")
+        checkpoint = torch.load(source_path, map_location="cpu")
+        state_dict = {
+            name: tensor.float().contiguous()
+            for name, tensor in checkpoint["model_state_dict"].items()
+        }
+        self.WEIGHTS_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = weights_path.with_suffix(".tmp")
+        torch.save({"dims": checkpoint["dims"], "model_state_dict": state_dict}, temp_path)
+        temp_path.replace(weights_path)
+        return weights_path
+
+    def _start_replicas(self, weights_path: Path) -> List[_Replica]:
+        replicas = []
+        for index in range(self._replica_count):
+            parent_connection, child_connection = self._context.Pipe()
+            process = self._context.Process(
+                target=run_replica,
+                args=(
+                    child_connection,
+                    str(weights_path),
+                    self._model_name,
+                    self._threads_per_replica,
+                    DECODE_OPTIONS,
+                ),
+                name=f"SonaReplica-{index}",
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            replicas.append(_Replica(index, process, parent_connection))
+
+        # Replicas load concurrently; wait for all of them.
+        try:
+            for replica in replicas:
+                if not replica.connection.poll(self.READY_TIMEOUT_SECONDS):
+                    raise RuntimeError(f"Replica {replica.index} did not start in time")
+                _, status, payload = replica.connection.recv()
+                if status != READY:
+                    raise RuntimeError(f"Replica {replica.index} failed to load: {payload}")
+        except BaseException:
+            for replica in replicas:
+                self._stop_replica(replica)
+                replica.connection.close()
+            raise
+
+        for replica in replicas:
+            threading.Thread(
+                target=self._read_responses,
+                args=(replica,),
+                name=f"ReplicaReader-{replica.index}",
+                daemon=True,
+            ).start()
+        return replicas
+
+    def _read_responses(self, replica: _Replica) -> None:
+        while True:
+            try:
+                request_id, status, payload = replica.connection.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                future = replica.pending.pop(request_id, None)
+            if future is None:
+                continue
+            if status == OK:
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(f"Transcription failed: {payload}"))
+
+        with self._lock:
+            was_alive = replica.alive
+            replica.alive = False
+            orphaned = list(replica.pending.values())
+            replica.pending.clear()
+        # Closed here rather than by whoever stops the replica, so the
+        # connection is never closed under this thread's recv().
+        replica.connection.close()
+        if was_alive:
+            print(f"[WARNING] Transcription replica {replica.index} exited unexpectedly")
+        for future in orphaned:
+            future.set_exception(
+                RuntimeError(f"Replica {replica.index} exited during transcription")
+            )
+
+    def _stop_replicas_locked(self) -> bool:
+        """Stop all replicas; the caller must hold ``_lifecycle_lock``."""
+        with self._lock:
+            replicas = self._detach_replicas_locked()
+        self._stop_detached(replicas)
+        return bool(replicas)
+
+    def _detach_replicas_locked(self) -> List[_Replica]:
+        """Take the replicas out of dispatch; the caller must hold ``_lock``."""
+        replicas, self._replicas = self._replicas, []
+        for replica in replicas:
+            replica.alive = False
+        return replicas
+
+    def _stop_detached(self, replicas: List[_Replica]) -> None:
+        for replica in replicas:
+            self._stop_replica(replica)
+        if replicas:
+            MODEL_LOADED.labels(model=self._model_name, device=REPLICA_DEVICE).set(0)
+
+    def _stop_replica(self, replica: _Replica) -> None:
+        try:
+            with replica.send_lock:
+                replica.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        replica.process.join(self.STOP_TIMEOUT_SECONDS)
+        if replica.process.is_alive():
+            replica.process.terminate()
+            replica.process.join(self.STOP_TIMEOUT_SECONDS)
+
+    def _record_inference_metrics(
+        self, audio_duration: Optional[float], elapsed: float
+    ) -> None:
+        TRANSCRIPTION_LATENCY_SECONDS.labels(
+            model=self._model_name, device=REPLICA_DEVICE
+        ).observe(elapsed)
+        if audio_duration:
+            TRANSCRIPTION_REAL_TIME_FACTOR.labels(
+                model=self._model_name, device=REPLICA_DEVICE
+            ).observe(elapsed / audio_duration)
@@ -0,0 +1,111 @@
+"""Whisper inference replica: the entry point of one pool worker process.
+
+Kept free of project imports beyond the standard library so a spawned
+interpreter starts with only torch and whisper to import. The replica maps
+the shared fp32 checkpoint read-only instead of reading it into private
+memory, so every replica serves from the same page-cache pages.
+"""
+
+from __future__ import annotations
+
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Dict
+
+READY = "ready"
+OK = "ok"
+ERROR = "error"
+
+
+def run_replica(
+    connection: Connection,
+    weights_path: str,
+    model_name: str,
+    num_threads: int,
+    decode_options: Dict[str, Any],
+) -> None:
+    """Load the shared weights, report ready, then serve until told to stop.
+
+    Requests are ``(request_id, audio)`` tuples, where audio is a file path
+    or 16 kHz float32 samples, and ``None`` stops the replica. Every request
+    is answered with ``(request_id, OK, result)`` or
+    ``(request_id, ERROR, message)``; the first message is
+    ``(None, READY, load_seconds)`` or ``(None, ERROR, message)``.
+    """
+    try:
+        import torch  # type: ignore
+
+        torch.set_num_threads(max(1, num_threads))
+        started_at = time.perf_counter()
+        model = _load_shared_model(torch, weights_path, model_name)
+        connection.send((None, READY, time.perf_counter() - started_at))
+    except Exception as exc:
+        connection.send((None, ERROR, f"{type(exc).__name__}: {exc}"))
+        return
+
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        request_id, audio = request
+        try:
+            with torch.inference_mode():
+                # fp16 is not supported on CPU; asking for it only warns.
+                result = model.transcribe(audio=audio, fp16=False, **decode_options)
+            connection.send((request_id, OK, result))
+        except Exception as exc:
+            connection.send((request_id, ERROR, f"{type(exc).__name__}: {exc}"))
+
+
+def _load_shared_model(torch: Any, weights_path: str, model_name: str) -> Any:
+    import whisper  # type: ignore
+    from whisper.model import ModelDimensions, Whisper  # type: ignore
+
+    try:
+        checkpoint = torch.load(
+            weights_path, map_location="cpu", mmap=True, weights_only=True
+        )
+    except TypeError:
+        print(
+            "[WARNING] This torch build cannot memory-map checkpoints; "
+            "each replica keeps a private copy of the weights"
+        )
+        checkpoint = torch.load(weights_path, map_location="cpu")
+
+    # Build the module without allocating parameters, then adopt the mapped
+    # tensors as they are instead of copying them in.
+    dims = ModelDimensions(**checkpoint["dims"])
+    try:
+        with torch.device("meta"):
+            model = Whisper(dims)
+    except Exception:
+        # Older torch builds cannot create every buffer on the meta device;
+        # the randomly initialised parameters are dropped by assign=True.
+        model = Whisper(dims)
+    model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+
+    # Non-persistent buffers are not in the checkpoint, so they are still on
+    # the meta device; rebuild them the way Whisper's constructors do.
+    n_ctx = dims.n_text_ctx
+    mask = torch.empty(n_ctx, n_ctx).fill_(-float("inf")).triu_(1)
+    model.decoder.register_buffer("mask", mask, persistent=False)
+    alignment_heads = getattr(whisper, "_ALIGNMENT_HEADS", {}).get(model_name)
+    if alignment_heads is not None:
+        model.set_alignment_heads(alignment_heads)
+    else:
+        dims = model.dims
+        all_heads = torch.zeros(dims.n_text_layer, dims.n_text_head, dtype=torch.bool)
+        all_heads[dims.n_text_layer // 2 :] = True
+        model.register_buffer("alignment_heads", all_heads.to_sparse(), persistent=False)
+
+    left_on_meta = [
+        name
+        for name, tensor in (*model.named_parameters(), *model.named_buffers())
+        if tensor.is_meta
+    ]
+    if left_on_meta:
+        raise RuntimeError(f"Checkpoint left tensors unloaded: {', '.join(left_on_meta)}")
+    return model.eval()
@@ -0,0 +1,192 @@
+"""Content-addressed cache of transcription results."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional
+
+from src.metrics.runtime_metrics import (
+    TRANSCRIPT_CACHE_DISK_BYTES,
+    TRANSCRIPT_CACHE_HIT_RATIO,
+    TRANSCRIPT_CACHE_LOOKUPS_TOTAL,
+)
+
+MEMORY_HIT = "memory_hit"
+DISK_HIT = "disk_hit"
+MISS = "miss"
+
+
+class TranscriptCache:
+    """TranscriptCache
+
+    Responsibility:
+        Remember transcription results by what produced them, so identical
+        audio (API retries, re-submissions, batch reruns) is not transcribed
+        again. The key is a BLAKE2b digest of the decoded PCM together with
+        the model name, precision and decode options, so a result is never
+        reused for different settings. Recent results are kept in an
+        in-memory LRU. Every result is also stored as JSON under
+        ``~/.sona/transcript_cache``, and the least recently used files are
+        deleted once the directory grows past its size budget.
+
+    Interface:
+        * key_for(pcm, model_name, precision, decode_options) -> str
+        * get(key: str) -> Optional[dict]
+        * put(key: str, result: dict) -> None
+    """
+
+    CACHE_DIR: Path = Path.home() / ".sona" / "transcript_cache"
+    DEFAULT_MEMORY_ENTRIES = 256
+    DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        self._cache_dir = cache_dir or self.CACHE_DIR
+        self._memory_entries = max(0, memory_entries)
+        self._max_disk_bytes = max(0, max_disk_bytes)
+        self._lock = Lock()
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # key -> file size, least recently used first; built on first use
+        self._disk_index: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._hits = 0
+        self._lookups = 0
+        TRANSCRIPT_CACHE_HIT_RATIO.set_function(
+            lambda: {(): self._hits / self._lookups if self._lookups else 0.0}
+        )
+        TRANSCRIPT_CACHE_DISK_BYTES.set_function(lambda: {(): self._disk_bytes})
+
+    @staticmethod
+    def key_for(
+        pcm: Any, model_name: str, precision: str, decode_options: Mapping[str, Any]
+    ) -> str:
+        """Digest ``pcm`` (any buffer, e.g. a contiguous float32 array) and settings."""
+        settings = json.dumps(
+            {"model": model_name, "precision": precision, "options": decode_options},
+            sort_keys=True,
+        )
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(settings.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(pcm)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._lookups += 1
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self._record_hit_locked(MEMORY_HIT)
+                return copy.deepcopy(result)
+            on_disk = key in self._disk_index_locked()
+
+        result = self._read_disk(key) if on_disk else None
+        with self._lock:
+            if result is None:
+                TRANSCRIPT_CACHE_LOOKUPS_TOTAL.labels(result=MISS).inc()
+                return None
+            if self._disk_index is not None and key in self._disk_index:
+                self._disk_index.move_to_end(key)
+            self._remember_locked(key, result)
+            self._record_hit_locked(DISK_HIT)
+            return copy.deepcopy(result)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        try:
+            # Whisper results may hold numpy scalars; store plain JSON types.
+            data = json.dumps(result, ensure_ascii=False, default=_to_json)
+        except (TypeError, ValueError) as exc:
+            print(f"[WARNING] Transcript not cached: {exc}")
+            return
+        with self._lock:
+            self._remember_locked(key, json.loads(data))
+        if self._max_disk_bytes:
+            self._write_disk(key, data.encode("utf-8"))
+
+    def _record_hit_locked(self, result: str) -> None:
+        self._hits += 1
+        TRANSCRIPT_CACHE_LOOKUPS_TOTAL.labels(result=result).inc()
+
+    def _remember_locked(self, key: str, result: Dict[str, Any]) -> None:
+        if not self._memory_entries:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path_for(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _disk_index_locked(self) -> "OrderedDict[str, int]":
+        if self._disk_index is not None:
+            return self._disk_index
+        entries = []
+        if self._max_disk_bytes and self._cache_dir.is_dir():
+            for path in self._cache_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+        entries.sort()
+        self._disk_index = OrderedDict((key, size) for _, key, size in entries)
+        self._disk_bytes = sum(self._disk_index.values())
+        return self._disk_index
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path_for(key)
+        try:
+            with path.open("r", encoding="utf-8") as cache_file:
+                result = json.load(cache_file)
+            # mtime orders the disk tier by last use across restarts
+            os.utime(path)
+            return result
+        except (OSError, ValueError) as exc:
+            print(f"[WARNING] Dropping unreadable cached transcript {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            with self._lock:
+                size = self._disk_index.pop(key, 0) if self._disk_index else 0
+                self._disk_bytes -= size
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(data)
+            temp_path.replace(path)
+        except OSError as exc:
+            print(f"[WARNING] Failed to persist cached transcript: {exc}")
+            return
+        with self._lock:
+            index = self._disk_index_locked()
+            self._disk_bytes += len(data) - index.pop(key, 0)
+            index[key] = len(data)
+            evicted = []
+            while self._disk_bytes > self._max_disk_bytes and len(index) > 1:
+                old_key, size = index.popitem(last=False)
+                self._disk_bytes -= size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._path_for(old_key).unlink(missing_ok=True)
+
+
+def _to_json(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-import subprocess
-from typing import Protocol, runtime_checkable
-from pynput.keyboard import Key, Controller as KeyboardController
+import threading
+from typing import Optional, Protocol, runtime_checkable
+
+from src.server.config.entity.user_config import ClipboardBehaviour
+
+from .output.output_backend import OutputBackend
+from .output.output_backend_factory import get_output_backend
 
 
 @runtime_checkable
@@ -26,39 +30,86 @@ class TranscriptionResultHandler(Protocol):
 
 
 class TranscriptionResultHandlerImpl(TranscriptionResultHandler):
+    """Copy the transcription to the clipboard and paste it into the focused app.
+
+    The platform output backend is resolved on first use and reused for every
+    later result; pass one explicitly to run headless (see FakeOutputBackend).
+
+    ``clipboard_behaviour`` decides what happens after the copy: with
+    ``autonomous_pasting`` the text is pasted into the focused app, and
+    without ``keep_output_in_clipboard`` the previous clipboard text is put
+    back once the paste has had time to land. Without autonomous pasting the
+    output always stays on the clipboard, since that is the only place the
+    user can get it from.
+    """
+
+    # Paste is asynchronous in the receiving app; restoring the clipboard
+    # sooner can make it paste the old contents.
+    RESTORE_DELAY_SECONDS = 0.5
+
+    def __init__(
+        self,
+        output_backend: Optional[OutputBackend] = None,
+        clipboard_behaviour: Optional[ClipboardBehaviour] = None,
+    ) -> None:
+        self._output_backend = output_backend
+        self._clipboard_behaviour = clipboard_behaviour or ClipboardBehaviour()
+
+    @property
+    def clipboard_behaviour(self) -> ClipboardBehaviour:
+        return self._clipboard_behaviour
+
     def handle_success(self, text: str) -> None:
         print(f"[TRANSCRIPTION SUCCESS] {text}")
         # add new line
         text_with_newline = text + "\n\n"
-        # TODO: adapt copy paste cmd for cross platform
+        behaviour = self._clipboard_behaviour
+        restore_clipboard = (
+            behaviour.autonomous_pasting and not behaviour.keep_output_in_clipboard
+        )
         try:
-            copy = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
-            if copy is None:
-                raise RuntimeError("Failed to launch pbcopy")
-            copy.stdin.write(text_with_newline.encode("utf-8"))
-            copy.stdin.close()
-            copy.wait(timeout=2)
+            backend = self._get_output_backend()
+            previous_text = self._read_clipboard(backend) if restore_clipboard else None
+            backend.copy_to_clipboard(text_with_newline)
         except Exception as exception:
             self.handle_error(exception)
             return
 
+        if not behaviour.autonomous_pasting:
+            return
         try:
-            self._paste_action()
+            backend.paste()
         except Exception as exception:
             self.handle_error(exception)
+            return
 
-    def _paste_action(self):
-        if KeyboardController is None or Key is None:
-            raise RuntimeError("Failed to find pynput")
-
-        keyboard = KeyboardController()
-        keyboard.press(Key.cmd)
-        keyboard.press("v")
-        keyboard.release(Key.cmd)
-        keyboard.release("v")
-
-
+        if previous_text is not None:
+            timer = threading.Timer(
+                self.RESTORE_DELAY_SECONDS,
+                self._restore_clipboard,
+                args=(backend, previous_text),
+            )
+            timer.daemon = True
+            timer.start()
 
     def handle_error(self, exc: Exception) -> None:
         print(f"[TRANSCRIPTION ERROR] {type(exc).__name__}: {exc}")
 
+    def _get_output_backend(self) -> OutputBackend:
+        if self._output_backend is None:
+            self._output_backend = get_output_backend()
+        return self._output_backend
+
+    @staticmethod
+    def _read_clipboard(backend: OutputBackend) -> Optional[str]:
+        try:
+            return backend.read_clipboard()
+        except Exception as exc:
+            print(f"[WARNING] Could not read the clipboard to restore it later: {exc}")
+            return None
+
+    def _restore_clipboard(self, backend: OutputBackend, text: str) -> None:
+        try:
+            backend.copy_to_clipboard(text)
+        except Exception as exc:
+            self.handle_error(exc)
@@ -1,27 +1,305 @@
-from collections import defaultdict
-from typing import Callable, Optional, DefaultDict, List
+from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from src.event_management.event_payloads import EVENT_PAYLOAD_TYPES
 from src.event_management.events import Event
+from src.metrics.runtime_metrics import (
+    EVENT_BUS_COALESCED_TOTAL,
+    EVENT_BUS_DELIVERY_LAG_SECONDS,
+    EVENT_BUS_DROPPED_TOTAL,
+    EVENT_BUS_HANDLER_ERRORS_TOTAL,
+    EVENT_BUS_QUEUE_DEPTH,
+)
+
+DEFAULT_QUEUE_SIZE = 1024
+
+_QueuedEvent = Tuple[Event, Any, float]  # (event, payload, emitted_at)
+
+
+class Subscription:
+    """One handler and, unless it is inline, its own delivery queue and thread.
+
+    Queued subscriptions never run in the emitter's thread: ``offer`` appends
+    to a bounded deque (dropping the oldest event when full) and a dedicated
+    dispatcher thread calls the handler in order. With ``debounce_seconds``
+    the dispatcher waits for that much quiet time and then delivers only the
+    latest payload of each event, so a burst collapses into one call; a
+    steady stream is still delivered at least every ``max_delay_seconds``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable,
+        events: Tuple[Event, ...],
+        pass_event: bool,
+        inline: bool,
+        queue_size: int,
+        debounce_seconds: Optional[float],
+    ) -> None:
+        self.name = name
+        self.events = events
+        self.inline = inline
+        self._handler = handler
+        self._pass_event = pass_event
+        self._queue_size = max(1, queue_size)
+        self._debounce_seconds = debounce_seconds
+        self._max_delay_seconds = (debounce_seconds or 0.0) * 10
+        self._queue: Deque[_QueuedEvent] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        if not inline:
+            self._thread = threading.Thread(
+                target=self._run, name=f"EventDispatcher[{name}]", daemon=True
+            )
+            self._thread.start()
+
+    def offer(self, event: Event, payload: Any) -> None:
+        if self.inline:
+            self._deliver(event, payload)
+            return
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._queue) >= self._queue_size:
+                dropped_event = self._queue.popleft()[0]
+                EVENT_BUS_DROPPED_TOTAL.labels(
+                    subscriber=self.name, event=dropped_event.name
+                ).inc()
+            self._queue.append((event, payload, time.monotonic()))
+            self._condition.notify_all()
+
+    def queue_depth(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued event has been handled."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Deliver what is already queued, then stop the dispatcher thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                if self._debounce_seconds:
+                    self._wait_for_quiet_locked()
+                    batch = self._coalesce_locked()
+                else:
+                    batch = [self._queue.popleft()]
+                self._busy = True
+            try:
+                for event, payload, emitted_at in batch:
+                    EVENT_BUS_DELIVERY_LAG_SECONDS.labels(subscriber=self.name).observe(
+                        time.monotonic() - emitted_at
+                    )
+                    self._deliver(event, payload)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _wait_for_quiet_locked(self) -> None:
+        first_emitted_at = self._queue[0][2]
+        while not self._closed:
+            now = time.monotonic()
+            quiet_until = self._queue[-1][2] + self._debounce_seconds
+            latest_allowed = first_emitted_at + self._max_delay_seconds
+            remaining = min(quiet_until, latest_allowed) - now
+            if remaining <= 0:
+                return
+            self._condition.wait(remaining)
+
+    def _coalesce_locked(self) -> List[_QueuedEvent]:
+        latest: "OrderedDict[Event, _QueuedEvent]" = OrderedDict()
+        for queued in self._queue:
+            latest.pop(queued[0], None)
+            latest[queued[0]] = queued
+        superseded = len(self._queue) - len(latest)
+        if superseded:
+            EVENT_BUS_COALESCED_TOTAL.labels(subscriber=self.name).inc(superseded)
+        self._queue.clear()
+        # Payloads keep their original emit time so the lag metric includes
+        # the debounce wait.
+        return list(latest.values())
+
+    def _deliver(self, event: Event, payload: Any) -> None:
+        try:
+            if self._pass_event:
+                self._handler(event, payload)
+            else:
+                self._handler(payload)
+        except Exception as e:
+            EVENT_BUS_HANDLER_ERRORS_TOTAL.labels(subscriber=self.name).inc()
+            print(f"[EventMessenger] Error in event {event.name} handler {self.name}: {e}")
 
 
 class EventMessenger:
+    """EventMessenger
+
+    Responsibility:
+        Publish application events to subscribers without making the
+        publisher wait for them. Each subscription gets its own bounded
+        delivery queue and dispatcher thread, so a slow handler (e.g. the
+        runtime reload) neither blocks the HTTP request that emitted the
+        event nor delays other subscribers. Payloads are typed (see
+        ``event_payloads``) and checked at emit time.
+
+    Interface:
+        * subscribe(event, handler, debounce_seconds=None, inline=False,
+          queue_size=DEFAULT_QUEUE_SIZE, name=None) -> Subscription:
+          ``handler(payload)``
+        * subscribe_all(handler, events=None, ...) -> Subscription:
+          ``handler(event, payload)`` for several events on one queue
+        * unsubscribe(subscription) -> None
+        * emit(event, payload) -> None: never blocks on handlers, except
+          for inline subscriptions, which are reserved for cheap
+          bookkeeping that must be visible before ``emit`` returns
+        * wait_until_idle(timeout=None) -> bool
+    """
+
     _instance: Optional[EventMessenger] = None
+    _instance_lock = threading.Lock()
 
     def __init__(self):
-        self._handlers: DefaultDict[Event, List[Callable]] = defaultdict(list)
+        self._lock = threading.Lock()
+        # Copy-on-write so emit can iterate without holding the lock.
+        self._subscriptions: Dict[Event, Tuple[Subscription, ...]] = {}
 
     @classmethod
-    def get_instance(cls):
-        if cls._instance is None:
-            cls._instance = EventMessenger()
-        return cls._instance
+    def get_instance(cls) -> EventMessenger:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = EventMessenger()
+            return cls._instance
 
-    def subscribe(self, event: Event, handler: Callable):
-        self._handlers[event].append(handler)
+    def subscribe(
+        self,
+        event: Event,
+        handler: Callable[[Any], None],
+        debounce_seconds: Optional[float] = None,
+        inline: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        name: Optional[str] = None,
+    ) -> Subscription:
+        return self._add(
+            Subscription(
+                name or _handler_name(handler),
+                handler,
+                (event,),
+                pass_event=False,
+                inline=inline,
+                queue_size=queue_size,
+                debounce_seconds=debounce_seconds,
+            )
+        )
 
-    def emit(self, event: Event, data=None):
-        for handler in self._handlers[event]:
-            try:
-                handler(data) if data else handler()
-            except Exception as e:
-                print(f"[EventMessenger] Error in event {event.name} handler: {e}")
+    def subscribe_all(
+        self,
+        handler: Callable[[Event, Any], None],
+        events: Optional[Iterable[Event]] = None,
+        debounce_seconds: Optional[float] = None,
+        inline: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        name: Optional[str] = None,
+    ) -> Subscription:
+        return self._add(
+            Subscription(
+                name or _handler_name(handler),
+                handler,
+                tuple(events if events is not None else Event),
+                pass_event=True,
+                inline=inline,
+                queue_size=queue_size,
+                debounce_seconds=debounce_seconds,
+            )
+        )
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for event in subscription.events:
+                self._subscriptions[event] = tuple(
+                    s for s in self._subscriptions.get(event, ()) if s is not subscription
+                )
+        subscription.close()
+
+    def emit(self, event: Event, payload: Any) -> None:
+        expected_type = EVENT_PAYLOAD_TYPES[event]
+        if not isinstance(payload, expected_type):
+            raise TypeError(
+                f"{event.name} expects {expected_type.__name__}, "
+                f"got {type(payload).__name__}"
+            )
+        for subscription in self._subscriptions.get(event, ()):
+            subscription.offer(event, payload)
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued subscription has drained its queue."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscription in self._all_subscriptions():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not subscription.wait_until_idle(remaining):
+                return False
+        return True
+
+    def queue_depths(self) -> Dict[str, int]:
+        depths: Dict[str, int] = {}
+        for subscription in self._all_subscriptions():
+            if not subscription.inline:
+                depths[subscription.name] = (
+                    depths.get(subscription.name, 0) + subscription.queue_depth()
+                )
+        return depths
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            for event in subscription.events:
+                self._subscriptions[event] = self._subscriptions.get(event, ()) + (
+                    subscription,
+                )
+        return subscription
+
+    def _all_subscriptions(self) -> List[Subscription]:
+        with self._lock:
+            unique: Dict[int, Subscription] = {}
+            for subscriptions in self._subscriptions.values():
+                for subscription in subscriptions:
+                    unique[id(subscription)] = subscription
+        return list(unique.values())
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", None) or type(handler).__name__
+
+
+def _collect_queue_depths() -> dict:
+    messenger = EventMessenger._instance
+    if messenger is None:
+        return {}
+    return {(name,): depth for name, depth in messenger.queue_depths().items()}
+
+
+EVENT_BUS_QUEUE_DEPTH.set_function(_collect_queue_depths)
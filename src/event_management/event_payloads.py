@@ -0,0 +1,116 @@
+"""Typed payloads carried by each :class:`Event`.
+
+Every event has exactly one payload class; :meth:`EventMessenger.emit`
+rejects anything else, so subscribers can rely on attribute access instead
+of probing dictionaries.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Type
+
+from src.event_management.events import Event
+
+
+@dataclass(frozen=True)
+class ConfigSaved:
+    pass
+
+
+@dataclass(frozen=True)
+class ModelDownloadComplete:
+    model_name: str
+
+
+@dataclass(frozen=True)
+class ModelDownloadProgress:
+    model_name: str
+    # started | downloading | completed | failed | cancelled
+    state: str
+    downloaded_bytes: Optional[int] = None
+    total_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ModelLoading:
+    model_name: str
+    device: str
+
+
+@dataclass(frozen=True)
+class ModelLoaded:
+    model_name: str
+    device: str
+    load_seconds: float
+    reload_after_eviction: bool = False
+    # Resident memory added by the load, when the platform can measure it.
+    resident_bytes: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ModelUnloaded:
+    model_name: str
+    device: str
+
+
+@dataclass(frozen=True)
+class ModelEvicted:
+    model_name: str
+    device: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class TranscriptionStarted:
+    transcription_id: str
+    model_name: Optional[str] = None
+    audio_seconds: Optional[float] = None
+    # "hotkey" for dictation, "api" for POST /api/transcribe.
+    source: str = "hotkey"
+
+
+@dataclass(frozen=True)
+class TranscriptionCompleted:
+    transcription_id: str
+    text: str
+    language: Optional[str] = None
+    model_name: Optional[str] = None
+    audio_seconds: Optional[float] = None
+    # Seconds per pipeline stage (queue, validate, transcribe, deliver, total).
+    timings: Dict[str, float] = field(default_factory=dict)
+    source: str = "hotkey"
+
+
+@dataclass(frozen=True)
+class TranscriptionFailed:
+    transcription_id: str
+    stage: str
+    error: str
+    timings: Dict[str, float] = field(default_factory=dict)
+    source: str = "hotkey"
+
+
+@dataclass(frozen=True)
+class RuntimeReloaded:
+    reload_seconds: float
+    # UserConfig fields that differed from the running configuration.
+    changed_settings: Tuple[str, ...] = ()
+    # Runtime parts that were rebuilt or reconfigured (e.g. "hotkey_listener").
+    reloaded_components: Tuple[str, ...] = ()
+
+
+EVENT_PAYLOAD_TYPES: Dict[Event, Type] = {
+    Event.CONFIG_SAVED: ConfigSaved,
+    Event.MODEL_DOWNLOAD_COMPLETE: ModelDownloadComplete,
+    Event.MODEL_DOWNLOAD_PROGRESS: ModelDownloadProgress,
+    Event.MODEL_LOADING: ModelLoading,
+    Event.MODEL_LOADED: ModelLoaded,
+    Event.MODEL_UNLOADED: ModelUnloaded,
+    Event.MODEL_EVICTED: ModelEvicted,
+    Event.TRANSCRIPTION_STARTED: TranscriptionStarted,
+    Event.TRANSCRIPTION_COMPLETED: TranscriptionCompleted,
+    Event.TRANSCRIPTION_FAILED: TranscriptionFailed,
+    Event.RUNTIME_RELOADED: RuntimeReloaded,
+}
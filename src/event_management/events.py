@@ -4,3 +4,12 @@ from enum import Enum
 class Event(Enum):
     CONFIG_SAVED = "CONFIG_SAVED"
     MODEL_DOWNLOAD_COMPLETE = "model_download_complete"
+    MODEL_LOADED = "model_loaded"
+    MODEL_EVICTED = "model_evicted"
+    MODEL_LOADING = "model_loading"
+    MODEL_UNLOADED = "model_unloaded"
+    MODEL_DOWNLOAD_PROGRESS = "model_download_progress"
+    TRANSCRIPTION_STARTED = "transcription_started"
+    TRANSCRIPTION_COMPLETED = "transcription_completed"
+    TRANSCRIPTION_FAILED = "transcription_failed"
+    RUNTIME_RELOADED = "runtime_reloaded"
@@ -0,0 +1 @@
+"""Lightweight in-process metrics collection exposed in Prometheus text format."""
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class _Metric(ABC):
+    """Common base for labelled metric families.
+
+    Responsibility:
+        Hold the metric name, help text and label names, and lazily create one
+        child sample per distinct label-value combination.
+
+    Interface:
+        * labels(**label_values) -> child sample
+        * collect() -> list of Prometheus exposition lines
+    """
+
+    metric_type: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._children: Dict[LabelValues, object] = {}
+        self._children_lock = Lock()
+
+    def labels(self, **label_values: str):
+        key = tuple(str(label_values[label]) for label in self.label_names)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        with self._children_lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_child()
+                self._children[key] = child
+            return child
+
+    def _unlabelled(self):
+        return self.labels()
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the sample held for one label-value combination."""
+
+    def _snapshot_children(self) -> List[Tuple[LabelValues, object]]:
+        with self._children_lock:
+            return list(self._children.items())
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for label_values, child in self._snapshot_children():
+            lines.extend(self._collect_child(label_values, child))
+        return lines
+
+    @abstractmethod
+    def _collect_child(self, label_values: LabelValues, child) -> Iterable[str]:
+        """Render one child sample as exposition lines."""
+
+    def _format_labels(
+        self, label_values: LabelValues, extra: Optional[Tuple[str, str]] = None
+    ) -> str:
+        pairs = list(zip(self.label_names, label_values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        body = ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs)
+        return "{" + body + "}"
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def get(self) -> float:
+        return self._value
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter (e.g., errors, bytes downloaded)."""
+
+    metric_type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def _collect_child(self, label_values: LabelValues, child: _CounterChild):
+        yield f"{self.name}{self._format_labels(label_values)} {_format_value(child.get())}"
+
+
+class _GaugeChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def get(self) -> float:
+        return self._value
+
+
+class Gauge(_Metric):
+    """Point-in-time value that can go up and down.
+
+    Besides explicit ``set``/``inc``/``dec`` updates, a gauge can be backed by
+    a callback that is only evaluated at scrape time. This keeps values such
+    as queue depth or resident memory free of any hot-path cost.
+    """
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def set_function(self, callback: Callable[[], Dict[LabelValues, float]]) -> None:
+        """Evaluate ``callback`` at scrape time instead of storing samples.
+
+        The callback returns a mapping of label-value tuples (in the order of
+        ``label_names``) to the current value. Use an empty tuple as the key
+        for unlabelled gauges.
+        """
+        self._callback = callback
+
+    def collect(self) -> List[str]:
+        if self._callback is None:
+            return super().collect()
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        try:
+            samples = self._callback()
+        except Exception as exc:
+            print(f"[WARNING] Failed to collect gauge {self.name}: {exc}")
+            return lines
+        for label_values, value in samples.items():
+            lines.append(
+                f"{self.name}{self._format_labels(tuple(label_values))} {_format_value(value)}"
+            )
+        return lines
+
+    def _collect_child(self, label_values: LabelValues, child: _GaugeChild):
+        yield f"{self.name}{self._format_labels(label_values)} {_format_value(child.get())}"
+
+
+class _HistogramChild:
+    __slots__ = ("_upper_bounds", "_bucket_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]) -> None:
+        self._upper_bounds = upper_bounds
+        # One extra slot for the implicit +Inf bucket.
+        self._bucket_counts = [0] * (len(upper_bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self._bucket_counts), self._sum, self._count
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed, cumulative buckets.
+
+    Observing is a binary search plus three additions under an uncontended
+    lock, which keeps it cheap enough to stay enabled on the transcription
+    hot path.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self._upper_bounds: Tuple[float, ...] = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._upper_bounds)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def _collect_child(self, label_values: LabelValues, child: _HistogramChild):
+        bucket_counts, total_sum, total_count = child.snapshot()
+        cumulative = 0
+        for upper_bound, bucket_count in zip(self._upper_bounds, bucket_counts):
+            cumulative += bucket_count
+            labels = self._format_labels(label_values, ("le", _format_value(upper_bound)))
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = self._format_labels(label_values, ("le", "+Inf"))
+        yield f"{self.name}_bucket{labels} {total_count}"
+        yield f"{self.name}_sum{self._format_labels(label_values)} {_format_value(total_sum)}"
+        yield f"{self.name}_count{self._format_labels(label_values)} {total_count}"
+
+
+class MetricsRegistry:
+    """MetricsRegistry
+
+    Responsibility:
+        Process-wide home for all metric families so that any module can
+        record samples without threading a registry through constructors, and
+        the HTTP layer can render everything in one place.
+
+    Interface:
+        * get_instance() -> MetricsRegistry
+        * counter(name, documentation, label_names) -> Counter
+        * gauge(name, documentation, label_names) -> Gauge
+        * histogram(name, documentation, label_names, buckets) -> Histogram
+        * render_prometheus() -> str
+    """
+
+    _instance: Optional[MetricsRegistry] = None
+    _instance_lock = Lock()
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> MetricsRegistry:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = MetricsRegistry()
+            return cls._instance
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render_prometheus(self) -> str:
+        """Render every registered metric in the Prometheus text format 0.0.4."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # Registration is idempotent so modules can be re-imported.
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
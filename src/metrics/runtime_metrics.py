@@ -0,0 +1,288 @@
+"""Metric families recorded by the Sona runtime.
+
+Metrics are declared once here so that producers (transcriber, orchestrator,
+downloads) and the ``/api/metrics`` endpoint agree on names and labels.
+"""
+
+from __future__ import annotations
+
+from src.metrics.metrics_registry import MetricsRegistry
+from src.utils.process_memory import current_rss_bytes
+
+_registry = MetricsRegistry.get_instance()
+
+RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0)
+HTTP_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+MODEL_LOAD_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 160.0)
+
+TRANSCRIPTION_LATENCY_SECONDS = _registry.histogram(
+    "sona_transcription_latency_seconds",
+    "Wall-clock Whisper inference time per transcription.",
+    ("model", "device"),
+)
+
+TRANSCRIPTION_REAL_TIME_FACTOR = _registry.histogram(
+    "sona_transcription_real_time_factor",
+    "Inference time divided by audio duration (lower is faster).",
+    ("model", "device"),
+    buckets=RTF_BUCKETS,
+)
+
+PIPELINE_STAGE_SECONDS = _registry.histogram(
+    "sona_pipeline_stage_seconds",
+    "Time spent in each stage of the background transcription pipeline.",
+    ("stage",),
+)
+
+PIPELINE_ERRORS_TOTAL = _registry.counter(
+    "sona_pipeline_errors_total",
+    "Errors raised by the runtime, by pipeline stage.",
+    ("stage",),
+)
+
+MODEL_LOAD_SECONDS = _registry.histogram(
+    "sona_model_load_seconds",
+    "Time taken to load a Whisper model onto its device.",
+    ("model", "device"),
+    buckets=MODEL_LOAD_BUCKETS,
+)
+
+MODEL_LOADED = _registry.gauge(
+    "sona_model_loaded",
+    "1 while the given model is resident in memory, 0 otherwise.",
+    ("model", "device"),
+)
+
+PROCESS_RESIDENT_MEMORY_BYTES = _registry.gauge(
+    "sona_process_resident_memory_bytes",
+    "Resident set size of the Sona process.",
+)
+
+MODEL_MEASURED_FOOTPRINT_BYTES = _registry.gauge(
+    "sona_model_measured_footprint_bytes",
+    "Resident memory added by the most recent load of each model.",
+    ("model", "device"),
+)
+
+MODEL_RETAINED_AFTER_UNLOAD_BYTES = _registry.gauge(
+    "sona_model_retained_after_unload_bytes",
+    "Resident memory still held after the most recent unload of each model, "
+    "relative to before its load.",
+    ("model",),
+)
+
+MODEL_RELOAD_RSS_RATCHET_TOTAL = _registry.counter(
+    "sona_model_reload_rss_ratchet_total",
+    "Times resident memory kept growing across consecutive model reloads.",
+)
+
+MODEL_EVICTIONS_TOTAL = _registry.counter(
+    "sona_model_evictions_total",
+    "Models unloaded by the idle-eviction policy, by reason.",
+    ("reason",),
+)
+
+EXECUTOR_QUEUE_DEPTH = _registry.gauge(
+    "sona_executor_queue_depth",
+    "Tasks waiting in the shared executor queue.",
+)
+
+EXECUTOR_ACTIVE_WORKERS = _registry.gauge(
+    "sona_executor_active_workers",
+    "Shared executor workers currently running a task.",
+)
+
+EXECUTOR_MAX_WORKERS = _registry.gauge(
+    "sona_executor_max_workers",
+    "Configured size of the shared executor pool.",
+)
+
+MODEL_DOWNLOADS_TOTAL = _registry.counter(
+    "sona_model_downloads_total",
+    "Finished model downloads, by outcome.",
+    ("state",),
+)
+
+MODEL_DOWNLOAD_BYTES_TOTAL = _registry.counter(
+    "sona_model_download_bytes_total",
+    "Bytes of model checkpoints written to the local cache.",
+)
+
+MODEL_DOWNLOADS_IN_PROGRESS = _registry.gauge(
+    "sona_model_downloads_in_progress",
+    "Model downloads currently running.",
+)
+
+MODEL_CACHE_VERIFICATIONS_TOTAL = _registry.counter(
+    "sona_model_cache_verifications_total",
+    "Checksum verifications of cached model files, by result.",
+    ("result",),
+)
+
+MODEL_SOURCE_RESOLUTIONS_TOTAL = _registry.counter(
+    "sona_model_source_resolutions_total",
+    "Models installed into the local cache, by source tier.",
+    ("source",),
+)
+
+MODEL_FILES_SERVED_TOTAL = _registry.counter(
+    "sona_model_files_served_total",
+    "Model checkpoint requests answered by the LAN mirror endpoint.",
+)
+
+HTTP_REQUEST_SECONDS = _registry.histogram(
+    "sona_http_request_seconds",
+    "Time to handle an API request, by route template, method and status.",
+    ("route", "method", "status"),
+    buckets=HTTP_LATENCY_BUCKETS,
+)
+
+SSE_CLIENTS = _registry.gauge(
+    "sona_sse_clients",
+    "Clients connected to the /api/events stream.",
+)
+
+SSE_EVENTS_DROPPED_TOTAL = _registry.counter(
+    "sona_sse_events_dropped_total",
+    "Events discarded because a slow /api/events client's buffer was full.",
+)
+
+HISTORY_ENTRIES_WRITTEN_TOTAL = _registry.counter(
+    "sona_history_entries_written_total",
+    "Transcripts persisted to the history database.",
+)
+
+HISTORY_ENTRIES_DROPPED_TOTAL = _registry.counter(
+    "sona_history_entries_dropped_total",
+    "Transcripts not recorded because the history write queue was full.",
+)
+
+EVENT_BUS_QUEUE_DEPTH = _registry.gauge(
+    "sona_event_bus_queue_depth",
+    "Events waiting in a subscriber's delivery queue.",
+    ("subscriber",),
+)
+
+EVENT_BUS_DROPPED_TOTAL = _registry.counter(
+    "sona_event_bus_dropped_total",
+    "Events dropped because a subscriber's delivery queue was full.",
+    ("subscriber", "event"),
+)
+
+EVENT_BUS_COALESCED_TOTAL = _registry.counter(
+    "sona_event_bus_coalesced_total",
+    "Events superseded by a newer one while a debounced subscriber waited.",
+    ("subscriber",),
+)
+
+EVENT_BUS_DELIVERY_LAG_SECONDS = _registry.histogram(
+    "sona_event_bus_delivery_lag_seconds",
+    "Time from emit until a queued subscriber started handling the event.",
+    ("subscriber",),
+    buckets=HTTP_LATENCY_BUCKETS,
+)
+
+EVENT_BUS_HANDLER_ERRORS_TOTAL = _registry.counter(
+    "sona_event_bus_handler_errors_total",
+    "Exceptions raised by event handlers.",
+    ("subscriber",),
+)
+
+HOTKEY_COMMAND_LAG_SECONDS = _registry.histogram(
+    "sona_hotkey_command_lag_seconds",
+    "Time from a hotkey press/release until the recorder command thread acted on it.",
+    ("command",),
+    buckets=HTTP_LATENCY_BUCKETS,
+)
+
+HOTKEY_COMMANDS_DEBOUNCED_TOTAL = _registry.counter(
+    "sona_hotkey_commands_debounced_total",
+    "Hotkey events ignored as auto-repeat or re-trigger bounce.",
+    ("reason",),
+)
+
+STARTUP_SECONDS = _registry.gauge(
+    "sona_startup_seconds",
+    "Time from process start until the hotkey listener and API were ready.",
+)
+
+BACKGROUND_IMPORT_SECONDS = _registry.gauge(
+    "sona_background_import_seconds",
+    "Time taken to import a heavy module off the startup path.",
+    ("module",),
+)
+
+DEVICE_BENCHMARK_SECONDS = _registry.gauge(
+    "sona_device_benchmark_seconds",
+    "Measured Whisper encoder time per 30 s window, by device and model size.",
+    ("device", "model_size"),
+)
+
+API_TRANSCRIPTIONS_TOTAL = _registry.counter(
+    "sona_api_transcriptions_total",
+    "POST /api/transcribe jobs by outcome (completed, failed, rejected_*).",
+    ("outcome",),
+)
+
+API_TRANSCRIPTION_QUEUE_DEPTH = _registry.gauge(
+    "sona_api_transcription_queue_depth",
+    "API transcription jobs waiting for the dispatcher.",
+)
+
+API_TRANSCRIPTION_ESTIMATED_WAIT_SECONDS = _registry.gauge(
+    "sona_api_transcription_estimated_wait_seconds",
+    "Queue wait estimated for the most recent API transcription request.",
+)
+
+REPLICA_IN_FLIGHT = _registry.gauge(
+    "sona_replica_in_flight",
+    "Transcriptions dispatched to each replica process and not yet answered.",
+    ("replica",),
+)
+
+REPLICA_TRANSCRIPTIONS_TOTAL = _registry.counter(
+    "sona_replica_transcriptions_total",
+    "Transcriptions served by each replica process, by outcome.",
+    ("replica", "outcome"),
+)
+
+STREAM_SESSIONS_ACTIVE = _registry.gauge(
+    "sona_stream_sessions_active",
+    "Open /api/stream WebSocket sessions.",
+)
+
+STREAM_SESSIONS_TOTAL = _registry.counter(
+    "sona_stream_sessions_total",
+    "/api/stream sessions by outcome (accepted, rejected).",
+    ("outcome",),
+)
+
+STREAM_HYPOTHESIS_LATENCY_SECONDS = _registry.histogram(
+    "sona_stream_hypothesis_latency_seconds",
+    "Time from the audio snapshot to its partial or final hypothesis.",
+    ("kind",),
+)
+
+TRANSCRIPT_CACHE_LOOKUPS_TOTAL = _registry.counter(
+    "sona_transcript_cache_lookups_total",
+    "Transcript cache lookups by result (memory_hit, disk_hit, miss).",
+    ("result",),
+)
+
+TRANSCRIPT_CACHE_HIT_RATIO = _registry.gauge(
+    "sona_transcript_cache_hit_ratio",
+    "Share of transcript cache lookups answered from either tier since start.",
+)
+
+TRANSCRIPT_CACHE_DISK_BYTES = _registry.gauge(
+    "sona_transcript_cache_disk_bytes",
+    "Size of the on-disk transcript cache tier.",
+)
+
+
+def _collect_resident_memory() -> dict:
+    rss = current_rss_bytes()
+    return {} if rss is None else {(): rss}
+
+
+PROCESS_RESIDENT_MEMORY_BYTES.set_function(_collect_resident_memory)
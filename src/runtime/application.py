@@ -0,0 +1,182 @@
+"""Wire the Sona services, start the hotkey runtime and build the API app.
+
+This module is the startup import graph: ``run.py`` imports it only after the
+command line has been parsed, and ``--startup-report`` measures what importing
+it costs. Nothing imported from here may pull in torch or whisper; those are
+imported in the background once the API is up (see ``background_imports``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+from pathlib import Path
+from typing import Optional, Tuple
+
+from flask import Flask
+
+from src.AppServices import AppServices
+from src.core.transcription.download_model import configure_model_downloader
+from src.core.transcription.model_downloader import ResumableDownloader
+from src.core.transcription.transcript_cache import TranscriptCache
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.events import Event
+from src.runtime.shared_executor import DEFAULT_MAX_WORKERS, configure_shared_executor
+from src.runtime.transcription_runtime_manager import AudioTranscriptionRuntimeManager
+from src.server.app import (
+    STREAMING_AVAILABLE,
+    FlaskServices,
+    create_flask_app_with,
+    create_mirror_app,
+)
+from src.server.config.repository.config_repository import ConfigRepositoryImpl
+from src.server.config.serivce.cached_config_load_service import CachedConfigLoadService
+from src.server.config.serivce.config_load_service_impl import ConfigLoadServiceImpl
+from src.server.config.serivce.config_saver_service_impl import ConfigSaverServiceImpl
+from src.server.history.repository.history_repository import HistoryRepositoryImpl
+from src.server.history.service.history_service import HistoryServiceImpl
+from src.server.history.service.history_writer import HistoryWriter
+from src.server.hot_key.repository.hot_key_repository import HotKeyRepositoryImpl
+from src.server.hot_key.service.hot_key_service import HotKeyServiceImpl
+from src.server.models.repository.model_cache_index import ModelCacheIndex
+from src.server.models.repository.model_repository import ModelRepositoryImpl
+from src.server.models.repository.model_sources_repository import (
+    ModelSourcesRepositoryImpl,
+)
+from src.server.models.service.local_model_service import LocalModelServiceImpl
+from src.server.transcription.service.audio_upload_service import (
+    AudioUploadServiceImpl,
+)
+from src.server.transcription.service.streaming_transcription_service import (
+    StreamingTranscriptionServiceImpl,
+)
+from src.server.transcription.service.transcription_job_service import (
+    TranscriptionJobServiceImpl,
+)
+from src.server.wsgi_server import ServerSettings
+
+CONFIG_RELOAD_DEBOUNCE_SECONDS = 0.5
+
+
+def build_application(
+    args: argparse.Namespace, project_root: Path
+) -> Tuple[Flask, ServerSettings, Optional[Flask]]:
+    """Start the hotkey runtime and return the API and mirror apps ready to be served."""
+    replicas = max(1, args.replicas)
+    # one lane per replica plus the hotkey and prefetch lanes
+    configure_shared_executor(max(DEFAULT_MAX_WORKERS, replicas + 2))
+    # shared directories, then LAN mirrors, then upstream
+    model_sources = ModelSourcesRepositoryImpl().read_sources()
+    configure_model_downloader(
+        ResumableDownloader(
+            base_url=args.model_base_url,
+            segments=args.download_segments,
+            max_bytes_per_second=args.download_limit_kbps * 1024 or None,
+            mirror_urls=model_sources.mirror_urls,
+            use_upstream=model_sources.use_upstream,
+        )
+    )
+    hot_key_service = HotKeyServiceImpl(HotKeyRepositoryImpl())
+    model_cache_index = ModelCacheIndex()
+    model_cache_index.subscribe(EventMessenger.get_instance())
+    model_cache_index.start()
+    atexit.register(model_cache_index.stop)
+    model_service = LocalModelServiceImpl(
+        ModelRepositoryImpl(model_sources), model_cache_index, model_sources
+    )
+    config_defaults = {
+        "hot_key": hot_key_service.get_default_hot_key().name,
+        "model": model_service.get_default_model_name(),
+    }
+    config_repository = ConfigRepositoryImpl()
+    config_loader = CachedConfigLoadService(
+        ConfigLoadServiceImpl(config_repository, config_defaults), config_repository
+    )
+    config_saver = ConfigSaverServiceImpl(config_repository)
+    messenger = EventMessenger.get_instance()
+    # subscribed first so the runtime reload below never sees a stale config
+    config_loader.subscribe(messenger)
+
+    # outlives runtime reloads, so a model switch keeps the other model's hits
+    transcript_cache = (
+        TranscriptCache(max_disk_bytes=args.transcript_cache_mb * 1024 * 1024)
+        if args.transcript_cache_mb > 0
+        else None
+    )
+    app_services = AppServices(
+        project_root,
+        config_loader,
+        hot_key_service,
+        replicas=replicas,
+        transcript_cache=transcript_cache,
+    )
+
+    audio_transcription_runtime = AudioTranscriptionRuntimeManager(app_services)
+    # enure runtime is reloaded on config change though event subscription;
+    # debounced so a burst of saves rebuilds the runtime once, off the
+    # request thread
+    messenger.subscribe(
+        Event.CONFIG_SAVED,
+        audio_transcription_runtime.reload,
+        debounce_seconds=CONFIG_RELOAD_DEBOUNCE_SECONDS,
+        name="runtime_reload",
+    )
+
+    # persist completed transcriptions off the transcription thread
+    history_repository = HistoryRepositoryImpl()
+    history_writer = HistoryWriter(history_repository)
+    history_writer.subscribe(messenger)
+    history_writer.start()
+    atexit.register(history_writer.stop)
+
+    audio_transcription_runtime.start()
+
+    streaming_enabled = args.stream_port > 0 or args.debug
+    stream_max_sessions = args.stream_max_sessions or replicas
+    if streaming_enabled and not STREAMING_AVAILABLE:
+        print("[INFO] flask-sock is not installed; /api/stream is disabled (pip install flask-sock)")
+        streaming_enabled = False
+    server_settings = ServerSettings(
+        host=args.host,
+        port=args.port,
+        threads=max(1, args.threads),
+        keep_alive_seconds=args.keep_alive,
+        debug=args.debug,
+        stream_port=args.stream_port if streaming_enabled else 0,
+        # room for clients over the session cap to be told why they are closed
+        stream_connection_limit=stream_max_sessions + 2,
+        mirror_host=args.mirror_host,
+        mirror_port=args.mirror_port if model_sources.serve_mirror else 0,
+    )
+    flask_app = create_flask_app_with(
+        FlaskServices(
+            model_service,
+            hot_key_service,
+            config_loader,
+            config_saver,
+            HistoryServiceImpl(history_repository),
+            # POST /api/transcribe runs on the live orchestrator, so other
+            # tools share the loaded model instead of loading their own
+            TranscriptionJobServiceImpl(
+                audio_transcription_runtime.current_orchestrator,
+                max_queued_jobs=args.api_max_queued_jobs,
+                wait_slo_seconds=args.api_wait_slo_seconds,
+                concurrency=replicas,
+            ),
+            AudioUploadServiceImpl(),
+            # every session keeps one inference lane busy while its client
+            # speaks, so by default there is one session per replica
+            (
+                StreamingTranscriptionServiceImpl(
+                    audio_transcription_runtime.current_orchestrator,
+                    max_sessions=stream_max_sessions,
+                )
+                if streaming_enabled
+                else None
+            ),
+        ),
+        # each open /api/events stream holds a worker thread; keep half free
+        max_event_clients=max(1, server_settings.threads // 2),
+    )
+    mirror_app = create_mirror_app(model_service) if server_settings.mirror_port else None
+    return flask_app, server_settings, mirror_app
@@ -0,0 +1,60 @@
+"""Import the inference stack (torch, whisper) off the startup path.
+
+Both take seconds to import and are only needed once the first recording is
+transcribed, so they are imported on a daemon thread after the API and the
+hotkey listener are up. A transcription that starts earlier simply blocks on
+Python's per-module import lock until the background import finishes.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import Optional, Sequence
+
+from src.metrics.runtime_metrics import BACKGROUND_IMPORT_SECONDS
+
+HEAVY_MODULES = ("torch", "whisper")
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+
+
+def start_background_imports(modules: Sequence[str] = HEAVY_MODULES) -> threading.Thread:
+    """Start importing ``modules`` in order on a daemon thread (once)."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_import_all,
+                args=(tuple(modules),),
+                name="BackgroundImportThread",
+                daemon=True,
+            )
+            _thread.start()
+        return _thread
+
+
+def wait_for_background_imports(timeout: Optional[float] = None) -> bool:
+    """Block until the background imports are done; True if they finished."""
+    with _lock:
+        thread = _thread
+    if thread is None:
+        return True
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def _import_all(modules: Sequence[str]) -> None:
+    for module_name in modules:
+        started_at = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+        except Exception as exc:
+            # Surfaces again, with context, when the transcriber loads.
+            print(f"[WARNING] Background import of {module_name} failed: {exc}")
+            continue
+        elapsed = time.perf_counter() - started_at
+        BACKGROUND_IMPORT_SECONDS.labels(module=module_name).set(elapsed)
+        print(f"[INFO] Imported {module_name} in the background in {elapsed * 1000:.0f} ms")
@@ -1,10 +1,16 @@
 # python
 import os
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Lock
-from typing import Optional
+from typing import Any, Callable, Optional
 import atexit
 
+from src.metrics.runtime_metrics import (
+    EXECUTOR_ACTIVE_WORKERS,
+    EXECUTOR_MAX_WORKERS,
+    EXECUTOR_QUEUE_DEPTH,
+)
+
 _lock = Lock()
 _executor: Optional[ThreadPoolExecutor] = None
 
@@ -12,13 +18,57 @@ _executor: Optional[ThreadPoolExecutor] = None
 DEFAULT_MAX_WORKERS = 3
 
 
+class _InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that tracks how many workers are busy.
+
+    Queue depth is read from the executor's work queue at scrape time, so the
+    only per-task cost is one counter increment and decrement.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._active_workers = 0
+        self._active_lock = Lock()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(self._run_tracked, fn, *args, **kwargs)
+
+    def active_workers(self) -> int:
+        return self._active_workers
+
+    def queue_depth(self) -> int:
+        return self._work_queue.qsize()
+
+    def _run_tracked(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._active_lock:
+            self._active_workers += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._active_lock:
+                self._active_workers -= 1
+
+
+_max_workers = DEFAULT_MAX_WORKERS
+
+
+def configure_shared_executor(max_workers: int) -> None:
+    """Size the shared executor; only honoured before its first use."""
+    global _max_workers
+    with _lock:
+        if _executor is not None:
+            print("[WARNING] Shared executor already running; size unchanged")
+            return
+        _max_workers = max(1, max_workers)
+
+
 def get_shared_executor() -> ThreadPoolExecutor:
     """Return a singleton ThreadPoolExecutor for the process."""
     global _executor
     with _lock:
         if _executor is None:
-            _executor = ThreadPoolExecutor(
-                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="shared-worker"
+            _executor = _InstrumentedThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="shared-worker"
             )
         return _executor
 
@@ -32,5 +82,21 @@ def shutdown_shared_executor(wait: bool = True) -> None:
             _executor = None
 
 
+def _collect_executor_metric(reader: Callable[[_InstrumentedThreadPoolExecutor], int]):
+    def collect() -> dict:
+        executor = _executor
+        if executor is None:
+            return {(): 0}
+        return {(): reader(executor)}
+
+    return collect
+
+
+EXECUTOR_QUEUE_DEPTH.set_function(_collect_executor_metric(lambda e: e.queue_depth()))
+EXECUTOR_ACTIVE_WORKERS.set_function(
+    _collect_executor_metric(lambda e: e.active_workers())
+)
+EXECUTOR_MAX_WORKERS.set_function(_collect_executor_metric(lambda e: e._max_workers))
+
 # Ensure cleanup at process exit
 atexit.register(shutdown_shared_executor)
@@ -0,0 +1,119 @@
+"""Report what importing the startup graph costs, module by module.
+
+Runs a fresh interpreter with ``-X importtime`` that imports only the modules
+needed before the hotkey listener and API are ready, parses the timings
+Python writes to stderr, and prints the most expensive modules and top-level
+packages. The report fails (non-zero exit) when the total exceeds the budget
+or when a module that must be imported in the background shows up.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from src.runtime.background_imports import HEAVY_MODULES
+
+STARTUP_MODULE = "src.runtime.application"
+DEFAULT_BUDGET_MS = 1500
+DEFAULT_TOP_MODULES = 25
+
+# "import time:       412 |       1234 |     flask.app"
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".", 1)[0]
+
+
+def parse_import_times(stderr: str) -> List[ImportTiming]:
+    timings = []
+    for line in stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            timings.append(
+                ImportTiming(
+                    module=match.group(4),
+                    self_us=int(match.group(1)),
+                    cumulative_us=int(match.group(2)),
+                    depth=len(match.group(3)) // 2,
+                )
+            )
+    return timings
+
+
+def collect_import_times(
+    project_root: Path, module: str = STARTUP_MODULE
+) -> List[ImportTiming]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(project_root),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        last_line = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+        raise RuntimeError(f"Importing {module} failed: {last_line}")
+    return parse_import_times(completed.stderr)
+
+
+def run_startup_report(
+    project_root: Path,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    top: int = DEFAULT_TOP_MODULES,
+    forbidden: Sequence[str] = HEAVY_MODULES,
+) -> int:
+    """Print the report and return the process exit code."""
+    try:
+        timings = collect_import_times(project_root)
+    except RuntimeError as exc:
+        print(f"[ERROR] {exc}")
+        return 2
+
+    total_ms = sum(timing.self_us for timing in timings) / 1000
+    by_package: Dict[str, int] = {}
+    for timing in timings:
+        by_package[timing.package] = by_package.get(timing.package, 0) + timing.self_us
+
+    print(f"Startup imports: {len(timings)} modules, {total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    print()
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        print(
+            f"{timing.cumulative_us / 1000:14.1f} {timing.self_us / 1000:9.1f}  "
+            f"{'  ' * timing.depth}{timing.module}"
+        )
+    print()
+    print(f"{'total ms':>14} {'share':>9}  package")
+    for package, self_us in sorted(by_package.items(), key=lambda i: i[1], reverse=True)[:top]:
+        share = self_us / 1000 / total_ms if total_ms else 0.0
+        print(f"{self_us / 1000:14.1f} {share:9.1%}  {package}")
+
+    exit_code = 0
+    imported_packages = set(by_package)
+    eager = [name for name in forbidden if name in imported_packages]
+    if eager:
+        print()
+        print(
+            f"[ERROR] {', '.join(eager)} imported on the startup path; "
+            "import them lazily or in the background"
+        )
+        exit_code = 1
+    if total_ms > budget_ms:
+        print()
+        print(f"[ERROR] Startup imports take {total_ms:.0f} ms, over the {budget_ms:.0f} ms budget")
+        exit_code = 1
+    return exit_code
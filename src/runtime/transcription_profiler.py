@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+PROFILE_MODES = ("cprofile", "torch")
+
+
+@dataclass
+class ProfileCapture:
+    """Result of profiling a single transcription."""
+
+    mode: str
+    artifact_path: str
+    wall_time_seconds: float
+    captured_at: float
+    hotspots: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class TranscriptionProfiler:
+    """TranscriptionProfiler
+
+    Responsibility:
+        Capture profiles of the next N transcriptions on demand so latency
+        regressions can be diagnosed on a user's machine. Profile artifacts
+        are written under ``~/.sona/profiles`` and a short hotspot summary is
+        kept in memory for the API.
+
+    Interface:
+        * get_instance() -> TranscriptionProfiler
+        * armed: bool attribute, the only thing callers check on the hot path,
+          so an unarmed profiler costs a single attribute read.
+        * arm(count, mode) -> dict: profile the next ``count`` transcriptions
+          with ``"cprofile"`` or ``"torch"`` (``torch.profiler``).
+        * disarm() -> None
+        * run(fn, *args) -> Any: execute ``fn`` under the armed profiler.
+        * status() -> dict: current arming state and recent captures.
+    """
+
+    PROFILES_DIR: Path = Path.home() / ".sona" / "profiles"
+    MAX_KEPT_CAPTURES = 20
+    TOP_HOTSPOTS = 15
+
+    _instance: Optional[TranscriptionProfiler] = None
+    _instance_lock = Lock()
+
+    def __init__(self) -> None:
+        self.armed = False
+        self._mode = "cprofile"
+        self._remaining = 0
+        self._lock = Lock()
+        # cProfile (sys.monitoring) and torch.profiler are process-wide, so
+        # only one transcription is profiled at a time.
+        self._capture_lock = Lock()
+        self._captures: Deque[ProfileCapture] = deque(maxlen=self.MAX_KEPT_CAPTURES)
+
+    @classmethod
+    def get_instance(cls) -> TranscriptionProfiler:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = TranscriptionProfiler()
+            return cls._instance
+
+    def arm(self, count: int, mode: str = "cprofile") -> Dict[str, Any]:
+        """Profile the next ``count`` transcriptions with the given mode.
+
+        Raises:
+            ValueError: If ``count`` is not positive or ``mode`` is unknown.
+        """
+        if count <= 0:
+            raise ValueError("Profile count must be a positive integer")
+        if mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Unknown profile mode '{mode}'; expected one of {', '.join(PROFILE_MODES)}"
+            )
+        with self._lock:
+            self._mode = mode
+            self._remaining = count
+            self.armed = True
+        return self.status()
+
+    def disarm(self) -> None:
+        with self._lock:
+            self._remaining = 0
+            self.armed = False
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "armed": self.armed,
+                "mode": self._mode,
+                "remaining": self._remaining,
+                "profiles_dir": str(self.PROFILES_DIR),
+                "captures": [asdict(capture) for capture in self._captures],
+            }
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn`` under the profiler if a capture slot is still available.
+
+        Falls back to a plain call when the profiler was disarmed in the
+        meantime or another transcription is already being profiled.
+        """
+        mode = self._claim_capture()
+        if mode is None:
+            return fn(*args)
+        if not self._capture_lock.acquire(blocking=False):
+            self._release_claim()
+            return fn(*args)
+        try:
+            if mode == "torch":
+                return self._run_with_torch_profiler(fn, *args)
+            return self._run_with_cprofile(fn, *args)
+        finally:
+            self._capture_lock.release()
+
+    def _claim_capture(self) -> Optional[str]:
+        with self._lock:
+            if not self.armed or self._remaining <= 0:
+                return None
+            self._remaining -= 1
+            if self._remaining == 0:
+                self.armed = False
+            return self._mode
+
+    def _release_claim(self) -> None:
+        with self._lock:
+            self._remaining += 1
+            self.armed = True
+
+    def _run_with_cprofile(self, fn: Callable[..., Any], *args: Any) -> Any:
+        profiler = cProfile.Profile()
+        started_at = time.perf_counter()
+        profiler.enable()
+        try:
+            return fn(*args)
+        finally:
+            profiler.disable()
+            wall_time = time.perf_counter() - started_at
+            try:
+                artifact_path = self._artifact_path("prof")
+                stats = pstats.Stats(profiler, stream=io.StringIO())
+                stats.dump_stats(str(artifact_path))
+                self._store_capture(
+                    "cprofile",
+                    artifact_path,
+                    wall_time,
+                    _cprofile_hotspots(stats, self.TOP_HOTSPOTS),
+                )
+            except Exception as exc:
+                print(f"[WARNING] Failed to write cProfile capture: {exc}")
+
+    def _run_with_torch_profiler(self, fn: Callable[..., Any], *args: Any) -> Any:
+        try:
+            from torch import profiler as torch_profiler  # type: ignore
+            import torch  # type: ignore
+        except Exception as exc:
+            print(f"[WARNING] torch.profiler unavailable, using cProfile: {exc}")
+            return self._run_with_cprofile(fn, *args)
+
+        activities = [torch_profiler.ProfilerActivity.CPU]
+        if torch.cuda.is_available():
+            activities.append(torch_profiler.ProfilerActivity.CUDA)
+
+        started_at = time.perf_counter()
+        with torch_profiler.profile(activities=activities, record_shapes=True) as prof:
+            result = fn(*args)
+        wall_time = time.perf_counter() - started_at
+        try:
+            artifact_path = self._artifact_path("json")
+            prof.export_chrome_trace(str(artifact_path))
+            self._store_capture(
+                "torch",
+                artifact_path,
+                wall_time,
+                _torch_hotspots(prof, self.TOP_HOTSPOTS),
+            )
+        except Exception as exc:
+            print(f"[WARNING] Failed to write torch.profiler capture: {exc}")
+        return result
+
+    def _artifact_path(self, extension: str) -> Path:
+        self.PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        suffix = time.time_ns() % 1_000_000
+        return self.PROFILES_DIR / f"transcription-{stamp}-{suffix}.{extension}"
+
+    def _store_capture(
+        self,
+        mode: str,
+        artifact_path: Path,
+        wall_time: float,
+        hotspots: List[Dict[str, Any]],
+    ) -> None:
+        capture = ProfileCapture(
+            mode=mode,
+            artifact_path=str(artifact_path),
+            wall_time_seconds=wall_time,
+            captured_at=time.time(),
+            hotspots=hotspots,
+        )
+        summary_path = artifact_path.with_suffix(".summary.json")
+        with summary_path.open("w", encoding="utf-8") as summary_file:
+            json.dump(asdict(capture), summary_file, indent=2, ensure_ascii=False)
+        with self._lock:
+            self._captures.append(capture)
+        print(f"[PROFILE] {mode} capture written to {artifact_path}")
+
+
+def _cprofile_hotspots(stats: pstats.Stats, limit: int) -> List[Dict[str, Any]]:
+    """Return the functions with the highest cumulative time."""
+    rows = []
+    raw_stats = stats.stats  # type: ignore[attr-defined]
+    for (filename, line, function), (_, calls, total, cumulative, _) in raw_stats.items():
+        rows.append(
+            {
+                "function": f"{filename}:{line}({function})",
+                "calls": calls,
+                "total_time_seconds": total,
+                "cumulative_time_seconds": cumulative,
+            }
+        )
+    rows.sort(key=lambda row: row["cumulative_time_seconds"], reverse=True)
+    return rows[:limit]
+
+
+def _torch_hotspots(prof: Any, limit: int) -> List[Dict[str, Any]]:
+    """Return the operators with the highest self CPU time."""
+    rows = []
+    for event in prof.key_averages():
+        rows.append(
+            {
+                "function": event.key,
+                "calls": event.count,
+                "total_time_seconds": event.self_cpu_time_total / 1_000_000,
+                "cumulative_time_seconds": event.cpu_time_total / 1_000_000,
+            }
+        )
+    rows.sort(key=lambda row: row["total_time_seconds"], reverse=True)
+    return rows[:limit]
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
+import time
 from threading import RLock, Thread
-from typing import Optional
+from typing import List, Optional, Set
 
 from src.AppServices import AppServices
 from src.core.hot_key.hotkey_controller import HotkeyController
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import ConfigSaved, RuntimeReloaded
+from src.event_management.events import Event
 from src.core.transcription.background_transcription_orchestrator import (
     BackgroundTranscriptionOrchestratorImpl,
 )
+from src.server.config.entity.user_config import UserConfig
+
+# Settings that require a new transcriber (and therefore a new orchestrator).
+MODEL_SETTINGS = frozenset({"current_model"})
 
 
 @dataclass
@@ -16,10 +25,28 @@ class RuntimeState:
     orchestrator: BackgroundTranscriptionOrchestratorImpl
     hotkey_controller: HotkeyController
     hotkey_thread: Thread
+    # The configuration the components above were built from.
+    user_config: UserConfig
+
+
+def diff_user_config(old: UserConfig, new: UserConfig) -> Set[str]:
+    """Return the names of the top-level UserConfig fields that differ."""
+    return {
+        field.name
+        for field in dataclasses.fields(UserConfig)
+        if getattr(old, field.name) != getattr(new, field.name)
+    }
 
 
 class AudioTranscriptionRuntimeManager:
-    """Own the lifecycle of the hotkey listener + transcription orchestrator."""
+    """Own the lifecycle of the hotkey listener + transcription orchestrator.
+
+    ``reload`` compares the saved configuration with the one the runtime was
+    built from and only touches what changed: a new hotkey restarts the
+    listener, a new clipboard behaviour swaps the result handler, a new
+    eviction policy retunes the evictor, and only a model change rebuilds
+    the orchestrator (unloading the current model).
+    """
 
     def __init__(self, app_services: AppServices) -> None:
         self._app_services = app_services
@@ -30,14 +57,40 @@ class AudioTranscriptionRuntimeManager:
         with self._lock:
             if self._state is not None:
                 return
-            self._state = self._create_state()
+            self._state = self._create_state(self._app_services.load_user_config())
             self._state.hotkey_thread.start()
 
-    def reload(self) -> None:
+    def reload(self, _event: Optional[ConfigSaved] = None) -> None:
         with self._lock:
-            self._teardown_locked()
-            self._state = self._create_state()
-            self._state.hotkey_thread.start()
+            started_at = time.perf_counter()
+            user_config = self._app_services.load_user_config()
+            if self._state is None:
+                changed_settings = {
+                    field.name for field in dataclasses.fields(UserConfig)
+                }
+                reloaded_components = ["orchestrator", "hotkey_listener"]
+                self._state = self._create_state(user_config)
+                self._state.hotkey_thread.start()
+            else:
+                changed_settings = diff_user_config(self._state.user_config, user_config)
+                reloaded_components = self._apply_changes_locked(
+                    changed_settings, user_config
+                )
+            reload_seconds = time.perf_counter() - started_at
+
+        if reloaded_components:
+            print(
+                f"[INFO] Runtime reloaded {', '.join(reloaded_components)} "
+                f"in {reload_seconds * 1000:.0f} ms"
+            )
+        EventMessenger.get_instance().emit(
+            Event.RUNTIME_RELOADED,
+            RuntimeReloaded(
+                reload_seconds=reload_seconds,
+                changed_settings=tuple(sorted(changed_settings)),
+                reloaded_components=tuple(reloaded_components),
+            ),
+        )
 
     def stop(self) -> None:
         with self._lock:
@@ -48,28 +101,73 @@ class AudioTranscriptionRuntimeManager:
         with self._lock:
             return self._state
 
-    def _create_state(self) -> RuntimeState:
-        orchestrator = self._app_services.create_transcription_orchestrator()
-        hotkey_controller = self._app_services.create_hot_key_controller(orchestrator)
-        hotkey_thread = Thread(
-            target=hotkey_controller.start_listening,
-            name="HotkeyListenerThread",
-            daemon=True,
+    def current_orchestrator(self) -> Optional[BackgroundTranscriptionOrchestratorImpl]:
+        with self._lock:
+            return self._state.orchestrator if self._state is not None else None
+
+    def _apply_changes_locked(
+        self, changed_settings: Set[str], user_config: UserConfig
+    ) -> List[str]:
+        state = self._state
+        reloaded_components: List[str] = []
+        if changed_settings & MODEL_SETTINGS:
+            # The hotkey actions hold the orchestrator, so both are rebuilt.
+            self._teardown_locked()
+            self._state = self._create_state(user_config)
+            self._state.hotkey_thread.start()
+            return ["orchestrator", "hotkey_listener"]
+
+        if "clipboard_behaviour" in changed_settings:
+            state.orchestrator.set_result_handler(
+                self._app_services.create_result_handler(user_config)
+            )
+            reloaded_components.append("result_handler")
+        if "model_eviction" in changed_settings:
+            state.orchestrator.update_eviction_policy(user_config.model_eviction)
+            reloaded_components.append("model_evictor")
+        if "hot_key" in changed_settings:
+            self._stop_listener_locked()
+            state.hotkey_controller = self._app_services.create_hot_key_controller(
+                state.orchestrator, user_config
+            )
+            state.hotkey_thread = self._listener_thread(state.hotkey_controller)
+            state.hotkey_thread.start()
+            reloaded_components.append("hotkey_listener")
+        # Any other setting is read on demand and needs no runtime change.
+        state.user_config = user_config
+        return reloaded_components
+
+    def _create_state(self, user_config: UserConfig) -> RuntimeState:
+        orchestrator = self._app_services.create_transcription_orchestrator(user_config)
+        hotkey_controller = self._app_services.create_hot_key_controller(
+            orchestrator, user_config
         )
         return RuntimeState(
             orchestrator=orchestrator,
             hotkey_controller=hotkey_controller,
-            hotkey_thread=hotkey_thread,
+            hotkey_thread=self._listener_thread(hotkey_controller),
+            user_config=user_config,
         )
 
-    def _teardown_locked(self) -> None:
-        if self._state is None:
-            return
+    @staticmethod
+    def _listener_thread(hotkey_controller: HotkeyController) -> Thread:
+        return Thread(
+            target=hotkey_controller.start_listening,
+            name="HotkeyListenerThread",
+            daemon=True,
+        )
+
+    def _stop_listener_locked(self) -> None:
         stop_listening = getattr(self._state.hotkey_controller, "stop_listening", None)
         if callable(stop_listening):
             stop_listening()
         if self._state.hotkey_thread.is_alive():
             self._state.hotkey_thread.join(timeout=1.0)
+
+    def _teardown_locked(self) -> None:
+        if self._state is None:
+            return
+        self._stop_listener_locked()
         shutdown = getattr(self._state.orchestrator, "shutdown", None)
         if callable(shutdown):
             shutdown()
@@ -1,17 +1,49 @@
 import dataclasses
+import time
+from typing import Optional
 
 from flask_cors import CORS
-from flask import Flask, jsonify, request, Response
+from flask import Flask, g, jsonify, request, Response, send_file
+from werkzeug.exceptions import RequestEntityTooLarge
 import json
 
 from .config.serivce.config_load_service import ConfigLoadService
-from .config.entity.user_config import UserConfig, ClipboardBehaviour
+from .config.entity.user_config import UserConfig, ClipboardBehaviour, ModelEviction
 from .config.serivce.config_saving_service import ConfigSavingService
+from .events.sse_broadcaster import SseBroadcaster
 from .exception.model_in_system_exception import ModelInSystemException
-from .models.service.local_model_service import  LocalModelService
+from .exception.transcription_overloaded_exception import (
+    TranscriptionOverloadedException,
+)
+from .history.entity.transcript_entry import HistoryPage
+from .history.service.history_service import DEFAULT_PAGE_SIZE, HistoryService
+from .models.service.local_model_service import  LocalModelService, MODEL_LINKED
 from .hot_key.service.hot_key_service import  HotKeyService
+from .transcription.entity.transcription_job import COMPLETED, FAILED, TranscriptionJob
+from .transcription.service.audio_upload_service import (
+    AudioUploadService,
+    AudioUploadServiceImpl,
+)
+from .transcription.entity.streaming_hypothesis import StreamingHypothesis
+from .transcription.service.streaming_transcription_service import (
+    StreamingTranscriptionService,
+)
+from .transcription.service.transcription_job_service import TranscriptionJobService
+from .wsgi_server import MODEL_FILES_PATH, STREAM_PATH
 from ..event_management.event_messenger import EventMessenger
+from ..event_management.event_payloads import ConfigSaved
 from ..event_management.events import Event
+from ..metrics.metrics_registry import MetricsRegistry
+from ..metrics.runtime_metrics import HTTP_REQUEST_SECONDS, MODEL_FILES_SERVED_TOTAL
+from ..runtime.transcription_profiler import TranscriptionProfiler
+from ..core.transcription.ai_transcriber import SAMPLE_RATE
+
+try:  # optional: WebSocket streaming needs flask-sock
+    from flask_sock import Sock  # type: ignore
+except ImportError:  # pragma: no cover
+    Sock = None
+
+STREAMING_AVAILABLE = Sock is not None
 
 
 @dataclasses.dataclass
@@ -20,9 +52,59 @@ class FlaskServices:
     hot_key_service: HotKeyService
     config_loader: ConfigLoadService
     config_saver: ConfigSavingService
+    history_service: Optional[HistoryService] = None
+    transcription_job_service: Optional[TranscriptionJobService] = None
+    audio_upload_service: Optional[AudioUploadService] = None
+    streaming_transcription_service: Optional[StreamingTranscriptionService] = None
+
+
+# POST /api/transcribe
+MAX_UPLOAD_BYTES = 200 * 1024 * 1024
+DEFAULT_SYNC_TIMEOUT_SECONDS = 120.0
+MAX_SYNC_TIMEOUT_SECONDS = 600.0
+
+# /api/stream
+STREAM_POLL_SECONDS = 0.05
+STREAM_FINISH_TIMEOUT_SECONDS = 60.0
+STREAM_MAX_MESSAGE_BYTES = 1024 * 1024
+# WebSocket close codes (RFC 6455 and the IANA registry)
+WS_UNSUPPORTED_DATA = 1003
+WS_INTERNAL_ERROR = 1011
+WS_TRY_AGAIN_LATER = 1013
 
 
-def create_flask_app_with(flask_services: FlaskServices) -> Flask:
+def create_mirror_app(model_service: LocalModelService) -> Flask:
+    """A read-only app serving only the verified model files for LAN mirroring.
+
+    It is served on its own listener, so the mirror can face the LAN while
+    the API itself stays on loopback.
+    """
+    app = Flask(__name__)
+
+    @app.route(MODEL_FILES_PATH + "/<sha256>/<filename>", methods=["GET"])
+    def get_model_file(sha256: str, filename: str):
+        # Same <sha256>/<file>.pt layout as the upstream CDN, so other
+        # instances can list this server in their mirror_urls. Range
+        # requests are honoured, which lets clients resume and split downloads.
+        model_path = model_service.get_mirrored_model_file(sha256, filename)
+        if model_path is None:
+            return jsonify({"success": False, "error": "Model file not available"}), 404
+        MODEL_FILES_SERVED_TOTAL.inc()
+        return send_file(
+            model_path,
+            mimetype="application/octet-stream",
+            conditional=True,
+            etag=sha256,
+            max_age=31536000,
+        )
+
+    return app
+
+
+def create_flask_app_with(
+    flask_services: FlaskServices,
+    max_event_clients: int = SseBroadcaster.DEFAULT_MAX_CLIENTS,
+) -> Flask:
     app = Flask(__name__)
     CORS(app)  # Enable CORS for all origins
 
@@ -30,16 +112,81 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
     hot_key_service = flask_services.hot_key_service
     config_loader = flask_services.config_loader
     config_saver = flask_services.config_saver
+    history_service = flask_services.history_service
+    transcription_jobs = flask_services.transcription_job_service
+    audio_uploads = flask_services.audio_upload_service or AudioUploadServiceImpl()
+    streaming = flask_services.streaming_transcription_service
     messenger = EventMessenger.get_instance()
+    metrics_registry = MetricsRegistry.get_instance()
+    profiler = TranscriptionProfiler.get_instance()
+    sse_broadcaster = SseBroadcaster(max_clients=max_event_clients)
+    sse_broadcaster.attach(messenger)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started_at = time.perf_counter()
+
+    @app.after_request
+    def record_request_latency(response: Response):
+        started_at = g.pop("request_started_at", None)
+        if started_at is not None:
+            # Label by route template so /api/x?name=... does not explode cardinality.
+            route = request.url_rule.rule if request.url_rule else "unmatched"
+            HTTP_REQUEST_SECONDS.labels(
+                route=route, method=request.method, status=str(response.status_code)
+            ).observe(time.perf_counter() - started_at)
+        return response
 
     @app.route("/")
     def index():
         return "Hello, World!"
 
+    @app.route("/api/metrics", methods=["GET"])
+    def get_metrics():
+        return Response(
+            metrics_registry.render_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    @app.route("/api/events", methods=["GET"])
+    def stream_events():
+        client = sse_broadcaster.register(request.headers.get("Last-Event-ID"))
+        if client is None:
+            return (
+                jsonify({"success": False, "error": "Too many event stream clients"}),
+                503,
+            )
+        return Response(
+            sse_broadcaster.stream(client),
+            content_type="text/event-stream; charset=utf-8",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.route("/api/profile", methods=["GET", "POST", "DELETE"])
+    def transcription_profile():
+        if request.method == "GET":
+            return jsonify({"success": True, **profiler.status()}), 200
+        if request.method == "DELETE":
+            profiler.disarm()
+            return jsonify({"success": True, **profiler.status()}), 200
+
+        try:
+            count = int(request.args.get("n", "1"))
+            mode = request.args.get("mode", "cprofile").strip().lower()
+            status = profiler.arm(count, mode)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        # Captures happen on upcoming transcriptions; poll GET for hotspots.
+        return jsonify({"success": True, "state": "armed", **status}), 202
+
     @app.route("/api/user-config", methods=["GET", "PUT", "POST"])
     def user_config():
         if request.method == "GET":
-            return jsonify(config_loader.load_config())
+            response = jsonify(config_loader.load_config())
+            # Pollers revalidate with If-None-Match and get 304 until it changes.
+            response.add_etag()
+            response.headers["Cache-Control"] = "no-cache"
+            return response.make_conditional(request)
         elif request.method == "POST":
             try:
                 data = request.get_json(force=True)
@@ -51,7 +198,7 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
                     )
                 success = config_saver.save_user_config(config)
                 if success:
-                    messenger.emit(Event.CONFIG_SAVED)
+                    messenger.emit(Event.CONFIG_SAVED, ConfigSaved())
                     return jsonify({"success": True}), 200
                 else:
                     return (
@@ -63,15 +210,229 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
 
         return None
 
+    @app.route("/api/history", methods=["GET"])
+    def get_history():
+        if history_service is None:
+            return jsonify({"success": False, "error": "History is disabled"}), 404
+        try:
+            limit, before_id = parse_page_args()
+        except ValueError:
+            return jsonify({"success": False, "error": "Invalid limit or before_id"}), 400
+        return history_page_response(history_service.list_history(limit, before_id))
+
+    @app.route("/api/history/search", methods=["GET"])
+    def search_history():
+        if history_service is None:
+            return jsonify({"success": False, "error": "History is disabled"}), 404
+        try:
+            limit, before_id = parse_page_args()
+        except ValueError:
+            return jsonify({"success": False, "error": "Invalid limit or before_id"}), 400
+        try:
+            page = history_service.search_history(
+                request.args.get("q", ""), limit, before_id
+            )
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        return history_page_response(page)
+
+    def parse_page_args() -> tuple[int, Optional[int]]:
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        before_id = request.args.get("before_id")
+        return limit, int(before_id) if before_id else None
+
+    def history_page_response(page: HistoryPage):
+        data = {
+            "success": True,
+            "items": [dataclasses.asdict(entry) for entry in page.entries],
+            "next_before_id": page.next_before_id,
+        }
+        return Response(
+            json.dumps(data, ensure_ascii=False),
+            content_type="application/json; charset=utf-8",
+        )
+
+    @app.route("/api/transcribe", methods=["POST"])
+    def transcribe():
+        # Other local tools share the loaded model through this endpoint. The
+        # body is the audio itself (streamed to disk, chunked uploads work),
+        # raw PCM as audio/L16 or audio/pcm, or a multipart "file" field.
+        if transcription_jobs is None:
+            return (
+                jsonify({"success": False, "error": "Transcription API is disabled"}),
+                404,
+            )
+        mode = request.args.get("mode", "sync").strip().lower()
+        if mode not in ("sync", "async"):
+            return (
+                jsonify({"success": False, "error": "mode must be sync or async"}),
+                400,
+            )
+        try:
+            timeout = min(
+                float(request.args.get("timeout", DEFAULT_SYNC_TIMEOUT_SECONDS)),
+                MAX_SYNC_TIMEOUT_SECONDS,
+            )
+            # PCM format: query parameters win over audio/L16;rate=...;channels=...
+            sample_rate = request.args.get("sample_rate") or request.mimetype_params.get(
+                "rate"
+            )
+            channels = request.args.get("channels") or request.mimetype_params.get(
+                "channels"
+            )
+            sample_rate = int(sample_rate) if sample_rate else None
+            channels = int(channels) if channels else None
+        except ValueError:
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "Invalid timeout, sample_rate or channels",
+                    }
+                ),
+                400,
+            )
+
+        try:
+            # Shed load before reading the body.
+            transcription_jobs.check_admission()
+        except TranscriptionOverloadedException as e:
+            return overloaded_response(e)
+
+        request.max_content_length = MAX_UPLOAD_BYTES
+        try:
+            if request.mimetype == "multipart/form-data":
+                upload = request.files.get("file")
+                if upload is None:
+                    return jsonify({"success": False, "error": "Missing file field"}), 400
+                audio_path = audio_uploads.save_upload(
+                    upload.stream, upload.mimetype, sample_rate, channels
+                )
+            else:
+                audio_path = audio_uploads.save_upload(
+                    request.stream, request.mimetype, sample_rate, channels
+                )
+        except RequestEntityTooLarge:
+            return jsonify({"success": False, "error": "Audio upload is too large"}), 413
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+
+        try:
+            job = transcription_jobs.submit(audio_path)
+        except TranscriptionOverloadedException as e:
+            audio_path.unlink(missing_ok=True)
+            return overloaded_response(e)
+
+        if mode == "sync":
+            job = transcription_jobs.wait(job.job_id, timeout) or job
+        if job.state == COMPLETED:
+            return transcription_job_response(job, 200)
+        if job.state == FAILED:
+            return transcription_job_response(job, 500)
+        # Async, or a sync request that timed out: poll the job.
+        response = transcription_job_response(job, 202)
+        response.headers["Location"] = f"/api/transcribe/jobs/{job.job_id}"
+        return response
+
+    @app.route("/api/transcribe/jobs/<job_id>", methods=["GET"])
+    def get_transcription_job(job_id: str):
+        job = transcription_jobs.get_job(job_id) if transcription_jobs else None
+        if job is None:
+            return jsonify({"success": False, "error": "Unknown job"}), 404
+        return transcription_job_response(job, 200)
+
+    def overloaded_response(error: TranscriptionOverloadedException):
+        response = jsonify(
+            {
+                "success": False,
+                "error": str(error),
+                "reason": error.reason,
+                "retry_after_seconds": error.retry_after_seconds,
+            }
+        )
+        response.status_code = 429
+        response.headers["Retry-After"] = str(error.retry_after_seconds)
+        return response
+
+    def transcription_job_response(job: TranscriptionJob, status: int) -> Response:
+        data = {"success": job.state != FAILED, **dataclasses.asdict(job)}
+        return Response(
+            json.dumps(data, ensure_ascii=False),
+            status=status,
+            content_type="application/json; charset=utf-8",
+        )
+
+    if STREAMING_AVAILABLE and streaming is not None:
+        app.config["SOCK_SERVER_OPTIONS"] = {
+            "max_message_size": STREAM_MAX_MESSAGE_BYTES
+        }
+        sock = Sock(app)
+
+        @sock.route(STREAM_PATH)
+        def stream_transcription(ws):
+            # Binary messages are 16 kHz mono s16le PCM; a text message
+            # {"type": "stop"} finalises the stream. Hypotheses are sent as
+            # JSON text messages.
+            sample_rate = request.args.get("sample_rate", str(SAMPLE_RATE))
+            if sample_rate != str(SAMPLE_RATE):
+                ws.close(WS_UNSUPPORTED_DATA, f"Only {SAMPLE_RATE} Hz PCM is supported")
+                return
+            try:
+                session = streaming.open_session()
+            except TranscriptionOverloadedException as e:
+                ws.close(WS_TRY_AGAIN_LATER, str(e))
+                return
+            except RuntimeError as e:
+                ws.close(WS_INTERNAL_ERROR, str(e))
+                return
+            try:
+                ws.send(json.dumps({"type": "ready", "sample_rate": SAMPLE_RATE}))
+                while True:
+                    message = ws.receive(timeout=STREAM_POLL_SECONDS)
+                    if isinstance(message, (bytes, bytearray)):
+                        session.feed(bytes(message))
+                    elif message is not None and is_stop_message(message):
+                        break
+                    for hypothesis in session.poll():
+                        ws.send(hypothesis_message(hypothesis))
+                for hypothesis in session.finish(STREAM_FINISH_TIMEOUT_SECONDS):
+                    ws.send(hypothesis_message(hypothesis))
+                ws.send(json.dumps({"type": "end"}))
+                ws.close()
+            except Exception as e:
+                if not ws.connected:
+                    return
+                ws.send(json.dumps({"type": "error", "error": f"{type(e).__name__}: {e}"}))
+                ws.close(WS_INTERNAL_ERROR, "Transcription failed")
+            finally:
+                streaming.close_session(session)
+
+    def is_stop_message(message: str) -> bool:
+        try:
+            control = json.loads(message)
+        except ValueError:
+            return False
+        return isinstance(control, dict) and control.get("type") == "stop"
+
+    def hypothesis_message(hypothesis: StreamingHypothesis) -> str:
+        data = dataclasses.asdict(hypothesis)
+        data["type"] = data.pop("kind")
+        return json.dumps(data, ensure_ascii=False)
+
     @app.route("/api/models", methods=["GET"])
     def get_available_models():
         models = model_service.get_available_models()
         # Convert dataclass objects to dicts for JSON serialization
         data = [model.__dict__ for model in models]
-        return Response(
+        response = Response(
             json.dumps(data, ensure_ascii=False),
             content_type="application/json; charset=utf-8",
         )
+        response.add_etag()
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
 
     @app.route("/api/hot-keys", methods=["GET"])
     def get_available_hot_keys():
@@ -93,15 +454,28 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
             )
 
         try:
-            model_service.download_model(model_name)
+            state = model_service.download_model(model_name)
+            if state == MODEL_LINKED:
+                # Linked from a shared directory: installed, nothing to wait for.
+                return (
+                    jsonify(
+                        {
+                            "success": True,
+                            "state": "completed",
+                            "model_name": model_name,
+                        }
+                    ),
+                    200,
+                )
 
             # We return 202 to align with "accepted" semantics even if the call
-            # completed quickly.
+            # completed quickly. A second request while the model is already
+            # downloading joins the running download instead of starting another.
             return (
                 jsonify(
                     {
                         "success": True,
-                        "state": "accepted",
+                        "state": state,
                         "model_name": model_name,
                     }
                 ),
@@ -132,13 +506,18 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
             return jsonify({"success": False, "error": "Missing or invalid name"}), 400
 
         try:
-            if model_service.is_downloading(model_name):
+            status = model_service.get_download_status(model_name)
+            if status is not None and status.state == "downloading":
                 return (
                     jsonify(
                         {
                             "success": True,
                             "state": "downloading",
                             "model_name": model_name,
+                            "downloaded_bytes": status.downloaded_bytes,
+                            "total_bytes": status.total_bytes,
+                            "progress": status.progress,
+                            "cancel_requested": status.cancel_requested,
                         }
                     ),
                     200,
@@ -156,6 +535,22 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
                     200,
                 )
 
+            if status is not None:
+                # Last attempt failed or was cancelled; a new POST retries it.
+                return (
+                    jsonify(
+                        {
+                            "success": True,
+                            "state": status.state,
+                            "model_name": model_name,
+                            "downloaded_bytes": status.downloaded_bytes,
+                            "total_bytes": status.total_bytes,
+                            "error": status.error,
+                        }
+                    ),
+                    200,
+                )
+
             return (
                 jsonify(
                     {"success": True, "state": "not_started", "model_name": model_name}
@@ -165,6 +560,35 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
+    @app.route("/api/cancel-model-download", methods=["POST"])
+    def cancel_model_download():
+        model_name = request.args.get("name")
+        if not model_name or not isinstance(model_name, str) or not model_name.strip():
+            return jsonify({"success": False, "error": "Missing or invalid name"}), 400
+        try:
+            if model_service.cancel_download(model_name):
+                return (
+                    jsonify(
+                        {
+                            "success": True,
+                            "state": "cancelling",
+                            "model_name": model_name,
+                        }
+                    ),
+                    202,
+                )
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "Model is not downloading",
+                    }
+                ),
+                404,
+            )
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
     @app.route("/api/delete-model", methods=["POST"])
     def delete_model():
         model_name = request.args.get("name")
@@ -196,7 +620,7 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
             config.current_model = default_model
             config_saver.save_user_config(config)
             # trigger event to restart transcriber with default model
-            messenger.emit(Event.CONFIG_SAVED)
+            messenger.emit(Event.CONFIG_SAVED, ConfigSaved())
 
     def parse_submitted_config(data: dict) -> UserConfig | None:
         """
@@ -243,12 +667,36 @@ def create_flask_app_with(flask_services: FlaskServices) -> Flask:
             )
             if not isinstance(current_model, str):
                 return None
+            # Nested model_eviction
+            model_eviction = data.get("model_eviction", {})
+            model_eviction = {} if model_eviction is None else model_eviction
+            if not isinstance(model_eviction, dict):
+                return None
+            eviction_defaults = ModelEviction()
+            eviction_enabled = model_eviction.get("enabled", eviction_defaults.enabled)
+            idle_timeout_seconds = model_eviction.get(
+                "idle_timeout_seconds", eviction_defaults.idle_timeout_seconds
+            )
+            min_available_memory_mb = model_eviction.get(
+                "min_available_memory_mb", eviction_defaults.min_available_memory_mb
+            )
+            if not isinstance(eviction_enabled, bool):
+                return None
+            for value in (idle_timeout_seconds, min_available_memory_mb):
+                if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                    return None
+            model_eviction = ModelEviction(
+                enabled=eviction_enabled,
+                idle_timeout_seconds=idle_timeout_seconds,
+                min_available_memory_mb=min_available_memory_mb,
+            )
             return UserConfig(
                 hot_key=hot_key,
                 intelligent_mode=intelligent_mode,
                 text_selection_awareness=text_selection_awareness,
                 clipboard_behaviour=clipboard_behaviour,
                 current_model=current_model,
+                model_eviction=model_eviction,
             )
         except Exception:
             return None
@@ -7,6 +7,13 @@ class ClipboardBehaviour:
     keep_output_in_clipboard: bool = True
 
 
+@dataclass
+class ModelEviction:
+    enabled: bool = True
+    idle_timeout_seconds: int = 900
+    min_available_memory_mb: int = 1024
+
+
 @dataclass
 class UserConfig:
     hot_key: str
@@ -14,3 +21,4 @@ class UserConfig:
     intelligent_mode: bool = False
     text_selection_awareness: bool = False
     clipboard_behaviour: ClipboardBehaviour = field(default_factory=ClipboardBehaviour)
+    model_eviction: ModelEviction = field(default_factory=ModelEviction)
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, Protocol
+from typing import Any, Dict, Optional, Protocol, Tuple
 
 
 class ConfigRepository(Protocol):
@@ -11,6 +11,10 @@ class ConfigRepository(Protocol):
     def write_user_config(self, data: Dict[str, Any]) -> bool:
         pass
 
+    def read_user_config_version(self) -> Optional[Tuple[int, int]]:
+        """Return a cheap change marker (mtime_ns, size), or None if there is no file."""
+        pass
+
 
 class ConfigRepositoryImpl(ConfigRepository):
 
@@ -39,3 +43,10 @@ class ConfigRepositoryImpl(ConfigRepository):
             return True
         except Exception:
             return False
+
+    def read_user_config_version(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._CONFIG_PATH.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,55 @@
+import copy
+import threading
+from typing import Optional, Tuple
+
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import ConfigSaved
+from src.event_management.events import Event
+from src.server.config.entity.user_config import UserConfig
+from src.server.config.repository.config_repository import ConfigRepository
+from src.server.config.serivce.config_load_service import ConfigLoadService
+
+_MISSING = object()
+
+
+class CachedConfigLoadService(ConfigLoadService):
+    """Keep the parsed UserConfig in memory until the config file changes.
+
+    Each call costs one ``stat`` instead of a read and parse. The cache is
+    dropped when the file's (mtime_ns, size) changes, e.g. after a hand
+    edit, or when CONFIG_SAVED is emitted. Callers get a deep copy, so
+    mutating the returned config never leaks into the cache.
+    """
+
+    def __init__(self, delegate: ConfigLoadService, config_repository: ConfigRepository):
+        self._delegate = delegate
+        self._config_repository = config_repository
+        self._lock = threading.Lock()
+        self._cached_config: Optional[UserConfig] = None
+        self._cached_version: object = _MISSING
+
+    def subscribe(self, messenger: EventMessenger) -> None:
+        # Inline so a GET right after the save never sees the old config and
+        # the runtime reload (queued) always reads the new one.
+        messenger.subscribe(Event.CONFIG_SAVED, self.invalidate, inline=True)
+
+    def invalidate(self, _event: Optional[ConfigSaved] = None) -> None:
+        with self._lock:
+            self._cached_config = None
+            self._cached_version = _MISSING
+
+    def load_config(self) -> UserConfig:
+        # Read the version before the file so a concurrent write is picked up
+        # by the next call rather than being cached under a stale marker.
+        version: Optional[Tuple[int, int]] = (
+            self._config_repository.read_user_config_version()
+        )
+        with self._lock:
+            if self._cached_config is not None and self._cached_version == version:
+                return copy.deepcopy(self._cached_config)
+
+        config = self._delegate.load_config()
+        with self._lock:
+            self._cached_config = config
+            self._cached_version = version
+            return copy.deepcopy(config)
@@ -2,6 +2,7 @@ from typing import Dict, Any
 
 from src.server.config.entity.user_config import (
     ClipboardBehaviour,
+    ModelEviction,
     UserConfig,
 )
 from src.server.config.repository.config_repository import ConfigRepository
@@ -29,6 +30,7 @@ class ConfigLoadServiceImpl(ConfigLoadService):
             text_selection_awareness=bool(data.get("text_selection_awareness", True)),
             clipboard_behaviour=self._parse_clipboard_behaviour(data),
             current_model=data.get("current_model", "default"),
+            model_eviction=self._parse_model_eviction(data),
         )
 
     def _parse_clipboard_behaviour(self, data: Dict[str, Any]) -> ClipboardBehaviour:
@@ -41,6 +43,31 @@ class ConfigLoadServiceImpl(ConfigLoadService):
             ),
         )
 
+    def _parse_model_eviction(self, data: Dict[str, Any]) -> ModelEviction:
+        """Extract and parse model_eviction from raw config data."""
+        eviction_data = data.get("model_eviction", {}) or {}
+        defaults = ModelEviction()
+        return ModelEviction(
+            enabled=bool(eviction_data.get("enabled", defaults.enabled)),
+            idle_timeout_seconds=self._as_non_negative_int(
+                eviction_data.get("idle_timeout_seconds"),
+                defaults.idle_timeout_seconds,
+            ),
+            min_available_memory_mb=self._as_non_negative_int(
+                eviction_data.get("min_available_memory_mb"),
+                defaults.min_available_memory_mb,
+            ),
+        )
+
+    @staticmethod
+    def _as_non_negative_int(value: Any, default: int) -> int:
+        """Coerce a hand-edited config value, falling back to the default."""
+        try:
+            parsed = int(value)
+        except (TypeError, ValueError):
+            return default
+        return parsed if parsed >= 0 else default
+
     def _default_config(self) -> UserConfig:
         """Return a default UserConfig with sensible defaults."""
         return UserConfig(
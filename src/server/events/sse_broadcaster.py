@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional, Set, Tuple
+
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.events import Event
+from src.metrics.runtime_metrics import SSE_CLIENTS, SSE_EVENTS_DROPPED_TOTAL
+
+
+class SseClient:
+    """Bounded outbox for one connected event-stream client.
+
+    When the client falls behind, the oldest buffered message is dropped so
+    publishing never blocks on a slow consumer.
+    """
+
+    def __init__(self, max_buffered: int) -> None:
+        self._messages: Deque[str] = deque(maxlen=max_buffered)
+        self._condition = threading.Condition()
+        self.dropped = 0
+
+    def push(self, message: str) -> None:
+        with self._condition:
+            if len(self._messages) == self._messages.maxlen:
+                self.dropped += 1
+                SSE_EVENTS_DROPPED_TOTAL.inc()
+            self._messages.append(message)
+            self._condition.notify()
+
+    def next_message(self, timeout: float) -> Optional[str]:
+        with self._condition:
+            if not self._messages:
+                self._condition.wait(timeout)
+            if not self._messages:
+                return None
+            return self._messages.popleft()
+
+
+class SseBroadcaster:
+    """SseBroadcaster
+
+    Responsibility:
+        Fan EventMessenger events out to Server-Sent Events clients. Each
+        event is serialised once and appended to every client's bounded
+        buffer; a short history lets reconnecting clients resume from
+        ``Last-Event-ID``.
+
+    Interface:
+        * attach(messenger: EventMessenger) -> None: forward every Event
+          through a single subscription
+        * publish(event_name: str, data: Any) -> None
+        * register(last_event_id: Optional[str]) -> Optional[SseClient]:
+          None when the client limit is reached
+        * stream(client: SseClient) -> Iterator[str]: SSE body generator that
+          unregisters the client when the connection closes
+    """
+
+    DEFAULT_MAX_CLIENTS = 32
+    DEFAULT_CLIENT_BUFFER = 256
+    HISTORY_SIZE = 100
+    HEARTBEAT_SECONDS = 15.0
+    RETRY_MILLISECONDS = 3000
+
+    def __init__(
+        self,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        client_buffer: int = DEFAULT_CLIENT_BUFFER,
+    ) -> None:
+        self._max_clients = max_clients
+        self._client_buffer = client_buffer
+        self._lock = threading.Lock()
+        self._clients: Set[SseClient] = set()
+        self._history: Deque[Tuple[int, str]] = deque(maxlen=self.HISTORY_SIZE)
+        self._next_id = 1
+
+    def attach(self, messenger: EventMessenger) -> None:
+        messenger.subscribe_all(self._forward, name="sse_broadcaster")
+
+    def publish(self, event_name: str, data: Any = None) -> None:
+        payload = json.dumps(
+            {"event": event_name, "data": data, "timestamp": time.time()},
+            ensure_ascii=False,
+            default=str,
+        )
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+            message = f"id: {event_id}\nevent: {event_name}\ndata: {payload}\n\n"
+            self._history.append((event_id, message))
+            clients = list(self._clients)
+        for client in clients:
+            client.push(message)
+
+    def register(self, last_event_id: Optional[str] = None) -> Optional[SseClient]:
+        client = SseClient(self._client_buffer)
+        with self._lock:
+            if len(self._clients) >= self._max_clients:
+                return None
+            for message in self._replay_locked(last_event_id):
+                client.push(message)
+            self._clients.add(client)
+            SSE_CLIENTS.set(len(self._clients))
+        return client
+
+    def unregister(self, client: SseClient) -> None:
+        with self._lock:
+            self._clients.discard(client)
+            SSE_CLIENTS.set(len(self._clients))
+
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def stream(self, client: SseClient) -> Iterator[str]:
+        try:
+            yield f"retry: {self.RETRY_MILLISECONDS}\n\n"
+            while True:
+                message = client.next_message(self.HEARTBEAT_SECONDS)
+                # Comment lines keep proxies from timing out idle streams and
+                # surface disconnects even when nothing is being published.
+                yield message if message is not None else ": keep-alive\n\n"
+        finally:
+            self.unregister(client)
+
+    def _forward(self, event: Event, payload: Any) -> None:
+        data = dataclasses.asdict(payload) if dataclasses.is_dataclass(payload) else payload
+        self.publish(event.value.lower(), data)
+
+    def _replay_locked(self, last_event_id: Optional[str]) -> List[str]:
+        if not last_event_id:
+            return []
+        try:
+            last_seen = int(last_event_id)
+        except ValueError:
+            return []
+        return [message for event_id, message in self._history if event_id > last_seen]
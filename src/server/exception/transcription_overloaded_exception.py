@@ -0,0 +1,7 @@
+class TranscriptionOverloadedException(Exception):
+    """Raised when a transcription request is shed to protect the queue-wait SLO."""
+
+    def __init__(self, message: str, retry_after_seconds: int, reason: str) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+        self.reason = reason
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class TranscriptEntry:
+    text: str
+    created_at: float
+    model_name: Optional[str] = None
+    language: Optional[str] = None
+    audio_seconds: Optional[float] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    id: Optional[int] = None
+
+
+@dataclass
+class HistoryPage:
+    entries: List[TranscriptEntry]
+    # Pass as ``before_id`` to fetch the next (older) page; None on the last page.
+    next_before_id: Optional[int] = None
@@ -0,0 +1,150 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Protocol
+
+from src.server.history.entity.transcript_entry import TranscriptEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    text TEXT NOT NULL,
+    model_name TEXT,
+    language TEXT,
+    audio_seconds REAL,
+    timings TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
+    text,
+    content='transcripts',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
+    INSERT INTO transcripts_fts(rowid, text) VALUES (new.id, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcripts_au AFTER UPDATE OF text ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+    INSERT INTO transcripts_fts(rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+_COLUMNS = "t.id, t.created_at, t.text, t.model_name, t.language, t.audio_seconds, t.timings"
+
+# Larger than any rowid, so "before" pages can always use a range predicate.
+_NO_UPPER_BOUND = 2**63 - 1
+
+
+class HistoryRepository(Protocol):
+
+    def insert_many(self, entries: Iterable[TranscriptEntry]) -> int: ...
+
+    def list_before(self, before_id: Optional[int], limit: int) -> List[TranscriptEntry]: ...
+
+    def search_before(
+        self, match_query: str, before_id: Optional[int], limit: int
+    ) -> List[TranscriptEntry]: ...
+
+
+class HistoryRepositoryImpl(HistoryRepository):
+    """SQLite transcript store under ``~/.sona``.
+
+    The database runs in WAL mode so the background writer never blocks API
+    readers. Connections are per thread; pages are read newest-first with
+    keyset predicates on the rowid, so their cost does not grow with depth.
+    """
+
+    _DB_PATH = Path.home() / ".sona" / "history.sqlite3"
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._db_path = db_path or self._DB_PATH
+        self._local = threading.local()
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        with connection:
+            connection.executescript(_SCHEMA)
+
+    def insert_many(self, entries: Iterable[TranscriptEntry]) -> int:
+        rows = [
+            (
+                entry.created_at,
+                entry.text,
+                entry.model_name,
+                entry.language,
+                entry.audio_seconds,
+                json.dumps(entry.timings),
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT INTO transcripts "
+                "(created_at, text, model_name, language, audio_seconds, timings) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def list_before(self, before_id: Optional[int], limit: int) -> List[TranscriptEntry]:
+        cursor = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM transcripts AS t "
+            "WHERE t.id < ? ORDER BY t.id DESC LIMIT ?",
+            (_NO_UPPER_BOUND if before_id is None else before_id, limit),
+        )
+        return [self._to_entity(row) for row in cursor]
+
+    def search_before(
+        self, match_query: str, before_id: Optional[int], limit: int
+    ) -> List[TranscriptEntry]:
+        # Ordering by rowid (not rank) keeps the FTS scan a bounded range walk.
+        cursor = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM transcripts_fts AS f "
+            "JOIN transcripts AS t ON t.id = f.rowid "
+            "WHERE transcripts_fts MATCH ? AND f.rowid < ? "
+            "ORDER BY f.rowid DESC LIMIT ?",
+            (
+                match_query,
+                _NO_UPPER_BOUND if before_id is None else before_id,
+                limit,
+            ),
+        )
+        return [self._to_entity(row) for row in cursor]
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._db_path, timeout=5.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _to_entity(row: tuple) -> TranscriptEntry:
+        try:
+            timings = json.loads(row[6]) if row[6] else {}
+        except ValueError:
+            timings = {}
+        return TranscriptEntry(
+            id=row[0],
+            created_at=row[1],
+            text=row[2],
+            model_name=row[3],
+            language=row[4],
+            audio_seconds=row[5],
+            timings=timings,
+        )
@@ -0,0 +1,69 @@
+import re
+from typing import List, Optional, Protocol
+
+from src.server.history.entity.transcript_entry import HistoryPage, TranscriptEntry
+from src.server.history.repository.history_repository import HistoryRepository
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class HistoryService(Protocol):
+
+    def list_history(
+        self, limit: int = DEFAULT_PAGE_SIZE, before_id: Optional[int] = None
+    ) -> HistoryPage: ...
+
+    def search_history(
+        self, query: str, limit: int = DEFAULT_PAGE_SIZE, before_id: Optional[int] = None
+    ) -> HistoryPage: ...
+
+
+class HistoryServiceImpl(HistoryService):
+
+    def __init__(self, repository: HistoryRepository):
+        self._repository = repository
+
+    def list_history(
+        self, limit: int = DEFAULT_PAGE_SIZE, before_id: Optional[int] = None
+    ) -> HistoryPage:
+        limit = self._clamp_limit(limit)
+        # Fetch one extra row to know whether an older page exists.
+        entries = self._repository.list_before(before_id, limit + 1)
+        return self._to_page(entries, limit)
+
+    def search_history(
+        self, query: str, limit: int = DEFAULT_PAGE_SIZE, before_id: Optional[int] = None
+    ) -> HistoryPage:
+        match_query = self._to_match_query(query)
+        if match_query is None:
+            raise ValueError("Search query must contain at least one word")
+        limit = self._clamp_limit(limit)
+        entries = self._repository.search_before(match_query, before_id, limit + 1)
+        return self._to_page(entries, limit)
+
+    @staticmethod
+    def _to_match_query(query: str) -> Optional[str]:
+        """Turn free text into an FTS5 query: all words must match, the last as a prefix.
+
+        Words are quoted so user input can never be parsed as FTS5 syntax.
+        """
+        terms = _TERM_PATTERN.findall(query or "")
+        if not terms:
+            return None
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    @staticmethod
+    def _clamp_limit(limit: int) -> int:
+        return max(1, min(MAX_PAGE_SIZE, limit))
+
+    @staticmethod
+    def _to_page(entries: List[TranscriptEntry], limit: int) -> HistoryPage:
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        next_before_id = entries[-1].id if has_more and entries else None
+        return HistoryPage(entries=entries, next_before_id=next_before_id)
@@ -0,0 +1,112 @@
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import TranscriptionCompleted
+from src.event_management.events import Event
+from src.metrics.runtime_metrics import (
+    HISTORY_ENTRIES_DROPPED_TOTAL,
+    HISTORY_ENTRIES_WRITTEN_TOTAL,
+    PIPELINE_ERRORS_TOTAL,
+)
+from src.server.history.entity.transcript_entry import TranscriptEntry
+from src.server.history.repository.history_repository import HistoryRepository
+
+
+class HistoryWriter:
+    """Write-behind recorder for completed transcriptions.
+
+    ``record`` only enqueues, so the transcription thread never waits on
+    SQLite. A daemon thread drains the queue and inserts entries in batches
+    of up to ``BATCH_SIZE`` rows, one transaction per batch.
+    """
+
+    BATCH_SIZE = 64
+    FLUSH_INTERVAL_SECONDS = 0.5
+    MAX_PENDING = 10_000
+
+    def __init__(self, repository: HistoryRepository):
+        self._repository = repository
+        self._pending: "queue.Queue[Optional[TranscriptEntry]]" = queue.Queue(
+            maxsize=self.MAX_PENDING
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="HistoryWriterThread", daemon=True
+            )
+            self._thread.start()
+
+    def subscribe(self, messenger: EventMessenger) -> None:
+        messenger.subscribe(Event.TRANSCRIPTION_COMPLETED, self.on_transcription_completed)
+
+    def on_transcription_completed(self, event: TranscriptionCompleted) -> None:
+        if not event.text:
+            return
+        self.record(
+            TranscriptEntry(
+                text=event.text,
+                created_at=time.time(),
+                model_name=event.model_name,
+                language=event.language,
+                audio_seconds=event.audio_seconds,
+                timings=dict(event.timings),
+            )
+        )
+
+    def record(self, entry: TranscriptEntry) -> None:
+        try:
+            self._pending.put_nowait(entry)
+        except queue.Full:
+            HISTORY_ENTRIES_DROPPED_TOTAL.inc()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Flush pending entries and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._pending.put(None)
+        thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            first = self._pending.get()
+            if first is None:
+                return
+            batch = [first]
+            stopping = self._fill_batch(batch)
+            self._write(batch)
+            if stopping:
+                return
+
+    def _fill_batch(self, batch: List[TranscriptEntry]) -> bool:
+        """Collect more entries until the batch is full or the flush interval passes."""
+        deadline = time.monotonic() + self.FLUSH_INTERVAL_SECONDS
+        while len(batch) < self.BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                return True
+            batch.append(entry)
+        return False
+
+    def _write(self, batch: List[TranscriptEntry]) -> None:
+        try:
+            HISTORY_ENTRIES_WRITTEN_TOTAL.inc(self._repository.insert_many(batch))
+        except Exception as exc:
+            PIPELINE_ERRORS_TOTAL.labels(stage="history").inc()
+            print(f"[WARNING] Failed to write {len(batch)} history entries: {exc}")
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ModelCacheEntry:
+    model_name: str
+    filename: str
+    present: bool
+    size_bytes: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    # None while the checksum has not been computed yet for this size/mtime.
+    verified: Optional[bool] = None
+
+    @property
+    def usable(self) -> bool:
+        """Present and not known to be corrupt or partially written."""
+        return self.present and self.verified is not False
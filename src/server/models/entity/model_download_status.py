@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+DOWNLOADING = "downloading"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class ModelDownloadStatus:
+    model_name: str
+    state: str = DOWNLOADING
+    downloaded_bytes: int = 0
+    total_bytes: Optional[int] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+
+    @property
+    def progress(self) -> Optional[float]:
+        if not self.total_bytes:
+            return None
+        return self.downloaded_bytes / self.total_bytes
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+LINK_MODES = ("auto", "hardlink", "symlink")
+
+
+@dataclass
+class ModelSources:
+    """Where model checkpoints are looked up, in order, before upstream."""
+
+    # Read-only directories (e.g. an NFS mount) holding Whisper *.pt files.
+    shared_dirs: List[Path] = field(default_factory=list)
+    # Base URLs serving <sha256>/<file>.pt, e.g. another Sona instance's
+    # http://host:5000/api/model-files
+    mirror_urls: List[str] = field(default_factory=list)
+    use_upstream: bool = True
+    # "auto" hardlinks when the shared dir is on the same filesystem and
+    # falls back to a symlink otherwise.
+    link_mode: str = "auto"
+    # Expose this machine's verified cache at /api/model-files for others.
+    serve_mirror: bool = False
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -8,3 +9,7 @@ class TranscriptionModelInfo:
     required_ram: str
     relative_speed: str
     in_system: bool
+    measured_ram: Optional[str] = None
+    measured_ram_bytes: Optional[int] = None
+    size_bytes: Optional[int] = None
+    verified: Optional[bool] = None
@@ -0,0 +1,287 @@
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import (
+    ModelDownloadComplete,
+    ModelDownloadProgress,
+)
+from src.event_management.events import Event
+from src.metrics.runtime_metrics import MODEL_CACHE_VERIFICATIONS_TOTAL
+from src.server.models.entity.model_cache_entry import ModelCacheEntry
+from src.server.models.repository.model_constants import (
+    MODELS_INFO,
+    WHISPER_CACHE_DIR,
+    expected_sha256,
+)
+
+FileStamp = Tuple[int, int]  # (size_bytes, mtime_ns)
+
+
+class ModelCacheIndex:
+    """ModelCacheIndex
+
+    Responsibility:
+        Keep an in-memory view of the Whisper cache directory (presence, size,
+        mtime and checksum status of every known model) so API requests never
+        touch the filesystem. A polling watcher lists the directory once per
+        interval; downloads and deletions refresh it immediately. Checksums
+        are verified on a background thread against the SHA-256 embedded in
+        the upstream URL and persisted under ``~/.sona`` keyed by size and
+        mtime, so unchanged files are hashed only once.
+
+    Interface:
+        * start() -> None / stop() -> None: run the polling watcher
+        * refresh() -> bool: rescan now; True if anything changed
+        * entry(model_name) -> Optional[ModelCacheEntry]
+        * entries() -> list[ModelCacheEntry]
+        * is_present(model_name) -> bool
+        * version -> int: increases whenever an entry changes
+    """
+
+    POLL_INTERVAL_SECONDS = 5.0
+    HASH_CHUNK_BYTES = 1024 * 1024
+    VERIFICATIONS_PATH: Path = Path.home() / ".sona" / "model_cache_index.json"
+
+    def __init__(
+        self,
+        cache_dir: Path = WHISPER_CACHE_DIR,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        verify_checksums: bool = True,
+    ):
+        self._cache_dir = cache_dir
+        self._poll_interval = poll_interval
+        self._verify_checksums = verify_checksums
+        self._filenames = {name: info[0] for name, info in MODELS_INFO.items()}
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ModelCacheEntry] = {}
+        self._version = 0
+        self._verifications: Dict[str, Dict[str, Any]] = self._read_verifications()
+        self._verifying: set[str] = set()
+        self._verifier = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-verify")
+        self._stop_event = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self.refresh()
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def subscribe(self, messenger: EventMessenger) -> None:
+        # Inline: a stat() per event, and /api/models must reflect a finished
+        # download as soon as the download reports it.
+        messenger.subscribe(
+            Event.MODEL_DOWNLOAD_COMPLETE, self._on_model_changed, inline=True
+        )
+        messenger.subscribe(
+            Event.MODEL_DOWNLOAD_PROGRESS, self._on_download_progress, inline=True
+        )
+
+    def start(self) -> None:
+        if self._watcher is not None:
+            return
+        self._stop_event.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, name="ModelCacheWatcherThread", daemon=True
+        )
+        self._watcher.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=1.0)
+            self._watcher = None
+        self._verifier.shutdown(wait=False, cancel_futures=True)
+
+    def entry(self, model_name: str) -> Optional[ModelCacheEntry]:
+        with self._lock:
+            return self._entries.get(model_name)
+
+    def entries(self) -> List[ModelCacheEntry]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def is_present(self, model_name: str) -> bool:
+        entry = self.entry(model_name)
+        return entry is not None and entry.usable
+
+    def refresh(self) -> bool:
+        stamps = self._scan()
+        changed = False
+        to_verify: List[ModelCacheEntry] = []
+        with self._lock:
+            for model_name, filename in self._filenames.items():
+                entry = self._build_entry(model_name, filename, stamps.get(filename))
+                if self._entries.get(model_name) != entry:
+                    self._entries[model_name] = entry
+                    changed = True
+                if entry.present and entry.verified is None:
+                    to_verify.append(entry)
+            if changed:
+                self._version += 1
+        for entry in to_verify:
+            self._schedule_verification(entry)
+        return changed
+
+    def refresh_model(self, model_name: str) -> None:
+        """Re-stat a single model after it was downloaded or deleted."""
+        filename = self._filenames.get(model_name)
+        if filename is None:
+            return
+        stamp = self._stat(self._cache_dir / filename)
+        with self._lock:
+            entry = self._build_entry(model_name, filename, stamp)
+            if self._entries.get(model_name) != entry:
+                self._entries[model_name] = entry
+                self._version += 1
+        if entry.present and entry.verified is None:
+            self._schedule_verification(entry)
+
+    def _build_entry(
+        self, model_name: str, filename: str, stamp: Optional[FileStamp]
+    ) -> ModelCacheEntry:
+        if stamp is None:
+            return ModelCacheEntry(model_name=model_name, filename=filename, present=False)
+        size_bytes, mtime_ns = stamp
+        known = self._verifications.get(filename)
+        verified = None
+        if known and known.get("size") == size_bytes and known.get("mtime_ns") == mtime_ns:
+            verified = known.get("verified")
+        return ModelCacheEntry(
+            model_name=model_name,
+            filename=filename,
+            present=True,
+            size_bytes=size_bytes,
+            mtime_ns=mtime_ns,
+            verified=verified,
+        )
+
+    def _scan(self) -> Dict[str, FileStamp]:
+        """List the cache directory once instead of stat-ing every known model."""
+        stamps: Dict[str, FileStamp] = {}
+        try:
+            with os.scandir(self._cache_dir) as directory:
+                for item in directory:
+                    if not item.is_file():
+                        continue
+                    stat = item.stat()
+                    stamps[item.name] = (stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            print(f"[WARNING] Could not scan model cache {self._cache_dir}: {exc}")
+        return stamps
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[FileStamp]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _schedule_verification(self, entry: ModelCacheEntry) -> None:
+        if not self._verify_checksums or expected_sha256(entry.model_name) is None:
+            return
+        # Leave files that are still being written alone; a later poll
+        # schedules them once they have settled.
+        settled_ns = int(self._poll_interval * 1_000_000_000)
+        if entry.mtime_ns is not None and time.time_ns() - entry.mtime_ns < settled_ns:
+            return
+        with self._lock:
+            if entry.filename in self._verifying:
+                return
+            self._verifying.add(entry.filename)
+        try:
+            self._verifier.submit(self._verify, entry)
+        except RuntimeError:
+            # Executor already shut down.
+            with self._lock:
+                self._verifying.discard(entry.filename)
+
+    def _verify(self, entry: ModelCacheEntry) -> None:
+        try:
+            digest = self._sha256(self._cache_dir / entry.filename)
+            stamp_after = self._stat(self._cache_dir / entry.filename)
+        except OSError:
+            digest, stamp_after = None, None
+        finally:
+            with self._lock:
+                self._verifying.discard(entry.filename)
+
+        # The file changed (still downloading, replaced or deleted) while we
+        # were hashing; the next refresh picks up the new stamp.
+        if digest is None or stamp_after != (entry.size_bytes, entry.mtime_ns):
+            return
+
+        verified = digest == expected_sha256(entry.model_name)
+        MODEL_CACHE_VERIFICATIONS_TOTAL.labels(
+            result="ok" if verified else "mismatch"
+        ).inc()
+        if not verified:
+            print(f"[WARNING] Cached model '{entry.model_name}' failed checksum verification")
+        with self._lock:
+            self._verifications[entry.filename] = {
+                "size": entry.size_bytes,
+                "mtime_ns": entry.mtime_ns,
+                "verified": verified,
+            }
+            current = self._entries.get(entry.model_name)
+            if current is not None and (current.size_bytes, current.mtime_ns) == (
+                entry.size_bytes,
+                entry.mtime_ns,
+            ):
+                self._entries[entry.model_name] = dataclasses.replace(
+                    current, verified=verified
+                )
+                self._version += 1
+            self._write_verifications_locked()
+
+    def _sha256(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as model_file:
+            while chunk := model_file.read(self.HASH_CHUNK_BYTES):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            try:
+                self.refresh()
+            except Exception as exc:
+                print(f"[WARNING] Model cache refresh failed: {exc}")
+
+    def _on_model_changed(self, event: ModelDownloadComplete) -> None:
+        self.refresh_model(event.model_name)
+
+    def _on_download_progress(self, event: ModelDownloadProgress) -> None:
+        if event.state in ("completed", "failed"):
+            self.refresh_model(event.model_name)
+
+    def _read_verifications(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            if not self.VERIFICATIONS_PATH.exists():
+                return {}
+            with self.VERIFICATIONS_PATH.open("r", encoding="utf-8") as index_file:
+                data = json.load(index_file)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _write_verifications_locked(self) -> None:
+        try:
+            self.VERIFICATIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.VERIFICATIONS_PATH.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as index_file:
+                json.dump(self._verifications, index_file, indent=2)
+            temp_path.replace(self.VERIFICATIONS_PATH)
+        except Exception as exc:
+            print(f"[WARNING] Failed to persist model cache index: {exc}")
@@ -1,5 +1,8 @@
-from typing import Protocol, Tuple
+import os
+from typing import Optional, Protocol, Tuple
+from pathlib import Path
 
+from src.server.models.entity.model_sources import ModelSources
 from src.server.models.repository.model_constants import (
     MODELS_INFO,
     WHISPER_CACHE_DIR,
@@ -21,34 +24,107 @@ class ModelRepository(Protocol):
     def delete_model(self, model_name: str) -> bool:
         pass
 
+    def get_model_path(self, model_name: str) -> Optional[Path]:
+        """Path of the model in the local Whisper cache, if it is there."""
+        pass
+
+    def find_shared_model(self, model_name: str) -> Optional[Path]:
+        pass
+
+    def link_shared_model(self, model_name: str) -> bool:
+        pass
+
 
 class ModelRepositoryImpl(ModelRepository):
 
+    def __init__(self, sources: Optional[ModelSources] = None):
+        self._sources = sources or ModelSources()
+
+    @property
+    def sources(self) -> ModelSources:
+        return self._sources
+
     def read_available_models(self) -> dict:
         return MODELS_INFO
 
     def is_model_in_system(self, model_name: str) -> bool:
         "Check if a model is present in the local Whisper cache."
+        return self.get_model_path(model_name) is not None
+
+    def get_model_path(self, model_name: str) -> Optional[Path]:
         model_info = MODELS_INFO.get(model_name)
         if model_info is None:
-            return False
+            return None
         whisper_cache_filename = model_info[0]  # First element is the filename
-        return (WHISPER_CACHE_DIR / whisper_cache_filename).is_file()
+        model_path = WHISPER_CACHE_DIR / whisper_cache_filename
+        return model_path if model_path.is_file() else None
 
     def get_default_model_info(self) -> Tuple[str, Tuple[str, bool, str, str]]:
         return DEFAULT_MODEL
 
     def delete_model(self, model_name: str) -> bool:
-        """Delete the model file from the local Whisper cache."""
+        """Delete the model file from the local Whisper cache.
+
+        A model linked from a shared directory only loses its link; the
+        shared copy is never touched.
+        """
         model_info = MODELS_INFO.get(model_name)
         if model_info is None:
             return False
         whisper_cache_filename = model_info[0]
         model_path = WHISPER_CACHE_DIR / whisper_cache_filename
-        if model_path.is_file():
+        if model_path.is_file() or model_path.is_symlink():
             try:
                 model_path.unlink()
                 return True
             except Exception:
                 return False
         return False
+
+    def find_shared_model(self, model_name: str) -> Optional[Path]:
+        """Return the first shared directory copy of ``model_name``."""
+        model_info = MODELS_INFO.get(model_name)
+        if model_info is None:
+            return None
+        for shared_dir in self._sources.shared_dirs:
+            candidate = shared_dir / model_info[0]
+            try:
+                if candidate.is_file() and candidate.stat().st_size > 0:
+                    return candidate
+            except OSError:
+                # Unreachable network mounts should not block the other tiers.
+                continue
+        return None
+
+    def link_shared_model(self, model_name: str) -> bool:
+        """Install a shared copy into the local cache without copying it.
+
+        The checksum is verified afterwards by the model cache index, like
+        any other cached file.
+        """
+        shared_path = self.find_shared_model(model_name)
+        if shared_path is None:
+            return False
+        model_path = WHISPER_CACHE_DIR / MODELS_INFO[model_name][0]
+        WHISPER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = model_path.with_name(model_path.name + ".link")
+        temp_path.unlink(missing_ok=True)
+        try:
+            self._link(shared_path, temp_path)
+            temp_path.replace(model_path)
+        except OSError as exc:
+            temp_path.unlink(missing_ok=True)
+            print(f"[WARNING] Could not link shared model {shared_path}: {exc}")
+            return False
+        return True
+
+    def _link(self, source: Path, target: Path) -> None:
+        if self._sources.link_mode in ("auto", "hardlink"):
+            try:
+                os.link(source, target)
+                return
+            except OSError:
+                # Different filesystem (typical for NFS) or no hardlink support.
+                if self._sources.link_mode == "hardlink":
+                    raise
+        os.symlink(source.resolve(), target)
@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Protocol
+
+from src.server.models.entity.model_sources import LINK_MODES, ModelSources
+
+
+class ModelSourcesRepository(Protocol):
+
+    def read_sources(self) -> ModelSources:
+        pass
+
+
+class ModelSourcesRepositoryImpl(ModelSourcesRepository):
+    """Read ``~/.sona/model_sources.json``; a missing file means upstream only."""
+
+    _SOURCES_PATH = Path.home() / ".sona" / "model_sources.json"
+
+    def read_sources(self) -> ModelSources:
+        try:
+            if not self._SOURCES_PATH.exists():
+                return ModelSources()
+            with self._SOURCES_PATH.open("r", encoding="utf-8") as sources_file:
+                data = json.load(sources_file)
+        except Exception as exc:
+            print(f"[WARNING] Could not read {self._SOURCES_PATH}: {exc}")
+            return ModelSources()
+        if not isinstance(data, dict):
+            print(f"[WARNING] Ignoring {self._SOURCES_PATH}: expected a JSON object")
+            return ModelSources()
+        return self._parse(data)
+
+    def _parse(self, data: Dict[str, Any]) -> ModelSources:
+        defaults = ModelSources()
+        shared_dirs = [
+            Path(entry).expanduser()
+            for entry in data.get("shared_dirs", [])
+            if isinstance(entry, str) and entry.strip()
+        ]
+        mirror_urls = [
+            entry.rstrip("/")
+            for entry in data.get("mirror_urls", [])
+            if isinstance(entry, str) and entry.startswith(("http://", "https://"))
+        ]
+        link_mode = data.get("link_mode", defaults.link_mode)
+        if link_mode not in LINK_MODES:
+            print(
+                f"[WARNING] Unknown link_mode '{link_mode}' in {self._SOURCES_PATH}; "
+                f"using '{defaults.link_mode}'"
+            )
+            link_mode = defaults.link_mode
+        return ModelSources(
+            shared_dirs=shared_dirs,
+            mirror_urls=mirror_urls,
+            use_upstream=bool(data.get("use_upstream", defaults.use_upstream)),
+            link_mode=link_mode,
+            serve_mirror=bool(data.get("serve_mirror", defaults.serve_mirror)),
+        )
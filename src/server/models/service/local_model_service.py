@@ -1,10 +1,23 @@
+from pathlib import Path
 from threading import Lock
-from typing import Protocol, List
+from typing import Optional, Protocol, List
 
+from src.core.transcription.model_memory_tracker import ModelMemoryTracker
+from src.metrics.runtime_metrics import MODEL_SOURCE_RESOLUTIONS_TOTAL
 from src.server.exception.model_in_system_exception import ModelInSystemException
+from src.server.models.entity.model_download_status import ModelDownloadStatus
 from src.server.models.entity.transcription_model_info import TranscriptionModelInfo
+from src.server.models.entity.model_sources import ModelSources
+from src.server.models.repository.model_cache_index import ModelCacheIndex
+from src.server.models.repository.model_constants import MODELS_INFO, expected_sha256
 from src.server.models.repository.model_repository import ModelRepository
 from src.server.models.service.model_download_manager import ModelDownloadManager
+from src.utils.process_memory import format_bytes
+
+# download_model() outcomes
+DOWNLOAD_ACCEPTED = "accepted"
+DOWNLOAD_RUNNING = "downloading"
+MODEL_LINKED = "linked"
 
 
 class LocalModelService(Protocol):
@@ -18,41 +31,74 @@ class LocalModelService(Protocol):
     def get_default_model_name(self) -> str:
         pass
 
-    def download_model(self, model_name: str) -> None:
+    def download_model(self, model_name: str) -> str:
+        pass
+
+    def cancel_download(self, model_name: str) -> bool:
         pass
 
     def is_downloading(self, model_name: str) -> bool:
         pass
 
+    def get_download_status(self, model_name: str) -> Optional[ModelDownloadStatus]:
+        pass
+
     def delete_model(self, model_name: str) -> bool:
         pass
 
+    def get_mirrored_model_file(self, sha256: str, filename: str) -> Optional[Path]:
+        pass
+
 
 class LocalModelServiceImpl(LocalModelService):
 
-    def __init__(self, model_repository: ModelRepository):
+    def __init__(
+        self,
+        model_repository: ModelRepository,
+        cache_index: Optional[ModelCacheIndex] = None,
+        sources: Optional[ModelSources] = None,
+    ):
         self._model_repository = model_repository
+        self._sources = sources or ModelSources()
+        self._cache_index = cache_index
         self._download_manager = ModelDownloadManager()
+        self._memory_tracker = ModelMemoryTracker.get_instance()
 
     def get_available_models(self) -> List[TranscriptionModelInfo]:
-        return [
-            TranscriptionModelInfo(
-                name=name,
-                english_only=info[1],
-                required_ram=info[2],
-                relative_speed=info[3],
-                in_system=self.is_model_in_system(name),
+        models = []
+        for name, info in self._model_repository.read_available_models().items():
+            measured_ram_bytes = self._memory_tracker.measured_footprint_bytes(name)
+            cache_entry = self._cache_index.entry(name) if self._cache_index else None
+            models.append(
+                TranscriptionModelInfo(
+                    name=name,
+                    english_only=info[1],
+                    required_ram=info[2],
+                    relative_speed=info[3],
+                    in_system=self.is_model_in_system(name),
+                    measured_ram=format_bytes(measured_ram_bytes),
+                    measured_ram_bytes=measured_ram_bytes,
+                    size_bytes=cache_entry.size_bytes if cache_entry else None,
+                    verified=cache_entry.verified if cache_entry else None,
+                )
             )
-            for name, info in self._model_repository.read_available_models().items()
-        ]
+        return models
 
     def is_model_in_system(self, model_name: str) -> bool:
+        if self._cache_index is not None:
+            return self._cache_index.is_present(model_name)
         return self._model_repository.is_model_in_system(model_name)
 
     def get_default_model_name(self) -> str:
         return self._model_repository.get_default_model_info()[0]
 
-    def download_model(self, model_name: str) -> None:
+    def download_model(self, model_name: str) -> str:
+        """Start a background download of ``model_name``.
+
+        Returns DOWNLOAD_ACCEPTED, DOWNLOAD_RUNNING when a download is
+        already under way, or MODEL_LINKED when a shared directory copy was
+        linked in place and nothing needs downloading.
+        """
         available_models = self._model_repository.read_available_models()
         if model_name not in available_models:
             raise ValueError(f"Model '{model_name}' is not recognized as available.")
@@ -62,15 +108,65 @@ class LocalModelServiceImpl(LocalModelService):
                 f"Model '{model_name}' is already in the system."
             )
 
-        # track download before starting background async
-        self._download_manager.track_model_download(model_name)
+        # a shared directory copy is linked in place; nothing is downloaded
+        if self._model_repository.link_shared_model(model_name):
+            MODEL_SOURCE_RESOLUTIONS_TOTAL.labels(source="shared").inc()
+            self._on_model_installed(model_name)
+            return MODEL_LINKED
+
+        # claim the download before starting background async (single-flight)
+        cancel_event = self._download_manager.try_start_download(model_name)
+        if cancel_event is None:
+            return DOWNLOAD_RUNNING
         # start download in background
         from src.core.transcription.download_model import download_model_async
 
-        download_model_async(model_name)
+        try:
+            download_model_async(model_name, cancel_event)
+        except Exception as exc:
+            self._download_manager.mark_failed(model_name, str(exc))
+            raise
+        return DOWNLOAD_ACCEPTED
+
+    def cancel_download(self, model_name: str) -> bool:
+        return self._download_manager.cancel_download(model_name)
 
     def is_downloading(self, model_name: str) -> bool:
         return self._download_manager.is_downloading(model_name)
 
+    def get_download_status(self, model_name: str) -> Optional[ModelDownloadStatus]:
+        return self._download_manager.get_status(model_name)
+
     def delete_model(self, model_name: str) -> bool:
-        return self._model_repository.delete_model(model_name)
+        deleted = self._model_repository.delete_model(model_name)
+        if self._cache_index is not None:
+            self._cache_index.refresh_model(model_name)
+        return deleted
+
+    def get_mirrored_model_file(self, sha256: str, filename: str) -> Optional[Path]:
+        """Resolve a LAN mirror request to a cached file that is safe to serve.
+
+        Only known checkpoints whose SHA-256 matches the request are served,
+        and, with a cache index, only once their checksum has been verified.
+        """
+        if not self._sources.serve_mirror:
+            return None
+        model_name = next(
+            (name for name, info in MODELS_INFO.items() if info[0] == filename), None
+        )
+        if model_name is None or expected_sha256(model_name) != sha256:
+            return None
+        if self._cache_index is not None:
+            entry = self._cache_index.entry(model_name)
+            if entry is None or not entry.present or entry.verified is not True:
+                return None
+        return self._model_repository.get_model_path(model_name)
+
+    def _on_model_installed(self, model_name: str) -> None:
+        from src.event_management.event_messenger import EventMessenger
+        from src.event_management.event_payloads import ModelDownloadComplete
+        from src.event_management.events import Event
+
+        EventMessenger.get_instance().emit(
+            Event.MODEL_DOWNLOAD_COMPLETE, ModelDownloadComplete(model_name=model_name)
+        )
@@ -1,35 +1,126 @@
-from threading import Lock
+import dataclasses
+from threading import Event, Lock
+from typing import Dict, Optional
+
+from src.event_management.event_payloads import (
+    ModelDownloadComplete,
+    ModelDownloadProgress,
+)
+from src.metrics.runtime_metrics import MODEL_DOWNLOADS_IN_PROGRESS
+from src.server.models.entity.model_download_status import (
+    CANCELLED,
+    DOWNLOADING,
+    FAILED,
+    ModelDownloadStatus,
+)
 
 
 class ModelDownloadManager:
+    """Single-flight bookkeeping for model downloads.
+
+    At most one download runs per model name. The state of the last attempt
+    is kept until the next one starts: ``downloading`` while the worker runs,
+    then ``failed`` or ``cancelled`` (a completed download is dropped, the
+    model cache reports it from then on).
+    """
+
     _download_lock = Lock()
-    _active_downloads: set[str] = set()
+    _downloads: Dict[str, ModelDownloadStatus] = {}
+    _cancel_events: Dict[str, Event] = {}
     _subscribed = False
 
-    def track_model_download(self, model_name: str):
+    def try_start_download(self, model_name: str) -> Optional[Event]:
+        """Claim the download of ``model_name``.
+
+        Returns the cancel event the worker must honour, or None when a
+        download of this model is already running.
+        """
         with self._download_lock:
-            if not self._subscribed:
-                self._subscribe_to_download_complete_event()
-                self._subscribed = True
+            self._ensure_subscribed_locked()
+            current = self._downloads.get(model_name)
+            if current is not None and current.state == DOWNLOADING:
+                return None
+            cancel_event = Event()
+            self._downloads[model_name] = ModelDownloadStatus(model_name=model_name)
+            self._cancel_events[model_name] = cancel_event
+            return cancel_event
 
-            self._active_downloads.add(model_name)
+    def cancel_download(self, model_name: str) -> bool:
+        """Ask a running download to stop; False if none is running."""
+        with self._download_lock:
+            status = self._downloads.get(model_name)
+            if status is None or status.state != DOWNLOADING:
+                return False
+            status.cancel_requested = True
+            self._cancel_events[model_name].set()
+            return True
+
+    def mark_failed(self, model_name: str, error: str) -> None:
+        self._finish(model_name, FAILED, error)
 
     def is_downloading(self, model_name: str) -> bool:
         """Check if a model is currently downloading."""
-        if not self._subscribed:
-            raise Exception("Model download manager not subscribed to events")
+        status = self.get_status(model_name)
+        return status is not None and status.state == DOWNLOADING
+
+    def get_status(self, model_name: str) -> Optional[ModelDownloadStatus]:
+        """Return a snapshot of the current or last download of ``model_name``."""
         with self._download_lock:
-            return model_name in self._active_downloads
+            status = self._downloads.get(model_name)
+            return dataclasses.replace(status) if status is not None else None
 
-    def _subscribe_to_download_complete_event(self):
+    def _ensure_subscribed_locked(self) -> None:
+        if ModelDownloadManager._subscribed:
+            return
         from src.event_management.event_messenger import EventMessenger
-        from src.event_management.events import Event
+        from src.event_management.events import Event as AppEvent
 
-        EventMessenger.get_instance().subscribe(
-            Event.MODEL_DOWNLOAD_COMPLETE, self._on_download_complete
+        # Inline: state changes must be visible to the next API request, and
+        # each handler only updates a dict under the lock.
+        messenger = EventMessenger.get_instance()
+        messenger.subscribe(
+            AppEvent.MODEL_DOWNLOAD_COMPLETE, self._on_download_complete, inline=True
+        )
+        messenger.subscribe(
+            AppEvent.MODEL_DOWNLOAD_PROGRESS, self._on_download_progress, inline=True
         )
+        ModelDownloadManager._subscribed = True
 
-    def _on_download_complete(self, model_name: str):
-        """Event handler - reads model_name from temp storage"""
+    def _finish(self, model_name: str, state: str, error: Optional[str] = None) -> None:
         with self._download_lock:
-            self._active_downloads.discard(model_name)
+            status = self._downloads.get(model_name)
+            if status is None or status.state != DOWNLOADING:
+                return
+            status.state = state
+            status.error = error
+            self._cancel_events.pop(model_name, None)
+
+    def _on_download_complete(self, event: ModelDownloadComplete):
+        with self._download_lock:
+            self._downloads.pop(event.model_name, None)
+            self._cancel_events.pop(event.model_name, None)
+
+    def _on_download_progress(self, event: ModelDownloadProgress):
+        if event.state == FAILED:
+            self._finish(event.model_name, FAILED, event.error)
+        elif event.state == CANCELLED:
+            self._finish(event.model_name, CANCELLED)
+        elif event.state == DOWNLOADING:
+            with self._download_lock:
+                status = self._downloads.get(event.model_name)
+                if status is not None and status.state == DOWNLOADING:
+                    status.downloaded_bytes = event.downloaded_bytes or 0
+                    status.total_bytes = event.total_bytes
+
+
+def _collect_downloads_in_progress() -> dict:
+    with ModelDownloadManager._download_lock:
+        running = sum(
+            1
+            for status in ModelDownloadManager._downloads.values()
+            if status.state == DOWNLOADING
+        )
+        return {(): running}
+
+
+MODEL_DOWNLOADS_IN_PROGRESS.set_function(_collect_downloads_in_progress)
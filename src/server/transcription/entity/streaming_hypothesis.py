@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+PARTIAL = "partial"
+FINAL = "final"
+
+
+@dataclass(frozen=True)
+class StreamingHypothesis:
+    kind: str
+    text: str
+    # Index of the utterance; partials share it with the final that ends it.
+    segment_index: int
+    # Position in the stream, in seconds of audio received.
+    start_seconds: float
+    end_seconds: float
+    # From taking the audio snapshot to having its text.
+    latency_seconds: float
+    language: str = ""
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+@dataclass
+class TranscriptionJob:
+    job_id: str
+    submitted_at: float
+    state: str = QUEUED
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    text: Optional[str] = None
+    language: Optional[str] = None
+    model_name: Optional[str] = None
+    audio_seconds: Optional[float] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (COMPLETED, FAILED)
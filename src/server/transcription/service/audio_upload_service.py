@@ -0,0 +1,122 @@
+import array
+import tempfile
+import uuid
+import wave
+from pathlib import Path
+from typing import BinaryIO, Optional, Protocol
+
+# Raw 16-bit PCM: audio/L16 is big-endian (RFC 2586), audio/pcm little-endian.
+PCM_BIG_ENDIAN_TYPES = frozenset({"audio/l16"})
+PCM_LITTLE_ENDIAN_TYPES = frozenset({"audio/pcm", "audio/x-pcm"})
+DEFAULT_PCM_SAMPLE_RATE = 16000
+DEFAULT_PCM_CHANNELS = 1
+
+_ENCODED_SUFFIXES = {
+    "audio/wav": ".wav",
+    "audio/x-wav": ".wav",
+    "audio/wave": ".wav",
+    "audio/mpeg": ".mp3",
+    "audio/mp4": ".m4a",
+    "audio/ogg": ".ogg",
+    "audio/webm": ".webm",
+    "audio/flac": ".flac",
+}
+
+
+class AudioUploadService(Protocol):
+    """AudioUploadService
+
+    Responsibility:
+        Persist an uploaded audio body to a temporary file the transcription
+        pipeline can read, without buffering it in memory. Encoded audio is
+        copied as is; raw 16-bit PCM is wrapped in a WAV header.
+
+    Interface:
+        * save_upload(stream, mimetype, sample_rate=None, channels=None) -> Path:
+          raises ValueError for empty bodies or bad PCM parameters
+    """
+
+    def save_upload(
+        self,
+        stream: BinaryIO,
+        mimetype: str,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+    ) -> Path: ...
+
+
+class AudioUploadServiceImpl(AudioUploadService):
+    CHUNK_BYTES = 64 * 1024
+
+    def __init__(self, upload_dir: Optional[Path] = None) -> None:
+        self._upload_dir = upload_dir or Path(tempfile.gettempdir()) / "sona-api-uploads"
+
+    def save_upload(
+        self,
+        stream: BinaryIO,
+        mimetype: str,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+    ) -> Path:
+        mimetype = (mimetype or "").lower()
+        is_pcm = mimetype in PCM_BIG_ENDIAN_TYPES or mimetype in PCM_LITTLE_ENDIAN_TYPES
+        suffix = ".wav" if is_pcm else _ENCODED_SUFFIXES.get(mimetype, ".audio")
+        self._upload_dir.mkdir(parents=True, exist_ok=True)
+        path = self._upload_dir / f"{uuid.uuid4().hex}{suffix}"
+        try:
+            if is_pcm:
+                written = self._save_pcm(
+                    stream,
+                    path,
+                    sample_rate or DEFAULT_PCM_SAMPLE_RATE,
+                    channels or DEFAULT_PCM_CHANNELS,
+                    big_endian=mimetype in PCM_BIG_ENDIAN_TYPES,
+                )
+            else:
+                written = self._save_encoded(stream, path)
+            if written == 0:
+                raise ValueError("Empty audio upload")
+            return path
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+    def _save_encoded(self, stream: BinaryIO, path: Path) -> int:
+        written = 0
+        with path.open("wb") as upload_file:
+            while chunk := stream.read(self.CHUNK_BYTES):
+                upload_file.write(chunk)
+                written += len(chunk)
+        return written
+
+    def _save_pcm(
+        self,
+        stream: BinaryIO,
+        path: Path,
+        sample_rate: int,
+        channels: int,
+        big_endian: bool,
+    ) -> int:
+        if not 8000 <= sample_rate <= 192000:
+            raise ValueError(f"Unsupported PCM sample rate: {sample_rate}")
+        if not 1 <= channels <= 8:
+            raise ValueError(f"Unsupported PCM channel count: {channels}")
+        frame_bytes = 2 * channels
+        written = 0
+        carry = b""
+        with wave.open(str(path), "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            while chunk := stream.read(self.CHUNK_BYTES):
+                data = carry + chunk
+                usable = len(data) - len(data) % frame_bytes
+                data, carry = data[:usable], data[usable:]
+                if big_endian and data:
+                    # WAV stores little-endian samples.
+                    samples = array.array("h", data)
+                    samples.byteswap()
+                    data = samples.tobytes()
+                wav_file.writeframesraw(data)
+                written += len(data)
+        return written
@@ -0,0 +1,188 @@
+"""Rolling-buffer transcription of one streamed PCM connection."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from src.core.transcription.ai_transcriber import SAMPLE_RATE
+from src.metrics.runtime_metrics import STREAM_HYPOTHESIS_LATENCY_SECONDS
+from ..entity.streaming_hypothesis import FINAL, PARTIAL, StreamingHypothesis
+
+BYTES_PER_SAMPLE = 2
+
+
+@dataclass
+class _Inference:
+    future: Future
+    kind: str
+    segment_index: int
+    start_seconds: float
+    end_seconds: float
+    snapshot_at: float
+
+
+class StreamingSession:
+    """StreamingSession
+
+    Responsibility:
+        Turn a stream of 16 kHz mono 16-bit little-endian PCM into partial
+        and final hypotheses. Audio accumulates in a rolling buffer that
+        holds the current utterance. While the speaker talks, the whole
+        utterance is transcribed again every ``PARTIAL_INTERVAL_SECONDS`` of
+        new audio and sent as a partial. The utterance is finalised
+        (transcribed a last time, sent as final and dropped from the buffer)
+        after ``SILENCE_SECONDS`` of silence following speech, once it is
+        ``MAX_UTTERANCE_SECONDS`` long, or when the stream ends.
+
+        At most one inference per session is in flight. A partial that would
+        queue behind a slow inference is skipped rather than queued, so every
+        hypothesis is at most one inference behind the speaker, and the
+        utterance cap bounds how long that inference can take.
+
+    Interface:
+        * feed(pcm: bytes) -> None
+        * poll() -> list[StreamingHypothesis]: never blocks; raises if an
+          inference failed
+        * finish(timeout: float) -> list[StreamingHypothesis]: finalise the
+          remaining audio
+        * cancel() -> None
+    """
+
+    PARTIAL_INTERVAL_SECONDS = 1.0
+    SILENCE_SECONDS = 0.6
+    # RMS of samples scaled to [-1, 1] below which audio counts as silence.
+    SILENCE_RMS = 0.01
+    MAX_UTTERANCE_SECONDS = 20.0
+    # Whisper tends to hallucinate words on very short clips.
+    MIN_UTTERANCE_SECONDS = 0.3
+    # Silence kept ahead of speech so its first syllable is not clipped.
+    LEADING_SILENCE_SECONDS = 0.3
+
+    def __init__(self, transcribe_samples: Callable[[Any], Future]) -> None:
+        self._transcribe_samples = transcribe_samples
+        self._carry = b""
+        self._utterance = bytearray()
+        self._utterance_start_seconds = 0.0
+        self._heard_speech = False
+        self._silent_samples = 0
+        self._samples_at_last_partial = 0
+        self._endpoint = False
+        self._segment_index = 0
+        self._inflight: Optional[_Inference] = None
+
+    def feed(self, pcm: bytes) -> None:
+        data = self._carry + pcm
+        usable = len(data) - len(data) % BYTES_PER_SAMPLE
+        data, self._carry = data[:usable], data[usable:]
+        if not data:
+            return
+        frame = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        self._utterance.extend(data)
+        if float(np.sqrt(np.mean(frame * frame))) >= self.SILENCE_RMS:
+            self._heard_speech = True
+            self._silent_samples = 0
+        else:
+            self._silent_samples += len(frame)
+
+        if not self._heard_speech:
+            self._trim_leading_silence()
+        elif (
+            self._silent_samples >= self.SILENCE_SECONDS * SAMPLE_RATE
+            or self._utterance_samples() >= self.MAX_UTTERANCE_SECONDS * SAMPLE_RATE
+        ):
+            self._endpoint = True
+
+    def poll(self) -> List[StreamingHypothesis]:
+        hypotheses = []
+        inflight = self._inflight
+        if inflight is not None and inflight.future.done():
+            self._inflight = None
+            hypotheses.append(self._collect(inflight))
+        if self._inflight is None:
+            self._submit_next()
+        return [hypothesis for hypothesis in hypotheses if hypothesis.text]
+
+    def finish(self, timeout: float) -> List[StreamingHypothesis]:
+        deadline = time.perf_counter() + timeout
+        self._endpoint = self._heard_speech
+        hypotheses = self.poll()
+        while self._inflight is not None:
+            remaining = deadline - time.perf_counter()
+            done, _ = wait([self._inflight.future], timeout=max(0.0, remaining))
+            if not done:
+                raise TimeoutError("Final hypothesis was not ready in time")
+            hypotheses.extend(self.poll())
+        return hypotheses
+
+    def cancel(self) -> None:
+        if self._inflight is not None:
+            self._inflight.future.cancel()
+            self._inflight = None
+
+    def _submit_next(self) -> None:
+        if self._endpoint:
+            self._submit_final()
+        elif (
+            self._heard_speech
+            and self._utterance_samples() - self._samples_at_last_partial
+            >= self.PARTIAL_INTERVAL_SECONDS * SAMPLE_RATE
+        ):
+            self._samples_at_last_partial = self._utterance_samples()
+            self._submit(PARTIAL)
+
+    def _submit_final(self) -> None:
+        if self._utterance_samples() >= self.MIN_UTTERANCE_SECONDS * SAMPLE_RATE:
+            self._submit(FINAL)
+            self._segment_index += 1
+        self._utterance_start_seconds += self._utterance_samples() / SAMPLE_RATE
+        self._utterance.clear()
+        self._heard_speech = False
+        self._silent_samples = 0
+        self._samples_at_last_partial = 0
+        self._endpoint = False
+
+    def _submit(self, kind: str) -> None:
+        samples = (
+            np.frombuffer(bytes(self._utterance), dtype="<i2").astype(np.float32)
+            / 32768.0
+        )
+        self._inflight = _Inference(
+            future=self._transcribe_samples(samples),
+            kind=kind,
+            segment_index=self._segment_index,
+            start_seconds=self._utterance_start_seconds,
+            end_seconds=self._utterance_start_seconds + len(samples) / SAMPLE_RATE,
+            snapshot_at=time.perf_counter(),
+        )
+
+    def _collect(self, inflight: _Inference) -> StreamingHypothesis:
+        # Re-raises the inference error; the connection cannot recover from it.
+        result = inflight.future.result()
+        latency_seconds = time.perf_counter() - inflight.snapshot_at
+        STREAM_HYPOTHESIS_LATENCY_SECONDS.labels(kind=inflight.kind).observe(
+            latency_seconds
+        )
+        return StreamingHypothesis(
+            kind=inflight.kind,
+            text=str(result.get("text", "")).strip(),
+            segment_index=inflight.segment_index,
+            start_seconds=round(inflight.start_seconds, 3),
+            end_seconds=round(inflight.end_seconds, 3),
+            latency_seconds=round(latency_seconds, 3),
+            language=result.get("language") or "",
+        )
+
+    def _trim_leading_silence(self) -> None:
+        keep_bytes = int(self.LEADING_SILENCE_SECONDS * SAMPLE_RATE) * BYTES_PER_SAMPLE
+        excess = len(self._utterance) - keep_bytes
+        if excess > 0:
+            del self._utterance[:excess]
+            self._utterance_start_seconds += excess / BYTES_PER_SAMPLE / SAMPLE_RATE
+
+    def _utterance_samples(self) -> int:
+        return len(self._utterance) // BYTES_PER_SAMPLE
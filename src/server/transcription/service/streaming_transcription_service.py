@@ -0,0 +1,96 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Protocol
+
+from src.core.transcription.background_transcription_orchestrator import (
+    BackgroundTranscriptionOrchestratorImpl,
+)
+from src.metrics.runtime_metrics import STREAM_SESSIONS_ACTIVE, STREAM_SESSIONS_TOTAL
+from src.server.exception.transcription_overloaded_exception import (
+    TranscriptionOverloadedException,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.server.transcription.service.streaming_session import StreamingSession
+
+
+class StreamingTranscriptionService(Protocol):
+    """StreamingTranscriptionService
+
+    Responsibility:
+        Admit streaming transcription sessions up to the inference capacity
+        and create their rolling-buffer sessions on the live orchestrator.
+        A streaming session keeps an inference lane busy for as long as its
+        speaker talks, so it is capped rather than queued. Stream inferences
+        run on a pool of their own, one thread per session, instead of the
+        shared transcription executor.
+
+    Interface:
+        * open_session() -> StreamingSession: raises
+          TranscriptionOverloadedException at capacity and RuntimeError when
+          the transcription runtime is not running
+        * close_session(session) -> None
+    """
+
+    def open_session(self) -> "StreamingSession": ...
+
+    def close_session(self, session: "StreamingSession") -> None: ...
+
+
+class StreamingTranscriptionServiceImpl(StreamingTranscriptionService):
+    # Streams are short-lived; a client may try again this much later.
+    RETRY_AFTER_SECONDS = 5
+
+    def __init__(
+        self,
+        orchestrator_provider: Callable[
+            [], Optional[BackgroundTranscriptionOrchestratorImpl]
+        ],
+        max_sessions: int = 1,
+    ) -> None:
+        self._orchestrator_provider = orchestrator_provider
+        self._max_sessions = max(1, max_sessions)
+        self._lock = threading.Lock()
+        self._active_sessions = 0
+        # at most one inference per session is in flight
+        self._inference_executor = ThreadPoolExecutor(
+            max_workers=self._max_sessions, thread_name_prefix="StreamInference"
+        )
+        STREAM_SESSIONS_ACTIVE.set_function(lambda: {(): self._active_sessions})
+
+    def open_session(self) -> "StreamingSession":
+        # numpy is only imported once a client actually streams.
+        from src.server.transcription.service.streaming_session import (
+            StreamingSession,
+        )
+
+        orchestrator = self._orchestrator_provider()
+        if orchestrator is None:
+            raise RuntimeError("Transcription runtime is not running")
+        with self._lock:
+            if self._active_sessions >= self._max_sessions:
+                STREAM_SESSIONS_TOTAL.labels(outcome="rejected").inc()
+                raise TranscriptionOverloadedException(
+                    f"All {self._max_sessions} streaming sessions are in use",
+                    retry_after_seconds=self.RETRY_AFTER_SECONDS,
+                    reason="session_limit",
+                )
+            self._active_sessions += 1
+        STREAM_SESSIONS_TOTAL.labels(outcome="accepted").inc()
+        # Resolved per inference so a runtime reload is picked up mid-stream.
+        return StreamingSession(
+            lambda samples: self._inference_executor.submit(
+                self._transcribe_samples, samples
+            )
+        )
+
+    def close_session(self, session: "StreamingSession") -> None:
+        session.cancel()
+        with self._lock:
+            self._active_sessions = max(0, self._active_sessions - 1)
+
+    def _transcribe_samples(self, samples: Any) -> Dict[str, Any]:
+        orchestrator = self._orchestrator_provider()
+        if orchestrator is None:
+            raise RuntimeError("Transcription runtime is not running")
+        return orchestrator.transcribe_samples(samples)
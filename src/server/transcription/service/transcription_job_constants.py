@@ -0,0 +1,4 @@
+# Admission defaults for POST /api/transcribe; kept free of heavy imports so
+# run.py can use them for its --help output.
+DEFAULT_MAX_QUEUED_JOBS = 8
+DEFAULT_WAIT_SLO_SECONDS = 30.0
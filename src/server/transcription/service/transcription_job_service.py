@@ -0,0 +1,220 @@
+import dataclasses
+import math
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Protocol
+
+from src.core.transcription.background_transcription_orchestrator import (
+    BackgroundTranscriptionOrchestratorImpl,
+)
+from src.core.transcription.cleanup_service import CleanupService, CleanupServiceImpl
+from src.metrics.runtime_metrics import (
+    API_TRANSCRIPTION_ESTIMATED_WAIT_SECONDS,
+    API_TRANSCRIPTION_QUEUE_DEPTH,
+    API_TRANSCRIPTIONS_TOTAL,
+)
+from src.server.exception.transcription_overloaded_exception import (
+    TranscriptionOverloadedException,
+)
+from src.server.transcription.entity.transcription_job import (
+    COMPLETED,
+    FAILED,
+    RUNNING,
+    TranscriptionJob,
+)
+from src.server.transcription.service.transcription_job_constants import (
+    DEFAULT_MAX_QUEUED_JOBS,
+    DEFAULT_WAIT_SLO_SECONDS,
+)
+
+
+class TranscriptionJobService(Protocol):
+    """TranscriptionJobService
+
+    Responsibility:
+        Accept transcription jobs from API clients, run them one at a time
+        through the live orchestrator and keep their results for polling.
+        Shed load before a request is even read when the estimated queue
+        wait would break the wait SLO.
+
+    Interface:
+        * check_admission() -> None: raises TranscriptionOverloadedException
+        * submit(audio_path: Path) -> TranscriptionJob
+        * wait(job_id: str, timeout: float) -> Optional[TranscriptionJob]
+        * get_job(job_id: str) -> Optional[TranscriptionJob]
+    """
+
+    def check_admission(self) -> None: ...
+
+    def submit(self, audio_path: Path) -> TranscriptionJob: ...
+
+    def wait(self, job_id: str, timeout: float) -> Optional[TranscriptionJob]: ...
+
+    def get_job(self, job_id: str) -> Optional[TranscriptionJob]: ...
+
+
+class TranscriptionJobServiceImpl(TranscriptionJobService):
+    """Bounded FIFO of API transcription jobs with EWMA-based admission.
+
+    ``concurrency`` dispatcher threads each hand one job at a time to the
+    orchestrator. It must be 1 for a single in-process model, whose
+    inference is serialised with hotkey dictation and streaming, and may be
+    the replica count when a replica pool serves jobs side by side. A job's
+    service time runs from dispatch to result, so it includes any wait for
+    the in-process model behind dictation or a stream. The expected wait of
+    a new job is the EWMA of recent service times multiplied by the jobs
+    ahead of it, shared across the dispatchers (running jobs count only for
+    their expected remaining time). Requests are refused with a retry hint
+    when the queue is full or that estimate exceeds the SLO.
+    """
+
+    EWMA_ALPHA = 0.3
+    # Assumed service time until the first job has been measured.
+    INITIAL_SERVICE_SECONDS = 5.0
+    FINISHED_JOBS_KEPT = 256
+
+    def __init__(
+        self,
+        orchestrator_provider: Callable[
+            [], Optional[BackgroundTranscriptionOrchestratorImpl]
+        ],
+        max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+        wait_slo_seconds: float = DEFAULT_WAIT_SLO_SECONDS,
+        cleanup_service: Optional[CleanupService] = None,
+        concurrency: int = 1,
+    ) -> None:
+        self._orchestrator_provider = orchestrator_provider
+        self._wait_slo_seconds = wait_slo_seconds
+        self._cleanup_service = cleanup_service or CleanupServiceImpl()
+        self._pending: "queue.Queue[tuple[str, Path]]" = queue.Queue(
+            maxsize=max(1, max_queued_jobs)
+        )
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, TranscriptionJob]" = OrderedDict()
+        self._done_events: Dict[str, threading.Event] = {}
+        self._service_seconds_ewma = self.INITIAL_SERVICE_SECONDS
+        self._concurrency = max(1, concurrency)
+        self._running_started_at: Dict[str, float] = {}
+        self._threads: list[threading.Thread] = []
+        API_TRANSCRIPTION_QUEUE_DEPTH.set_function(
+            lambda: {(): self._pending.qsize()}
+        )
+
+    def check_admission(self) -> None:
+        with self._lock:
+            self._check_admission_locked()
+
+    def submit(self, audio_path: Path) -> TranscriptionJob:
+        with self._lock:
+            self._check_admission_locked()
+            job = TranscriptionJob(job_id=uuid.uuid4().hex, submitted_at=time.time())
+            try:
+                self._pending.put_nowait((job.job_id, audio_path))
+            except queue.Full:
+                # Only reachable when another request was admitted meanwhile.
+                self._reject_locked("queue_full", self._service_seconds_ewma)
+            self._jobs[job.job_id] = job
+            self._done_events[job.job_id] = threading.Event()
+            self._ensure_dispatcher_locked()
+            return dataclasses.replace(job)
+
+    def wait(self, job_id: str, timeout: float) -> Optional[TranscriptionJob]:
+        with self._lock:
+            done = self._done_events.get(job_id)
+        if done is not None:
+            done.wait(timeout)
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dataclasses.replace(job) if job is not None else None
+
+    def _check_admission_locked(self) -> None:
+        if self._pending.full():
+            self._reject_locked("queue_full", self._service_seconds_ewma)
+        estimated_wait = self._estimated_wait_locked()
+        API_TRANSCRIPTION_ESTIMATED_WAIT_SECONDS.set(estimated_wait)
+        if estimated_wait > self._wait_slo_seconds:
+            self._reject_locked("slo", estimated_wait - self._wait_slo_seconds)
+
+    def _estimated_wait_locked(self) -> float:
+        estimated_work = self._pending.qsize() * self._service_seconds_ewma
+        now = time.monotonic()
+        for started_at in self._running_started_at.values():
+            estimated_work += max(0.0, self._service_seconds_ewma - (now - started_at))
+        return estimated_work / self._concurrency
+
+    def _reject_locked(self, reason: str, retry_after_seconds: float) -> None:
+        API_TRANSCRIPTIONS_TOTAL.labels(outcome=f"rejected_{reason}").inc()
+        raise TranscriptionOverloadedException(
+            "Transcription queue is full"
+            if reason == "queue_full"
+            else "Estimated queue wait exceeds the SLO",
+            retry_after_seconds=max(1, math.ceil(retry_after_seconds)),
+            reason=reason,
+        )
+
+    def _ensure_dispatcher_locked(self) -> None:
+        if self._threads:
+            return
+        for index in range(self._concurrency):
+            thread = threading.Thread(
+                target=self._run, name=f"ApiTranscriptionDispatcher-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _run(self) -> None:
+        while True:
+            job_id, audio_path = self._pending.get()
+            with self._lock:
+                self._running_started_at[job_id] = time.monotonic()
+                self._update_job_locked(job_id, state=RUNNING, started_at=time.time())
+            started_at = time.monotonic()
+            try:
+                completed = self._transcribe(audio_path)
+            except Exception as exc:
+                API_TRANSCRIPTIONS_TOTAL.labels(outcome=FAILED).inc()
+                changes = {"state": FAILED, "error": f"{type(exc).__name__}: {exc}"}
+            else:
+                API_TRANSCRIPTIONS_TOTAL.labels(outcome=COMPLETED).inc()
+                changes = {
+                    "state": COMPLETED,
+                    "text": completed.text,
+                    "language": completed.language,
+                    "model_name": completed.model_name,
+                    "audio_seconds": completed.audio_seconds,
+                    "timings": dict(completed.timings),
+                }
+            service_seconds = time.monotonic() - started_at
+            with self._lock:
+                self._service_seconds_ewma += self.EWMA_ALPHA * (
+                    service_seconds - self._service_seconds_ewma
+                )
+                self._running_started_at.pop(job_id, None)
+                self._update_job_locked(job_id, finished_at=time.time(), **changes)
+                self._done_events.pop(job_id).set()
+                self._forget_finished_locked()
+
+    def _transcribe(self, audio_path: Path):
+        orchestrator = self._orchestrator_provider()
+        if orchestrator is None:
+            self._cleanup_service.delete_file(audio_path)
+            raise RuntimeError("Transcription runtime is not running")
+        # The pipeline deletes the upload once it is done with it.
+        return orchestrator.submit_transcription(audio_path).result()
+
+    def _update_job_locked(self, job_id: str, **changes) -> None:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._jobs[job_id] = dataclasses.replace(job, **changes)
+
+    def _forget_finished_locked(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.FINISHED_JOBS_KEPT)]:
+            del self._jobs[job_id]
@@ -0,0 +1,180 @@
+"""Serve the Flask API in production or development mode."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Flask
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5000
+DEFAULT_THREADS = 16
+DEFAULT_STREAM_PORT = 5001
+STREAM_PATH = "/api/stream"
+DEFAULT_MIRROR_HOST = "0.0.0.0"
+DEFAULT_MIRROR_PORT = 5002
+MIRROR_THREADS = 4
+MODEL_FILES_PATH = "/api/model-files"
+
+
+@dataclass
+class ServerSettings:
+    host: str = DEFAULT_HOST
+    port: int = DEFAULT_PORT
+    threads: int = DEFAULT_THREADS
+    # Pending + active connections accepted before new ones wait in the backlog.
+    connection_limit: int = 100
+    # Idle keep-alive connections are closed after this many seconds.
+    keep_alive_seconds: int = 120
+    debug: bool = False
+    # Port of the WebSocket listener for /api/stream; 0 disables it.
+    stream_port: int = 0
+    # Connections the stream listener holds at once; more are refused.
+    stream_connection_limit: int = 4
+    # Read-only model file mirror, on its own address; port 0 disables it.
+    mirror_host: str = DEFAULT_MIRROR_HOST
+    mirror_port: int = 0
+
+
+def serve(
+    app: Flask, settings: ServerSettings, mirror_app: Optional[Flask] = None
+) -> None:
+    """Run ``app`` until interrupted.
+
+    Production mode uses waitress, which has a fixed worker pool, HTTP/1.1
+    keep-alive and no debugger. Debug mode, and production without waitress
+    installed, use the Werkzeug development server.
+
+    waitress cannot hand a connection over to a WebSocket, so when
+    ``stream_port`` is set a threaded Werkzeug server on that port serves
+    ``/api/stream`` alone, for at most ``stream_connection_limit`` clients
+    at a time. Every other path answers 404 there, so the rest of the API
+    stays behind the waitress pool.
+
+    ``mirror_app`` is served on ``mirror_host:mirror_port`` by a separate
+    listener, so model files can be offered to the LAN without exposing
+    the API.
+    """
+    if mirror_app is not None and settings.mirror_port:
+        _start_mirror_listener(mirror_app, settings)
+    if settings.stream_port and not settings.debug:
+        _start_stream_listener(app, settings)
+
+    if settings.debug:
+        app.run(
+            host=settings.host,
+            port=settings.port,
+            debug=True,
+            use_reloader=False,
+        )
+        return
+
+    try:
+        from waitress import serve as waitress_serve  # type: ignore
+    except ImportError:
+        print(
+            "[WARNING] waitress is not installed; falling back to the Werkzeug "
+            "development server (pip install waitress)"
+        )
+        app.run(
+            host=settings.host,
+            port=settings.port,
+            debug=False,
+            use_reloader=False,
+            threaded=True,
+        )
+        return
+
+    print(
+        f"[INFO] Serving API on http://{settings.host}:{settings.port} "
+        f"with {settings.threads} worker threads"
+    )
+    waitress_serve(
+        app,
+        host=settings.host,
+        port=settings.port,
+        threads=settings.threads,
+        connection_limit=settings.connection_limit,
+        channel_timeout=settings.keep_alive_seconds,
+        ident="sona",
+    )
+
+
+def _start_stream_listener(app: Flask, settings: ServerSettings) -> None:
+    from werkzeug.serving import make_server
+
+    try:
+        server = make_server(
+            settings.host,
+            settings.stream_port,
+            _stream_only(app, settings.stream_connection_limit),
+            threaded=True,
+        )
+    except OSError as exc:
+        print(f"[WARNING] Streaming listener not started on port {settings.stream_port}: {exc}")
+        return
+    print(
+        f"[INFO] Serving /api/stream on ws://{settings.host}:{settings.stream_port}"
+    )
+    threading.Thread(
+        target=server.serve_forever, name="StreamListener", daemon=True
+    ).start()
+
+
+def _start_mirror_listener(app: Flask, settings: ServerSettings) -> None:
+    try:
+        from waitress import create_server  # type: ignore
+    except ImportError:
+        create_server = None
+
+    try:
+        if create_server is not None:
+            server = create_server(
+                app,
+                host=settings.mirror_host,
+                port=settings.mirror_port,
+                threads=MIRROR_THREADS,
+                channel_timeout=settings.keep_alive_seconds,
+                ident="sona-mirror",
+            )
+            run = server.run
+        else:
+            from werkzeug.serving import make_server
+
+            server = make_server(
+                settings.mirror_host, settings.mirror_port, app, threaded=True
+            )
+            run = server.serve_forever
+    except OSError as exc:
+        print(f"[WARNING] Model mirror not started on port {settings.mirror_port}: {exc}")
+        return
+    print(
+        f"[INFO] Serving model files on "
+        f"http://{settings.mirror_host}:{settings.mirror_port}{MODEL_FILES_PATH}"
+    )
+    threading.Thread(target=run, name="MirrorListener", daemon=True).start()
+
+
+def _stream_only(app: Flask, connection_limit: int) -> Callable[..., Iterable[bytes]]:
+    slots = threading.BoundedSemaphore(max(1, connection_limit))
+
+    def dispatch(environ: dict, start_response: Callable[..., Any]) -> Iterable[bytes]:
+        if environ.get("PATH_INFO") != STREAM_PATH:
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"Not Found"]
+        if not slots.acquire(blocking=False):
+            start_response(
+                "503 Service Unavailable",
+                [("Content-Type", "text/plain"), ("Retry-After", "5")],
+            )
+            return [b"Too many streaming connections"]
+        try:
+            # The WebSocket session runs inside this call and is over when it returns.
+            return app(environ, start_response)
+        finally:
+            slots.release()
+
+    return dispatch
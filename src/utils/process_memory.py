@@ -0,0 +1,122 @@
+"""Best-effort, dependency-free probes for process and system memory."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+_PROC_STATM = Path("/proc/self/statm")
+_PROC_MEMINFO = Path("/proc/meminfo")
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Return the current resident set size of this process in bytes.
+
+    Uses ``psutil`` when it happens to be installed, ``/proc`` on Linux and
+    ``ps`` on macOS. Returns ``None`` when no probe is available; peak RSS is
+    never substituted, because it does not go down on unload and would make
+    every later load look free.
+    """
+    try:
+        import psutil  # type: ignore
+
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        pass
+
+    try:
+        if _PROC_STATM.exists():
+            resident_pages = int(_PROC_STATM.read_text().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+
+    if sys.platform == "darwin":
+        return _darwin_current_rss_bytes()
+    return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of this process in bytes."""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return None
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def available_system_memory_bytes() -> Optional[int]:
+    """Return memory the OS could hand out without swapping, in bytes.
+
+    Uses ``psutil`` when installed, ``MemAvailable`` from ``/proc/meminfo`` on
+    Linux and ``vm_stat`` (free + inactive + speculative pages) on macOS.
+    Returns ``None`` when no probe is available.
+    """
+    try:
+        import psutil  # type: ignore
+
+        return int(psutil.virtual_memory().available)
+    except Exception:
+        pass
+
+    try:
+        if _PROC_MEMINFO.exists():
+            for line in _PROC_MEMINFO.read_text().splitlines():
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except Exception:
+        pass
+
+    if sys.platform == "darwin":
+        return _darwin_available_memory_bytes()
+    return None
+
+
+def _darwin_available_memory_bytes() -> Optional[int]:
+    try:
+        output = subprocess.run(
+            ["vm_stat"], capture_output=True, text=True, timeout=2, check=True
+        ).stdout
+    except Exception:
+        return None
+
+    page_size_match = re.search(r"page size of (\d+) bytes", output)
+    page_size = int(page_size_match.group(1)) if page_size_match else 4096
+    pages = 0
+    for label in ("Pages free", "Pages inactive", "Pages speculative"):
+        match = re.search(rf"{label}:\s+(\d+)", output)
+        if match:
+            pages += int(match.group(1))
+    return pages * page_size if pages else None
+
+
+def _darwin_current_rss_bytes() -> Optional[int]:
+    try:
+        output = subprocess.run(
+            ["ps", "-o", "rss=", "-p", str(os.getpid())],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=True,
+        ).stdout
+        # ps reports RSS in kilobytes.
+        return int(output.strip()) * 1024
+    except Exception:
+        return None
+
+
+def format_bytes(size: Optional[int]) -> Optional[str]:
+    """Format a byte count in the same "~N GB" register as ``MODELS_INFO``."""
+    if size is None:
+        return None
+    for unit, factor in (("GB", 1024**3), ("MB", 1024**2), ("KB", 1024)):
+        if abs(size) >= factor:
+            return f"~{size / factor:.1f} {unit}"
+    return f"~{size} B"
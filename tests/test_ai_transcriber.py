@@ -0,0 +1,70 @@
+import threading
+import time
+
+from src.core.transcription.ai_transcriber import AITranscriberImpl
+
+
+class _CpuDevices:
+    def get_platform_device(self, model_name: str) -> str:
+        return "cpu"
+
+    def clear_device_cache(self, device: str) -> None:
+        pass
+
+
+class _OverlapDetectingModel:
+    """Records how many transcribe calls ever ran at the same time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._running = 0
+        self.max_running = 0
+
+    def transcribe(self, audio, **options):
+        with self._lock:
+            self._running += 1
+            self.max_running = max(self.max_running, self._running)
+        time.sleep(0.02)
+        with self._lock:
+            self._running -= 1
+        return {"text": "ok"}
+
+
+def test_in_process_inference_is_serialised(monkeypatch):
+    model = _OverlapDetectingModel()
+    monkeypatch.setattr(AITranscriberImpl, "_model", model)
+    monkeypatch.setattr(AITranscriberImpl, "_loaded_model_name", "tiny")
+    transcriber = AITranscriberImpl("tiny", device_manager=_CpuDevices())
+
+    threads = [
+        threading.Thread(target=transcriber.transcribe_samples, args=([0.0] * 1600,))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert model.max_running == 1
+    assert transcriber.idle_seconds() >= 0.0
+
+
+def test_evict_waits_for_queued_inference(monkeypatch):
+    model = _OverlapDetectingModel()
+    monkeypatch.setattr(AITranscriberImpl, "_model", model)
+    monkeypatch.setattr(AITranscriberImpl, "_loaded_model_name", "tiny")
+    transcriber = AITranscriberImpl("tiny", device_manager=_CpuDevices())
+
+    with AITranscriberImpl._inference_lock:
+        queued = threading.Thread(
+            target=transcriber.transcribe_samples, args=([0.0] * 1600,)
+        )
+        queued.start()
+        deadline = time.monotonic() + 5
+        while not AITranscriberImpl._in_flight:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        # A caller waiting for the model already counts as in flight.
+        assert transcriber.evict("idle") is False
+    queued.join()
+    assert AITranscriberImpl._model is model
@@ -0,0 +1,67 @@
+from src.server.config.entity.user_config import UserConfig
+from src.server.config.serivce.cached_config_load_service import (
+    CachedConfigLoadService,
+)
+
+
+class _CountingLoader:
+    def __init__(self) -> None:
+        self.loads = 0
+        self.current_model = "base.en"
+
+    def load_config(self) -> UserConfig:
+        self.loads += 1
+        return UserConfig(hot_key="ctrl+space", current_model=self.current_model)
+
+
+class _VersionedRepository:
+    def __init__(self) -> None:
+        self.version = (1, 100)
+
+    def read_user_config_version(self):
+        return self.version
+
+
+def _cached():
+    loader = _CountingLoader()
+    repository = _VersionedRepository()
+    return CachedConfigLoadService(loader, repository), loader, repository
+
+
+def test_unchanged_file_is_parsed_once():
+    service, loader, _ = _cached()
+
+    for _ in range(5):
+        assert service.load_config().current_model == "base.en"
+
+    assert loader.loads == 1
+
+
+def test_callers_get_copies():
+    service, _, _ = _cached()
+
+    service.load_config().model_eviction.idle_timeout_seconds = -1
+
+    assert service.load_config().model_eviction.idle_timeout_seconds != -1
+
+
+def test_external_edit_is_picked_up():
+    service, loader, repository = _cached()
+    service.load_config()
+
+    loader.current_model = "small.en"
+    repository.version = (2, 100)
+
+    assert service.load_config().current_model == "small.en"
+    assert loader.loads == 2
+
+
+def test_save_invalidates_even_within_one_mtime_tick():
+    service, loader, _ = _cached()
+    service.load_config()
+
+    # Same (mtime_ns, size): only the CONFIG_SAVED invalidation can tell.
+    loader.current_model = "tiny.en"
+    service.invalidate()
+
+    assert service.load_config().current_model == "tiny.en"
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from src.event_management.event_messenger import EventMessenger
+from src.event_management.event_payloads import ConfigSaved, ModelDownloadProgress
+from src.event_management.events import Event
+
+
+def _progress(downloaded: int) -> ModelDownloadProgress:
+    return ModelDownloadProgress(
+        model_name="base.en", state="downloading", downloaded_bytes=downloaded
+    )
+
+
+def test_emit_does_not_wait_for_a_slow_handler():
+    messenger = EventMessenger()
+    release = threading.Event()
+    received = []
+    messenger.subscribe(
+        Event.MODEL_DOWNLOAD_PROGRESS,
+        lambda payload: (release.wait(5), received.append(payload.downloaded_bytes)),
+    )
+
+    started_at = time.monotonic()
+    for downloaded in range(3):
+        messenger.emit(Event.MODEL_DOWNLOAD_PROGRESS, _progress(downloaded))
+    assert time.monotonic() - started_at < 0.5
+
+    release.set()
+    assert messenger.wait_until_idle(timeout=5)
+    assert received == [0, 1, 2]
+
+
+def test_full_queue_drops_the_oldest_events():
+    messenger = EventMessenger()
+    release = threading.Event()
+    received = []
+    messenger.subscribe(
+        Event.MODEL_DOWNLOAD_PROGRESS,
+        lambda payload: (release.wait(5), received.append(payload.downloaded_bytes)),
+        queue_size=2,
+        name="slow",
+    )
+
+    messenger.emit(Event.MODEL_DOWNLOAD_PROGRESS, _progress(0))
+    # Wait until the dispatcher holds event 0, so only the queue fills up.
+    deadline = time.monotonic() + 5
+    while messenger.queue_depths()["slow"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    for downloaded in range(1, 6):
+        messenger.emit(Event.MODEL_DOWNLOAD_PROGRESS, _progress(downloaded))
+
+    release.set()
+    assert messenger.wait_until_idle(timeout=5)
+    assert received == [0, 4, 5]
+
+
+def test_debounce_collapses_a_burst_into_one_call():
+    messenger = EventMessenger()
+    calls = []
+    messenger.subscribe(Event.CONFIG_SAVED, calls.append, debounce_seconds=0.05)
+
+    for _ in range(10):
+        messenger.emit(Event.CONFIG_SAVED, ConfigSaved())
+
+    assert messenger.wait_until_idle(timeout=5)
+    assert len(calls) == 1
+
+
+def test_handler_errors_do_not_stop_delivery(capsys):
+    messenger = EventMessenger()
+    received = []
+
+    def handler(payload):
+        if payload.downloaded_bytes == 0:
+            raise ValueError("boom")
+        received.append(payload.downloaded_bytes)
+
+    messenger.subscribe(Event.MODEL_DOWNLOAD_PROGRESS, handler, name="flaky")
+    messenger.emit(Event.MODEL_DOWNLOAD_PROGRESS, _progress(0))
+    messenger.emit(Event.MODEL_DOWNLOAD_PROGRESS, _progress(1))
+
+    assert messenger.wait_until_idle(timeout=5)
+    assert received == [1]
+    assert "handler flaky: boom" in capsys.readouterr().out
+
+
+def test_payload_type_is_checked_at_emit():
+    messenger = EventMessenger()
+
+    with pytest.raises(TypeError):
+        messenger.emit(Event.CONFIG_SAVED, _progress(0))
@@ -0,0 +1,64 @@
+import pytest
+
+from src.server.history.entity.transcript_entry import TranscriptEntry
+from src.server.history.repository.history_repository import HistoryRepositoryImpl
+from src.server.history.service.history_service import HistoryServiceImpl
+
+
+def _service(tmp_path, count: int) -> HistoryServiceImpl:
+    repository = HistoryRepositoryImpl(tmp_path / "history.sqlite3")
+    repository.insert_many(
+        TranscriptEntry(text=f"note {index} alpha", created_at=float(index))
+        for index in range(count)
+    )
+    return HistoryServiceImpl(repository)
+
+
+def test_pages_walk_back_without_gaps_or_repeats(tmp_path):
+    service = _service(tmp_path, 7)
+
+    seen = []
+    before_id = None
+    while True:
+        page = service.list_history(limit=3, before_id=before_id)
+        seen.extend(entry.id for entry in page.entries)
+        if page.next_before_id is None:
+            break
+        before_id = page.next_before_id
+
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+
+def test_before_id_zero_is_an_empty_page(tmp_path):
+    service = _service(tmp_path, 3)
+
+    assert service.list_history(limit=10, before_id=0).entries == []
+    assert service.search_history("alpha", limit=10, before_id=0).entries == []
+    assert len(service.list_history(limit=10).entries) == 3
+
+
+def test_search_pages_by_rowid(tmp_path):
+    service = _service(tmp_path, 5)
+
+    first = service.search_history("alpha", limit=2)
+    second = service.search_history("alpha", limit=2, before_id=first.next_before_id)
+
+    assert [entry.id for entry in first.entries] == [5, 4]
+    assert [entry.id for entry in second.entries] == [3, 2]
+
+
+def test_non_positive_limit_is_rejected(tmp_path):
+    pytest.importorskip("flask")
+    from src.server.app import FlaskServices, create_flask_app_with
+
+    app = create_flask_app_with(
+        FlaskServices(None, None, None, None, history_service=_service(tmp_path, 2))
+    )
+    client = app.test_client()
+
+    for limit in ("0", "-5", "ten"):
+        assert client.get(f"/api/history?limit={limit}").status_code == 400
+        assert client.get(f"/api/history/search?q=alpha&limit={limit}").status_code == 400
+    response = client.get("/api/history?limit=1&before_id=0")
+    assert response.status_code == 200
+    assert response.get_json()["items"] == []
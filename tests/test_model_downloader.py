@@ -0,0 +1,94 @@
+import hashlib
+import os
+import threading
+
+import pytest
+
+from benchmarks.download_standin import StandInServer
+from src.core.transcription.model_downloader import (
+    ChecksumMismatchError,
+    DownloadCancelledError,
+    DownloadError,
+    ResumableDownloader,
+)
+
+PAYLOAD_BYTES = 1024 * 1024
+# Three of the stand-in's 64 KiB writes: never the last write of any of the
+# four 256 KiB segments, so the drop always leaves one of them short.
+DROP_AFTER_BYTES = 3 * StandInServer.WRITE_CHUNK_BYTES
+
+
+@pytest.fixture
+def payload() -> bytes:
+    return os.urandom(PAYLOAD_BYTES)
+
+
+def _downloader(server: StandInServer, tmp_path, segments: int) -> ResumableDownloader:
+    downloader = ResumableDownloader(
+        base_url=server.base_url, cache_dir=tmp_path, segments=segments
+    )
+    # Surface the dropped connection so the test can resume explicitly.
+    downloader.RETRIES = 0
+    downloader.MIN_SEGMENT_BYTES = 64 * 1024
+    return downloader
+
+
+@pytest.mark.parametrize("segments", [1, 4])
+def test_interrupted_download_resumes_and_verifies(payload, tmp_path, segments):
+    destination = tmp_path / "standin.pt"
+    with StandInServer(payload, drop_after_bytes=DROP_AFTER_BYTES) as server:
+        downloader = _downloader(server, tmp_path, segments)
+
+        with pytest.raises(DownloadError):
+            downloader.fetch(server.url, destination, server.sha256)
+        assert not destination.exists()
+        assert (tmp_path / "standin.pt.part").exists()
+        served_before_resume = server.bytes_served
+
+        progress = []
+        downloader.fetch(
+            server.url,
+            destination,
+            server.sha256,
+            lambda downloaded, total: progress.append((downloaded, total)),
+        )
+
+    assert hashlib.sha256(destination.read_bytes()).hexdigest() == server.sha256
+    assert not (tmp_path / "standin.pt.part").exists()
+    assert not (tmp_path / "standin.pt.part.json").exists()
+    assert progress[-1] == (PAYLOAD_BYTES, PAYLOAD_BYTES)
+    # The resumed fetch asks only for what the first attempt did not keep.
+    assert server.bytes_served - served_before_resume < PAYLOAD_BYTES
+
+
+def test_checksum_mismatch_discards_the_partial_file(payload, tmp_path):
+    destination = tmp_path / "standin.pt"
+    with StandInServer(payload) as server:
+        downloader = _downloader(server, tmp_path, segments=1)
+
+        with pytest.raises(ChecksumMismatchError):
+            downloader.fetch(server.url, destination, "0" * 64)
+
+    assert not destination.exists()
+    assert not (tmp_path / "standin.pt.part").exists()
+
+
+def test_cancelled_download_keeps_its_partial_data(payload, tmp_path):
+    destination = tmp_path / "standin.pt"
+    cancel_event = threading.Event()
+
+    def cancel_half_way(downloaded: int, total) -> None:
+        if downloaded >= PAYLOAD_BYTES // 2:
+            cancel_event.set()
+
+    with StandInServer(payload) as server:
+        downloader = _downloader(server, tmp_path, segments=1)
+        with pytest.raises(DownloadCancelledError):
+            downloader.fetch(
+                server.url, destination, server.sha256, cancel_half_way, cancel_event
+            )
+        assert (tmp_path / "standin.pt.part").stat().st_size > 0
+
+        downloader.fetch(server.url, destination, server.sha256)
+
+    assert destination.read_bytes() == payload
@@ -0,0 +1,79 @@
+import types
+
+import pytest
+
+from src.core.transcription import model_memory_tracker
+from src.core.transcription.ai_transcriber import AITranscriberImpl
+from src.core.transcription.model_memory_tracker import ModelMemoryTracker
+
+MB = 1024 * 1024
+MODEL_BYTES = 150 * MB
+
+
+class _FakeProcess:
+    """Resident memory of a process whose unloads can leave bytes behind."""
+
+    def __init__(self, leak_per_unload: int) -> None:
+        self.rss = 500 * MB
+        self.leak_per_unload = leak_per_unload
+
+    def load_model(self, name: str, device: str):
+        self.rss += MODEL_BYTES
+        return types.SimpleNamespace(name=name)
+
+    def get_platform_device(self, model_name: str) -> str:
+        return "cpu"
+
+    def clear_device_cache(self, device: str) -> None:
+        # Called by the transcriber once the model reference is dropped.
+        self.rss -= MODEL_BYTES - self.leak_per_unload
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ModelMemoryTracker, "FOOTPRINTS_PATH", tmp_path / "model_footprints.json"
+    )
+    tracker = ModelMemoryTracker()
+    monkeypatch.setattr(ModelMemoryTracker, "_instance", tracker)
+    monkeypatch.setattr(AITranscriberImpl, "_model", None)
+    monkeypatch.setattr(AITranscriberImpl, "_loaded_model_name", None)
+    monkeypatch.setattr(AITranscriberImpl, "_evicted_model_name", None)
+    return tracker
+
+
+def _reload_cycles(monkeypatch, process: _FakeProcess, cycles: int) -> None:
+    monkeypatch.setattr(model_memory_tracker, "current_rss_bytes", lambda: process.rss)
+    monkeypatch.setattr(
+        AITranscriberImpl,
+        "_lazy_import_whisper",
+        staticmethod(lambda: types.SimpleNamespace(load_model=process.load_model)),
+    )
+    transcriber = AITranscriberImpl("base.en", device_manager=process)
+    for _ in range(cycles):
+        transcriber.load()
+        assert transcriber.evict("stress")
+
+
+def test_released_model_does_not_ratchet(tracker, monkeypatch):
+    _reload_cycles(monkeypatch, _FakeProcess(leak_per_unload=0), cycles=10)
+
+    assert not tracker.is_ratcheting()
+    assert tracker.measured_footprint_bytes("base.en") == MODEL_BYTES
+    assert tracker.footprint("base.en").retained_after_unload_bytes == 0
+
+
+def test_leaking_teardown_ratchets(tracker, monkeypatch, capsys):
+    _reload_cycles(monkeypatch, _FakeProcess(leak_per_unload=40 * MB), cycles=10)
+
+    assert tracker.is_ratcheting()
+    history = tracker.unload_rss_history()
+    assert len(history) == 10
+    assert history == sorted(history)
+    assert "[WARNING] Resident memory keeps growing" in capsys.readouterr().out
+
+
+def test_small_allocator_noise_is_not_a_ratchet(tracker, monkeypatch):
+    _reload_cycles(monkeypatch, _FakeProcess(leak_per_unload=MB), cycles=10)
+
+    assert not tracker.is_ratcheting()
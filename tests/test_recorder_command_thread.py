@@ -0,0 +1,119 @@
+import threading
+import time
+
+from src.core.hot_key.recorder_command_thread import RecorderCommandThread
+
+DEBOUNCE_SECONDS = 0.2
+
+
+class _RecordingActions:
+    """Stands in for HotKeyActions and records which calls ran on which thread."""
+
+    def __init__(self, fail_on_press: bool = False) -> None:
+        self.calls = []
+        self.threads = set()
+        self._fail_on_press = fail_on_press
+
+    def on_press(self) -> None:
+        self._record("press")
+        if self._fail_on_press:
+            self._fail_on_press = False
+            raise RuntimeError("ffmpeg did not start")
+
+    def on_release(self) -> None:
+        self._record("release")
+
+    def cancel(self) -> None:
+        self._record("cancel")
+
+    def _record(self, name: str) -> None:
+        self.calls.append(name)
+        self.threads.add(threading.current_thread().name)
+
+
+def _started(actions: _RecordingActions) -> RecorderCommandThread:
+    commands = RecorderCommandThread(actions, retrigger_debounce_seconds=DEBOUNCE_SECONDS)
+    commands.start()
+    return commands
+
+
+def test_actions_run_on_the_command_thread():
+    actions = _RecordingActions()
+    commands = _started(actions)
+
+    commands.submit_press()
+    commands.submit_release()
+    commands.stop()
+
+    assert actions.calls == ["press", "release", "cancel"]
+    assert actions.threads == {"RecorderCommandThread"}
+
+
+def test_submit_never_blocks_on_a_slow_action():
+    release_action = threading.Event()
+    actions = _RecordingActions()
+    actions.on_press = lambda: release_action.wait(5)
+    commands = _started(actions)
+
+    started_at = time.monotonic()
+    for _ in range(50):
+        commands.submit_press()
+        commands.submit_release()
+    assert time.monotonic() - started_at < 0.1
+    release_action.set()
+    commands.stop()
+
+
+def test_auto_repeat_presses_are_ignored():
+    actions = _RecordingActions()
+    commands = _started(actions)
+
+    for _ in range(5):
+        commands.submit_press()
+    commands.submit_release()
+    commands.stop()
+
+    assert actions.calls == ["press", "release", "cancel"]
+
+
+def test_release_followed_by_a_quick_press_keeps_recording():
+    actions = _RecordingActions()
+    commands = _started(actions)
+
+    commands.submit_press()
+    commands.submit_release()
+    commands.submit_press()
+    time.sleep(DEBOUNCE_SECONDS * 2)
+    assert actions.calls == ["press"]
+
+    commands.submit_release()
+    commands.stop()
+    assert actions.calls == ["press", "release", "cancel"]
+
+
+def test_press_after_the_window_starts_a_new_recording():
+    actions = _RecordingActions()
+    commands = _started(actions)
+
+    commands.submit_press()
+    commands.submit_release()
+    time.sleep(DEBOUNCE_SECONDS * 2)
+    commands.submit_press()
+    commands.submit_release()
+    commands.stop()
+
+    assert actions.calls == ["press", "release", "press", "release", "cancel"]
+
+
+def test_a_failing_action_does_not_stop_the_thread(capsys):
+    actions = _RecordingActions(fail_on_press=True)
+    commands = _started(actions)
+
+    commands.submit_press()
+    commands.submit_release()
+    time.sleep(DEBOUNCE_SECONDS * 2)
+    commands.submit_press()
+    commands.stop()
+
+    assert actions.calls == ["press", "release", "press", "cancel"]
+    assert "[WARNING] Hotkey press failed" in capsys.readouterr().out
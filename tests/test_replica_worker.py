@@ -0,0 +1,91 @@
+import threading
+from multiprocessing import Pipe
+
+import pytest
+
+from src.core.transcription.replica_worker import (
+    ERROR,
+    OK,
+    READY,
+    _load_shared_model,
+    run_replica,
+)
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("whisper")
+
+
+def _write_tiny_checkpoint(path) -> None:
+    from whisper.model import ModelDimensions, Whisper  # type: ignore
+
+    # Smallest model whisper can still decode with: the audio context must
+    # fit 30 s of mel frames and the vocabulary the multilingual tokenizer.
+    dims = ModelDimensions(
+        n_mels=80,
+        n_audio_ctx=1500,
+        n_audio_state=8,
+        n_audio_head=1,
+        n_audio_layer=1,
+        n_vocab=51865,
+        n_text_ctx=16,
+        n_text_state=8,
+        n_text_head=1,
+        n_text_layer=1,
+    )
+    model = Whisper(dims)
+    torch.save(
+        {"dims": dims.__dict__, "model_state_dict": model.state_dict()}, str(path)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _meta_construction(monkeypatch):
+    """Let Whisper be built on the meta device even where sparse meta tensors
+    are unsupported, so the meta loading path runs on every torch build."""
+    to_sparse = torch.Tensor.to_sparse
+
+    def meta_safe_to_sparse(tensor, *args, **kwargs):
+        return tensor if tensor.is_meta else to_sparse(tensor, *args, **kwargs)
+
+    monkeypatch.setattr(torch.Tensor, "to_sparse", meta_safe_to_sparse)
+
+
+def test_shared_model_has_no_tensors_left_on_meta(tmp_path):
+    weights = tmp_path / "tiny-test.pt"
+    _write_tiny_checkpoint(weights)
+
+    model = _load_shared_model(torch, str(weights), "tiny-test")
+
+    assert not model.decoder.mask.is_meta
+    assert not model.alignment_heads.is_meta
+
+
+def test_replica_decodes_a_short_clip(tmp_path, monkeypatch):
+    from whisper.model import MultiHeadAttention  # type: ignore
+
+    # The explicit attention path is the one that reads the decoder mask.
+    monkeypatch.setattr(MultiHeadAttention, "use_sdpa", False)
+    weights = tmp_path / "tiny-test.pt"
+    _write_tiny_checkpoint(weights)
+    parent, child = Pipe()
+    worker = threading.Thread(
+        target=run_replica,
+        args=(child, str(weights), "tiny-test", 1, {"temperature": 0.0}),
+        daemon=True,
+    )
+    worker.start()
+
+    assert parent.poll(60)
+    _, status, payload = parent.recv()
+    assert status == READY, payload
+
+    clip = torch.zeros(16000).numpy()
+    parent.send(("smoke", clip))
+    assert parent.poll(120)
+    request_id, status, result = parent.recv()
+    assert request_id == "smoke"
+    assert status != ERROR, result
+    assert status == OK and "text" in result
+
+    parent.send(None)
+    worker.join(10)
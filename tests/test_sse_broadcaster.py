@@ -0,0 +1,61 @@
+import threading
+
+from src.server.events.sse_broadcaster import SseBroadcaster
+
+
+def _event_ids(client):
+    ids = []
+    while True:
+        message = client.next_message(timeout=0)
+        if message is None:
+            return ids
+        ids.append(int(message.split("\n", 1)[0].removeprefix("id: ")))
+
+
+def test_slow_client_loses_its_oldest_messages_without_blocking():
+    broadcaster = SseBroadcaster(client_buffer=3)
+    slow = broadcaster.register()
+    publishing = threading.Thread(
+        target=lambda: [broadcaster.publish("tick", index) for index in range(10)]
+    )
+    publishing.start()
+    publishing.join(timeout=5)
+
+    assert not publishing.is_alive()
+    assert slow.dropped == 7
+    assert _event_ids(slow) == [8, 9, 10]
+
+
+def test_clients_are_buffered_independently():
+    broadcaster = SseBroadcaster(client_buffer=2)
+    reader = broadcaster.register()
+    idle = broadcaster.register()
+
+    for index in range(3):
+        broadcaster.publish("tick", index)
+        assert reader.next_message(timeout=0) is not None
+
+    assert reader.dropped == 0
+    assert idle.dropped == 1
+
+
+def test_reconnect_replays_missed_messages():
+    broadcaster = SseBroadcaster()
+    for index in range(5):
+        broadcaster.publish("tick", index)
+
+    assert _event_ids(broadcaster.register(last_event_id="3")) == [4, 5]
+    assert _event_ids(broadcaster.register(last_event_id="bogus")) == []
+
+
+def test_client_limit_and_unregister_on_disconnect():
+    broadcaster = SseBroadcaster(max_clients=1)
+    client = broadcaster.register()
+    assert broadcaster.register() is None
+
+    body = broadcaster.stream(client)
+    assert next(body).startswith("retry:")
+    body.close()
+
+    assert broadcaster.client_count() == 0
+    assert broadcaster.register() is not None
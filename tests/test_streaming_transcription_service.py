@@ -0,0 +1,49 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.server.exception.transcription_overloaded_exception import (
+    TranscriptionOverloadedException,
+)
+from src.server.transcription.service.streaming_transcription_service import (
+    StreamingTranscriptionServiceImpl,
+)
+
+
+class _RecordingOrchestrator:
+    def __init__(self) -> None:
+        self.threads = []
+
+    def transcribe_samples(self, samples):
+        self.threads.append(threading.current_thread().name)
+        return {"text": "hello", "language": "en"}
+
+
+def _speech(seconds: float) -> bytes:
+    samples = np.full(int(16000 * seconds), 8000, dtype="<i2")
+    return samples.tobytes()
+
+
+def test_sessions_are_capped():
+    service = StreamingTranscriptionServiceImpl(_RecordingOrchestrator, max_sessions=1)
+    session = service.open_session()
+    with pytest.raises(TranscriptionOverloadedException) as rejected:
+        service.open_session()
+    assert rejected.value.reason == "session_limit"
+    service.close_session(session)
+    service.close_session(service.open_session())
+
+
+def test_stream_inference_runs_off_the_shared_executor():
+    orchestrator = _RecordingOrchestrator()
+    service = StreamingTranscriptionServiceImpl(lambda: orchestrator, max_sessions=2)
+    session = service.open_session()
+
+    session.feed(_speech(0.5))
+    hypotheses = session.finish(timeout=5)
+
+    assert [hypothesis.text for hypothesis in hypotheses] == ["hello"]
+    assert orchestrator.threads
+    assert all(name.startswith("StreamInference") for name in orchestrator.threads)
+    service.close_session(session)
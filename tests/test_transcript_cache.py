@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from src.core.transcription.ai_transcriber import DECODE_OPTIONS
+from src.core.transcription.caching_ai_transcriber import CachingAITranscriber
+from src.core.transcription.transcript_cache import TranscriptCache
+
+
+def _pcm(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal(1600).astype(np.float32)
+
+
+def _key(pcm, model_name="base.en", precision="fp32", options=DECODE_OPTIONS) -> str:
+    return TranscriptCache.key_for(pcm, model_name, precision, options)
+
+
+def test_key_depends_on_audio_and_every_setting():
+    pcm = _pcm(0)
+    key = _key(pcm)
+
+    assert _key(pcm.copy()) == key
+    assert _key(_pcm(1)) != key
+    assert _key(pcm, model_name="small.en") != key
+    assert _key(pcm, precision="fp16") != key
+    assert _key(pcm, options={**DECODE_OPTIONS, "task": "translate"}) != key
+    # Option order does not matter, only the values.
+    assert _key(pcm, options=dict(reversed(list(DECODE_OPTIONS.items())))) == key
+
+
+def test_memory_tier_is_lru(tmp_path):
+    cache = TranscriptCache(tmp_path, memory_entries=2, max_disk_bytes=0)
+    cache.put("a", {"text": "a"})
+    cache.put("b", {"text": "b"})
+    assert cache.get("a") == {"text": "a"}
+    cache.put("c", {"text": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "a"}
+    assert cache.get("c") == {"text": "c"}
+
+
+def test_hits_are_copies(tmp_path):
+    cache = TranscriptCache(tmp_path, max_disk_bytes=0)
+    cache.put("a", {"text": "a", "segments": []})
+
+    cache.get("a")["segments"].append("mutated")
+
+    assert cache.get("a") == {"text": "a", "segments": []}
+
+
+def test_disk_tier_survives_a_restart_and_evicts_least_recent(tmp_path):
+    entry_bytes = len(b'{"text": "xxxxxxxxxx"}')
+    cache = TranscriptCache(tmp_path, memory_entries=0, max_disk_bytes=entry_bytes * 2)
+    cache.put("aa01", {"text": "xxxxxxxxxx"})
+    cache.put("bb02", {"text": "xxxxxxxxxx"})
+    assert cache.get("aa01") is not None
+    cache.put("cc03", {"text": "xxxxxxxxxx"})
+
+    restarted = TranscriptCache(tmp_path, memory_entries=0, max_disk_bytes=entry_bytes * 2)
+    assert restarted.get("bb02") is None
+    assert restarted.get("aa01") == {"text": "xxxxxxxxxx"}
+    assert restarted.get("cc03") == {"text": "xxxxxxxxxx"}
+
+
+def test_unreadable_disk_entry_is_a_miss(tmp_path):
+    cache = TranscriptCache(tmp_path, memory_entries=0)
+    cache.put("dd04", {"text": "ok"})
+    (tmp_path / "dd" / "dd04.json").write_text("{not json", encoding="utf-8")
+
+    assert TranscriptCache(tmp_path, memory_entries=0).get("dd04") is None
+    assert not (tmp_path / "dd" / "dd04.json").exists()
+
+
+class _CountingTranscriber:
+    model_name = "base.en"
+    precision = "fp32"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe_samples(self, samples):
+        self.calls += 1
+        return {"text": f"call {self.calls}", "language": "en"}
+
+
+def test_repeated_audio_is_transcribed_once(tmp_path, monkeypatch):
+    pytest.importorskip("whisper")
+    import whisper.audio  # type: ignore
+
+    monkeypatch.setattr(whisper.audio, "load_audio", lambda path: _pcm(7))
+    transcriber = _CountingTranscriber()
+    caching = CachingAITranscriber(transcriber, TranscriptCache(tmp_path))
+
+    first = caching.transcribe(tmp_path / "clip.wav")
+    second = caching.transcribe(tmp_path / "retry.wav")
+
+    assert first == second == {"text": "call 1", "language": "en"}
+    assert transcriber.calls == 1
+    # Streaming windows are never cached.
+    caching.transcribe_samples(_pcm(7))
+    caching.transcribe_samples(_pcm(7))
+    assert transcriber.calls == 3
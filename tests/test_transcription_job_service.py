@@ -0,0 +1,108 @@
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from src.event_management.event_payloads import TranscriptionCompleted
+from src.server.exception.transcription_overloaded_exception import (
+    TranscriptionOverloadedException,
+)
+from src.server.transcription.entity.transcription_job import COMPLETED, RUNNING
+from src.server.transcription.service.transcription_job_service import (
+    TranscriptionJobServiceImpl,
+)
+
+
+class _BlockingOrchestrator:
+    """Completes each submitted job only once ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def submit_transcription(self, path: Path) -> Future:
+        self.started.release()
+        future: Future = Future()
+
+        def complete() -> None:
+            self.release.wait(5)
+            future.set_result(
+                TranscriptionCompleted(transcription_id="t", text=path.name)
+            )
+
+        threading.Thread(target=complete, daemon=True).start()
+        return future
+
+
+class _NoCleanup:
+    def delete_file(self, path: Path) -> None:
+        pass
+
+
+def _service(orchestrator, **kwargs) -> TranscriptionJobServiceImpl:
+    return TranscriptionJobServiceImpl(
+        lambda: orchestrator, cleanup_service=_NoCleanup(), **kwargs
+    )
+
+
+def _wait_for_state(service, job_id: str, state: str) -> None:
+    deadline = time.monotonic() + 5
+    while service.get_job(job_id).state != state:
+        assert time.monotonic() < deadline, f"job never reached {state}"
+        time.sleep(0.01)
+
+
+def test_full_queue_is_rejected_with_retry_hint():
+    orchestrator = _BlockingOrchestrator()
+    service = _service(orchestrator, max_queued_jobs=1, wait_slo_seconds=3600)
+
+    running = service.submit(Path("first.wav"))
+    assert orchestrator.started.acquire(timeout=5)
+    _wait_for_state(service, running.job_id, RUNNING)
+    queued = service.submit(Path("second.wav"))
+
+    with pytest.raises(TranscriptionOverloadedException) as rejected:
+        service.submit(Path("third.wav"))
+    assert rejected.value.reason == "queue_full"
+    assert rejected.value.retry_after_seconds >= 1
+
+    orchestrator.release.set()
+    assert service.wait(queued.job_id, timeout=5).state == COMPLETED
+    assert service.get_job(running.job_id).text == "first.wav"
+
+
+def test_estimated_wait_over_slo_is_rejected_before_the_upload():
+    orchestrator = _BlockingOrchestrator()
+    # Until a job is measured each one is assumed to take 5 s.
+    service = _service(orchestrator, max_queued_jobs=8, wait_slo_seconds=6)
+
+    running = service.submit(Path("first.wav"))
+    assert orchestrator.started.acquire(timeout=5)
+    _wait_for_state(service, running.job_id, RUNNING)
+    service.check_admission()
+    service.submit(Path("second.wav"))
+
+    with pytest.raises(TranscriptionOverloadedException) as rejected:
+        service.check_admission()
+    assert rejected.value.reason == "slo"
+    orchestrator.release.set()
+
+
+def test_concurrency_shares_the_estimated_wait():
+    orchestrator = _BlockingOrchestrator()
+    service = _service(
+        orchestrator, max_queued_jobs=8, wait_slo_seconds=6, concurrency=2
+    )
+
+    for name in ("a.wav", "b.wav"):
+        service.submit(Path(name))
+    for _ in range(2):
+        assert orchestrator.started.acquire(timeout=5)
+    # Two running jobs on two dispatchers leave room for one queued job
+    # (10 s of work / 2), which a single dispatcher would have refused.
+    service.submit(Path("c.wav"))
+    with pytest.raises(TranscriptionOverloadedException):
+        service.check_admission()
+    orchestrator.release.set()